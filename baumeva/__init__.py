@@ -3,10 +3,14 @@
 # version
 __version__ = '0.7.0'
 
+from .base_ga import BaseGA
 from .collector_ga import CollectorGA
 from .combinatory_ga import CombinatoryGA
 from .binary_ga import BinaryGA
 from .vega import VEGA
 from .ffga import FFGA
 from .global_generator import generator
+from .seed_sequence import SeedSequence
 from .categorical_ga import CategoricalGA
+from .island_ga import IslandGA
+from .batch_runner import BatchRunner
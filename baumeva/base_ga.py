@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Iterator, Union
+from .ga import GaData, GaEngine, GaSnapshot, GaCheckpoint, BaseCache, BaseSink, AsyncEvaluator
+from .seed_sequence import SeedSequence
+
+
+class BaseGA(ABC):
+    """
+    Abstract class for GA runners. Run can be performed at once with optimize() or generation by generation with
+    iterate() and step(). State of run is stored in ga_data, so iteration can be stopped and resumed later.
+    Options of run which are common for all runners (parallel and cached evaluation, storage of population, history)
+    are handled here, runners get them as keyword arguments (**engine_options).
+    ga_data: GaData of the current run, is created by init_ga_data().
+    engine: GaEngine performing generation loop.
+    is_packed_supported: True for runners with binary genotypes, which can be packed into integers.
+    """
+    ga_data: GaData = None
+    engine: GaEngine = None
+    is_packed_supported: bool = False
+
+    def __init__(self, workers: int = None, executor: Executor = None, cache: BaseCache = None,
+                 is_batch: bool = False, is_array: bool = False, is_packed: bool = False, is_unique: bool = False,
+                 rnd_seed: Union[int, SeedSequence] = None, history_size: int = None, history_step: int = 1,
+                 sink: BaseSink = None, async_evaluator: AsyncEvaluator = None) -> None:
+        """
+        Initialization of common options of run:
+        :param workers: int, default: None. Number of worker processes for parallel calculation of objective function,
+                        objective function have to be defined on module level;
+        :param executor: concurrent.futures.Executor, default: None. Executor for calculation of objective function;
+        :param cache: BaseCache, default: None. Subclass of BaseCache(), stores values of objective function,
+                      example: LRUCache();
+        :param is_batch: bool, default: False. If True objective function is called once for list of all genotypes
+                         and have to return list of values;
+        :param is_array: bool, default: False. If True population is stored in numpy arrays instead of list of dicts,
+                         reduces memory for large populations, numpy have to be installed;
+        :param is_packed: bool, default: False. If True binary genotypes are packed into integers, crossover and
+                          mutation work with bit masks, can not be used with is_array (BinaryGA, VEGA and FFGA only);
+        :param is_unique: bool, default: False. If True duplicates of the first generation are replaced by random
+                          individuals, offspring with duplicate genotypes are rejected and replaced by parents or new
+                          random individuals, so generations have no duplicate genotypes while search space has
+                          enough different genotypes;
+        :param rnd_seed: int | SeedSequence, default: None. Random seed of run, population and operators get own
+                         random generators from it. If None generator.rnd_seed is used;
+        :param history_size: int, default: None. Number of the last generations stored in history of GaData,
+                             if None all generations are stored;
+        :param history_step: int, default: 1. Every history_step-th generation is stored in history of GaData;
+        :param sink: BaseSink, default: None. Subclass of BaseSink(), gets row of history of every generation,
+                     example: CsvSink('history.csv');
+        :param async_evaluator: AsyncEvaluator, default: None. Limit of simultaneous calls, timeout and retries for
+                                async objective function (async def), AsyncEvaluator() is used by default;
+        :return None
+        """
+        if is_packed and not self.is_packed_supported:
+            raise Exception(f'{type(self).__name__} has no binary genotypes, is_packed can not be used')
+        if is_packed and is_array:
+            raise Exception(f'Packed genotypes can not be stored in array population, use is_packed or is_array')
+        self.workers = workers
+        self.executor = executor
+        self.cache = cache
+        self.is_batch = is_batch
+        self.is_array = is_array
+        self.is_packed = is_packed
+        self.is_unique = is_unique
+        self.rnd_seed = rnd_seed
+        self.history_size = history_size
+        self.history_step = history_step
+        self.sink = sink
+        self.async_evaluator = async_evaluator
+        self.engine = GaEngine()
+
+    def get_history_options(self) -> dict:
+        """
+        Get options of history for GaData of new run.
+
+        :return: dict of keyword arguments: history_size, history_step, sink.
+        """
+        return {'history_size': self.history_size, 'history_step': self.history_step, 'sink': self.sink}
+
+    def get_fitness_options(self) -> dict:
+        """
+        Get options of evaluation for fitness of new run.
+
+        :return: dict of keyword arguments: workers, executor, cache, is_batch, async_evaluator.
+        """
+        return {'workers': self.workers, 'executor': self.executor, 'cache': self.cache, 'is_batch': self.is_batch,
+                'async_evaluator': self.async_evaluator}
+
+    @abstractmethod
+    def init_ga_data(self) -> GaData:
+        """
+        Start new run: create GaData with filled population and set operators of engine (see init_operators()).
+
+        :return: GaData of new run.
+        """
+        pass
+
+    @abstractmethod
+    def init_operators(self) -> None:
+        """
+        Create operators of generation loop and set them to engine, without population and GaData.
+
+        :return: None
+        """
+        pass
+
+    def get_ga_data(self) -> GaData:
+        """
+        Get GaData of the current run, new run is started if there is no run.
+
+        :return: GaData
+        """
+        if self.ga_data is None:
+            self.init_ga_data()
+        return self.ga_data
+
+    def load_checkpoint(self, file_path: str) -> GaData:
+        """
+        Resume run from checkpoint file saved by GaCheckpoint: operators are created by init_operators(), their states
+        and GaData are loaded from file.
+
+        :param file_path: path to checkpoint file.
+        :return: GaData of resumed run.
+        """
+        self.init_operators()
+        self.ga_data = GaCheckpoint.load(file_path, self.engine)
+        return self.ga_data
+
+    def iterate(self, max_time: float = None, max_evaluations: int = None) -> Iterator[GaSnapshot]:
+        """
+        Perform the current run generation by generation, GaSnapshot is yielded after every generation (see
+        GaEngine.iterate()). Next call resumes run from the last performed generation, init_ga_data() starts new run.
+
+        :param max_time: limit of wall time of this iteration in seconds.
+        :param max_evaluations: limit of number of objective function calls of run.
+        :return: iterator of GaSnapshot.
+        """
+        return self.engine.iterate(self.get_ga_data(), max_time=max_time, max_evaluations=max_evaluations)
+
+    def step(self) -> Union[GaSnapshot, None]:
+        """
+        Perform one generation of the current run. Process pool of fitness is kept between steps, it is closed by
+        iterate(), optimize() or engine.fitness.shutdown().
+
+        :return: GaSnapshot of performed generation or None if run is finished.
+        """
+        return self.engine.next_generation(self.get_ga_data())
+
+    def cancel(self) -> None:
+        """
+        Stop iterate() before next generation, can be called from hook of engine or other thread.
+
+        :return: None
+        """
+        self.engine.cancel()
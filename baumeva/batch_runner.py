@@ -0,0 +1,163 @@
+import csv
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from itertools import product
+from time import perf_counter
+from typing import List, Type, Optional, Iterator
+from .global_generator import generator
+
+
+def run_config(ga_class: Type, params: dict, rnd_seed: Optional[int]) -> dict:
+    """
+    Perform one run of GA. Defined on module level, so it can be sent to worker processes. Random seed is passed
+    to GA as parameter, so runs in threads of one process do not share random state.
+
+    :param ga_class: class of GA with optimize() method and rnd_seed parameter, example: BinaryGA.
+    :param params: parameters of GA.
+    :param rnd_seed: random seed of run.
+    :return: row of results: best score, index of the last generation, number of objective function calls and time.
+    """
+    start = perf_counter()
+    ga_data = ga_class(rnd_seed=rnd_seed, **params).optimize()
+    best_solution = ga_data.best_solution
+    return {'best_score': best_solution.get('score'),
+            'best_obj_score': best_solution.get('obj_score'),
+            'best_generation': best_solution.get('idx_generation'),
+            'num_generations': ga_data.idx_generation,
+            'obj_calls': ga_data.obj_calls,
+            'time': perf_counter() - start}
+
+
+class BatchRunner:
+    """
+    Class for performing many runs of GA with different configurations and random seeds over process pool.
+    results: list of rows of results in order of runs after run().
+    """
+    results: List[dict] = None
+
+    def __init__(self,
+                 ga_class: Type,
+                 params: dict,
+                 configs: List[dict] = None,
+                 grid: dict = None,
+                 seeds: List[Optional[int]] = None,
+                 workers: int = None,
+                 executor: Executor = None,
+                 is_parallel: bool = True) -> None:
+        """
+        Initialization BatchRunner with next parameters:
+        :param ga_class: class of GA with rnd_seed parameter and optimize() method which returns GaData,
+                         example: BinaryGA;
+        :param params: dict, common parameters of GA, objective function have to be defined on module level;
+        :param configs: list of dicts, default: None. Parameters which differ between configurations;
+        :param grid: dict of lists, default: None. Every combination of values is a configuration, it is added
+                     to configs. Example: {'mutation_lvl': ['weak', 'normal'], 'tournament_size': [3, 5]};
+        :param seeds: list, default: None. Every configuration is performed with every random seed, if None
+                      generator.rnd_seed is used;
+        :param workers: int, default: None. Number of worker processes, if None number of processors is used;
+        :param executor: concurrent.futures.Executor, default: None. Executor for runs instead of own process pool;
+        :param is_parallel: bool, default: True. If False runs are performed one by one in current process;
+        """
+        self.ga_class = ga_class
+        self.params = params
+        self.configs = list(configs) if configs is not None else []
+        if grid is not None:
+            keys = list(grid.keys())
+            self.configs += [dict(zip(keys, values)) for values in product(*grid.values())]
+        if not self.configs:
+            self.configs = [{}]
+        self.seeds = list(seeds) if seeds is not None else [generator.rnd_seed]
+        self.workers = workers
+        self.executor = executor
+        self.is_parallel = is_parallel
+
+    def get_runs(self) -> List[tuple]:
+        """
+        Get runs: every configuration with every seed.
+
+        :return: list of (idx_run, config, rnd_seed).
+        """
+        return [(idx_run, config, rnd_seed)
+                for idx_run, (config, rnd_seed) in enumerate(product(self.configs, self.seeds))]
+
+    def get_params(self, config: dict) -> dict:
+        """
+        Get parameters of GA for configuration, best solution is not printed by default.
+
+        :param config: parameters which differ between configurations.
+        :return: parameters of GA.
+        """
+        params = {'is_print': False}
+        params.update(self.params)
+        params.update(config)
+        return params
+
+    @staticmethod
+    def get_row(idx_run: int, config: dict, rnd_seed: Optional[int], result: dict) -> dict:
+        """
+        Get row of results table.
+
+        :param idx_run: index of run.
+        :param config: parameters which differ between configurations.
+        :param rnd_seed: random seed of run.
+        :param result: results of run.
+        :return: row of results.
+        """
+        row = {'idx_run': idx_run}
+        row.update(config)
+        row['rnd_seed'] = rnd_seed
+        row.update(result)
+        return row
+
+    def iter_results(self) -> Iterator[dict]:
+        """
+        Perform runs and yield rows of results as every run finishes. Runs are submitted to pool one by one,
+        so free workers take next run.
+
+        :return: iterator of rows of results.
+        """
+        runs = self.get_runs()
+        if not self.is_parallel:
+            for idx_run, config, rnd_seed in runs:
+                yield self.get_row(idx_run, config, rnd_seed,
+                                   run_config(self.ga_class, self.get_params(config), rnd_seed))
+            return
+
+        executor = self.executor if self.executor is not None else ProcessPoolExecutor(max_workers=self.workers)
+        futures = {}
+        try:
+            futures = {executor.submit(run_config, self.ga_class, self.get_params(config), rnd_seed):
+                       (idx_run, config, rnd_seed) for idx_run, config, rnd_seed in runs}
+            for future in as_completed(futures):
+                idx_run, config, rnd_seed = futures[future]
+                yield self.get_row(idx_run, config, rnd_seed, future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+            if self.executor is None:
+                executor.shutdown()
+
+    def run(self) -> List[dict]:
+        """
+        Perform all runs.
+
+        :return: list of rows of results in order of runs.
+        """
+        self.results = sorted(self.iter_results(), key=lambda row: row['idx_run'])
+        return self.results
+
+    def save_results(self, file_path: str) -> None:
+        """
+        Save results table to csv file.
+
+        :param file_path: path to csv file.
+        :return: None
+        """
+        if not self.results:
+            raise Exception(f'Results are empty, use run() before saving')
+        columns = []
+        for row in self.results:
+            columns += [column for column in row if column not in columns]
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.results)
@@ -1,12 +1,17 @@
-from typing import List, Type
+from typing import List, Type, Union
 from .ga import (GaData, MultiGaData, BasePopulation, BaseFitness, BaseSelection, BaseCrossover, BaseMutation,
-                 NewGeneration)
+                 NewGeneration, GaEngine, BaseSink)
+from .global_generator import generator
+from .base_ga import BaseGA
+from .seed_sequence import SeedSequence
 
 
-class CollectorGA:
+class CollectorGA(BaseGA):
     """
     Class for collection unique GA.
     ga_data: Class for holding and managing data related to a genetic algorithm run.
+    engine: GaEngine performing generation loop, hooks can be added to it before optimize().
+    Run can be performed generation by generation with iterate() and step() (see BaseGA).
     """
     ga_data: GaData = None
 
@@ -32,6 +37,8 @@ class CollectorGA:
         self.mutation = mutation
         self.new_generation = new_generation
         self.storage = storage
+        self.engine = GaEngine(fitness=fitness, selection=selection, crossover=crossover, mutation=mutation,
+                               new_generation=new_generation)
 
     def set_population(self,
                        population: Type[BasePopulation],
@@ -40,7 +47,11 @@ class CollectorGA:
                        gens: tuple,
                        input_population: List[list] = None,
                        children_percent: float = 0.95,
-                       early_stop: int = 10) -> None:
+                       early_stop: int = 10,
+                       rnd_seed: Union[int, SeedSequence] = None,
+                       history_size: int = None,
+                       history_step: int = 1,
+                       sink: BaseSink = None) -> None:
         """
         Method for definition population.
         :param population: subclass of BasePopulation;
@@ -50,32 +61,49 @@ class CollectorGA:
         :param input_population: list[list], default: None. First generation from user;
         :param children_percent: float, default: 0.95. Percent of children who will be in new generation;
         :param early_stop: int, default: 10. Early stopping criteria, number of generation without improve;
+        :param rnd_seed: int | SeedSequence, default: None. Random seed of run, population and operators get own
+                         random generators from it. If None generator.rnd_seed is used;
+        :param history_size: int, default: None. Number of the last generations stored in history of GaData,
+                             if None all generations are stored;
+        :param history_step: int, default: 1. Every history_step-th generation is stored in history of GaData;
+        :param sink: BaseSink, default: None. Subclass of BaseSink(), gets row of history of every generation,
+                     example: CsvSink('history.csv');
         :return: None.
         """
         self.ga_data = self.storage(num_generations=num_generations, children_percent=children_percent,
-                                    early_stop=early_stop)
+                                    early_stop=early_stop, history_size=history_size, history_step=history_step,
+                                    sink=sink)
         ppl = population()
         ppl.set_params(num_individ=num_individ, gens=gens, input_population=input_population)
+        seeds = generator.get_seed_sequence(rnd_seed).spawn(2)
+        ppl.set_seed(seeds[0])
         ppl.fill()
+        self.engine.set_seed(seeds[1])
         self.ga_data.population = ppl
 
-    def optimize(self) -> None:
+    def init_ga_data(self) -> GaData:
         """
-        Main method of CollectorGA().
-        :return: None.
+        Get GaData of run, population of new run is set by set_population().
+        :return: GaData
         """
-        self.fitness.execute(self.ga_data)
-        self.ga_data.update()
-
-        for i in range(1, self.ga_data.num_generations):
+        if self.ga_data is None:
+            raise Exception(f'Population is not set, call set_population() before optimization')
+        return self.ga_data
 
-            self.selection.execute(self.ga_data)
-            self.crossover.execute(self.ga_data)
-            self.mutation.execute(self.ga_data)
-            self.new_generation.execute(self.ga_data)
-            self.fitness.execute(self.ga_data)
-            self.ga_data.update()
+    def init_operators(self) -> None:
+        """
+        Operators are given to constructor and set to engine there, so resumed run needs no set_population().
+        :return: None
+        """
+        pass
 
-            if self.ga_data.num_generation_no_improve > self.ga_data.early_stop:
-                break
+    def optimize(self, resume_from: str = None) -> None:
+        """
+        Main method of CollectorGA().
+        :param resume_from: str, default: None. Path to checkpoint file (see GaCheckpoint), run is resumed from it;
+        :return: None.
+        """
+        if resume_from is not None:
+            self.load_checkpoint(resume_from)
+        self.engine.optimize(self.ga_data)
         self.ga_data.print_best_solution()
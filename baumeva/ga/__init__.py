@@ -1,12 +1,25 @@
+from .random_component import RandomComponent
 from .ga_data import GaData
 from .multi_ga_data import MultiGaData
 from .new_generation import NewGeneration
 from .multi_new_generation import MultiNewGeneration
 from .penalties import BasePenalty, DynamicPenalty, AdaptivePenalty, StaticPenalty
-from .populations import BasePopulation, CatPopulation, OrderCatPopulation, BinaryPopulation, BinaryGrayPopulation
+from .populations import (BasePopulation, CatPopulation, OrderCatPopulation, BinaryPopulation, BinaryGrayPopulation,
+                          ArrayPopulation, ArrayCatPopulation, ArrayOrderCatPopulation, ArrayBinaryPopulation,
+                          ArrayBinaryGrayPopulation, PackedBinaryPopulation, PackedBinaryGrayPopulation)
+from .caches import BaseCache, LRUCache, SQLiteCache
+from .sinks import BaseSink, CsvSink, JsonlSink, BinarySink
+from .async_evaluator import AsyncEvaluator
 from .fitness import BaseFitness, HyperbolaFitness, VEGAHyperbolaFitness, FFGAFitness
 from .selections import (BaseSelection, TournamentSelection, VEGATournamentSelection, BalancedSelection,
-                         VEGABalancedSelection, RankedSelection, VEGARankedSelection)
-from .crossovers import BaseCrossover, OrderCrossover, OnePointCrossover, TwoPointCrossover, UniformCrossover
+                         VEGABalancedSelection, RankedSelection, VEGARankedSelection, StochasticUniversalSelection)
+from .crossovers import (BaseCrossover, OrderCrossover, PMXCrossover, CycleCrossover, OnePointCrossover,
+                         TwoPointCrossover, UniformCrossover, PackedOnePointCrossover, PackedTwoPointCrossover,
+                         PackedUniformCrossover)
 from .mutations import BaseMutation, BaseCombinatoryMutation, InversionMutation, SwapMutation, MovementMutation,\
-                       ShiftMutation, BinStringMutation, CategoricalMutation
+                       ShiftMutation, BinStringMutation, CategoricalMutation, PackedBinStringMutation
+from .ga_snapshot import GaSnapshot
+from .ga_engine import GaEngine
+from .ga_profiler import GaProfiler
+from .ga_checkpoint import GaCheckpoint
+from .island import Island, island_worker
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple, Type, Union
+
+
+class AsyncEvaluator:
+    """
+    Class for calculation of async objective function (async def) on event loop, for I/O-bound objective functions
+    (requests to simulation server and so on). All genotypes of generation are calculated concurrently, number of
+    simultaneous calls is limited by max_concurrency. Every call is limited by timeout and repeated after failure up
+    to retries times. Values are returned in the same order as genotypes, so results do not depend on order of
+    responses.
+    Evaluator has own event loop which is kept between generations (clients bound to loop can be reused), it is
+    closed by close(). If event loop is already running in the calling thread (for example, Jupyter), own loop is run
+    in helper thread.
+    """
+
+    def __init__(self, max_concurrency: int = 16, timeout: float = None, retries: int = 0, retry_delay: float = 0.0,
+                 retry_exceptions: Tuple[Type[BaseException], ...] = (Exception,)) -> None:
+        """
+        Initialize the AsyncEvaluator instance.
+
+        :param max_concurrency: maximum number of simultaneous calls of objective function.
+        :param timeout: limit of time of one call in seconds, None - without limit.
+        :param retries: number of repeated calls after failure or timeout of call.
+        :param retry_delay: delay before first repeated call in seconds, delay is doubled for every next repeat.
+        :param retry_exceptions: exceptions after which call is repeated, other exceptions stop calculation at once.
+        :return: None
+        """
+        if type(max_concurrency) is not int or max_concurrency < 1:
+            raise Exception(f'max_concurrency must be positive integer, not {max_concurrency}')
+        if timeout is not None and timeout <= 0:
+            raise Exception(f'timeout must be positive number or None, not {timeout}')
+        if type(retries) is not int or retries < 0:
+            raise Exception(f'retries must be non-negative integer, not {retries}')
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.num_retries: int = 0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread_pool: Optional[ThreadPoolExecutor] = None
+        self.lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """
+        Get state for pickling: event loop, helper thread and lock are not pickled.
+
+        :return: dict of attributes.
+        """
+        state = self.__dict__.copy()
+        state['loop'] = None
+        state['thread_pool'] = None
+        del state['lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Set state after unpickling.
+
+        :param state: dict of attributes.
+        :return: None
+        """
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    async def call(self, semaphore: asyncio.Semaphore, obj_function: Callable, input_data: Any,
+                   genotype: Union[list, List[list]]) -> Any:
+        """
+        Call async objective function for one genotype with timeout and retries.
+
+        :param semaphore: semaphore limiting number of simultaneous calls.
+        :param obj_function: async objective function.
+        :param input_data: additional information for calculating the value of the objective function.
+        :param genotype: the genotype of an individual (list of genotypes for batch objective function).
+        :return: raw values of objective function.
+        """
+        async with semaphore:
+            for attempt in range(self.retries + 1):
+                try:
+                    coroutine = obj_function(input_data, genotype) if input_data else obj_function(genotype)
+                    if self.timeout is None:
+                        return await coroutine
+                    return await asyncio.wait_for(coroutine, self.timeout)
+                except self.retry_exceptions as error:
+                    if attempt == self.retries:
+                        raise Exception(f'Async objective function failed after {attempt + 1} attempts: '
+                                        f'{type(error).__name__}: {error}') from error
+                    self.num_retries += 1
+                    if self.retry_delay:
+                        await asyncio.sleep(self.retry_delay * 2 ** attempt)
+
+    async def gather(self, obj_function: Callable, input_data: Any, genotypes: List[Union[list, List[list]]]) -> list:
+        """
+        Calculate objective function for all genotypes concurrently, other calls are cancelled after first failure.
+
+        :param obj_function: async objective function.
+        :param input_data: additional information for calculating the value of the objective function.
+        :param genotypes: genotypes of individuals.
+        :return: list of values in the same order as genotypes.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [asyncio.ensure_future(self.call(semaphore, obj_function, input_data, genotype))
+                 for genotype in genotypes]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def evaluate(self, obj_function: Callable, input_data: Any, genotypes: List[Union[list, List[list]]]) -> list:
+        """
+        Calculate objective function for all genotypes on own event loop, blocks until all values are got.
+
+        :param obj_function: async objective function.
+        :param input_data: additional information for calculating the value of the objective function.
+        :param genotypes: genotypes of individuals.
+        :return: list of values in the same order as genotypes.
+        """
+        if len(genotypes) == 0:
+            return []
+        with self.lock:
+            if self.loop is None or self.loop.is_closed():
+                self.loop = asyncio.new_event_loop()
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return self.loop.run_until_complete(self.gather(obj_function, input_data, genotypes))
+            if self.thread_pool is None:
+                self.thread_pool = ThreadPoolExecutor(max_workers=1)
+            return self.thread_pool.submit(self.loop.run_until_complete,
+                                           self.gather(obj_function, input_data, genotypes)).result()
+
+    def close(self) -> None:
+        """
+        Close own event loop and helper thread, new ones are created on the next evaluate().
+
+        :return: None
+        """
+        with self.lock:
+            if self.loop is not None:
+                if self.thread_pool is not None:
+                    self.thread_pool.submit(self.close_loop).result()
+                else:
+                    self.close_loop()
+                self.loop = None
+            if self.thread_pool is not None:
+                self.thread_pool.shutdown()
+                self.thread_pool = None
+
+    def close_loop(self) -> None:
+        """
+        Finish async generators of own event loop and close it.
+
+        :return: None
+        """
+        if not self.loop.is_closed():
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
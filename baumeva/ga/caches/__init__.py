@@ -0,0 +1,3 @@
+from .base_cache import BaseCache
+from .lru_cache import LRUCache
+from .sqlite_cache import SQLiteCache
@@ -0,0 +1,91 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Hashable, List, Optional, Union
+
+
+class BaseCache(ABC):
+    """
+    Abstract class for storing values of objective function between evaluations.
+    attribute: hits: number of found values.
+    attribute: misses: number of not found values.
+    attribute: evictions: number of values removed from cache.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the BaseCache instance.
+
+        :return: None
+        """
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def bind(self, obj_function: Callable, input_data: Any = None) -> None:
+        """
+        Method for binding cache to objective function and its input data, is called by fitness.
+        In-memory caches belong to one fitness and do nothing here.
+
+        :param obj_function: objective function.
+        :param input_data: additional information for calculating the value of the objective function.
+        :return: None
+        """
+        pass
+
+    def flush(self) -> None:
+        """
+        Method for writing buffered values, is called by fitness after every evaluation of population.
+
+        :return: None
+        """
+        pass
+
+    @staticmethod
+    def get_key(genotype: List[Any]) -> Hashable:
+        """
+        Get hashable key of genotype (phenotype in case of binary population), which is sent to objective function.
+
+        :param genotype: the genotype of an individual.
+        :return: key for cache.
+        """
+        return tuple(genotype)
+
+    @staticmethod
+    def pack(values: Union[int, float, list]) -> Union[int, float, tuple]:
+        """
+        Convert values of objective function to immutable form for storing.
+
+        :param values: values of objective function.
+        :return: stored values.
+        """
+        return tuple(values) if isinstance(values, list) else values
+
+    @staticmethod
+    def unpack(values: Union[int, float, tuple]) -> Union[int, float, list]:
+        """
+        Convert stored values to the form returned by objective function, every call returns new list.
+
+        :param values: stored values.
+        :return: values of objective function.
+        """
+        return list(values) if isinstance(values, tuple) else values
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Union[int, float, tuple]]:
+        """
+        Abstract method for getting stored values, it has to count hits and misses.
+
+        :param key: key of genotype.
+        :return: stored values or None if key is not found.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: Hashable, values: Union[int, float, tuple]) -> None:
+        """
+        Abstract method for storing values, it has to count evictions.
+
+        :param key: key of genotype.
+        :param values: stored values.
+        :return: None
+        """
+        pass
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Union
+from .base_cache import BaseCache
+
+
+class LRUCache(BaseCache):
+    """
+    Class for storing values of objective function in memory with least recently used eviction policy.
+    Inherits from BaseCache.
+    """
+
+    def __init__(self, max_size: Optional[int] = 100000) -> None:
+        """
+        Initialize the LRUCache instance.
+
+        :param max_size: maximum number of stored genotypes, None - unbounded cache. Default: 100000.
+        :return: None
+        """
+        super().__init__()
+        if max_size is not None and (type(max_size) is not int or max_size < 1):
+            raise Exception(f'max_size must be positive integer or None, not {max_size}')
+        self.max_size = max_size
+        self.storage = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.storage)
+
+    def get(self, key: Hashable) -> Optional[Union[int, float, tuple]]:
+        """
+        Get stored values and mark them as recently used.
+
+        :param key: key of genotype.
+        :return: stored values or None if key is not found.
+        """
+        values = self.storage.get(key)
+        if values is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.storage.move_to_end(key)
+        return values
+
+    def put(self, key: Hashable, values: Union[int, float, tuple]) -> None:
+        """
+        Store values, the least recently used values are removed if cache is full.
+
+        :param key: key of genotype.
+        :param values: stored values.
+        :return: None
+        """
+        if values is None:
+            return
+        self.storage[key] = values
+        self.storage.move_to_end(key)
+        if self.max_size is not None:
+            while len(self.storage) > self.max_size:
+                self.storage.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all stored values, counters are not changed.
+
+        :return: None
+        """
+        self.storage.clear()
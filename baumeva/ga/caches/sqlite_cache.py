@@ -0,0 +1,231 @@
+import os
+import pickle
+import types
+import sqlite3
+from functools import partial
+from hashlib import sha256
+from typing import Any, Callable, Hashable, Optional, Union
+from .base_cache import BaseCache
+
+
+class SQLiteCache(BaseCache):
+    """
+    Class for storing values of objective function in SQLite database file, values are shared between runs and
+    between processes on one machine. Key of value is hash of objective function identity, fingerprint of input data
+    and genotype (phenotype for binary population). Identity of objective function includes its bytecode, constants,
+    names, defaults, contents of closure cells, arguments of functools.partial and attributes of callable instance,
+    so changed objective function does not get stored values. Values of global variables used by objective function
+    are not included, set version to invalidate stored values in this case.
+    Inherits from BaseCache.
+    """
+
+    def __init__(self, path: str, timeout: float = 60, version: str = None) -> None:
+        """
+        Initialize the SQLiteCache instance.
+
+        :param path: path to database file, it is created if not exists.
+        :param timeout: seconds to wait for lock of database held by another process. Default: 60.
+        :param version: version of objective function, part of namespace of keys, other version does not get stored
+                        values. Default: None.
+        :return: None
+        """
+        super().__init__()
+        self.path = path
+        self.timeout = timeout
+        self.version = version
+        self.namespace: bytes = b''
+        self.buffer: dict = {}
+        self.connection: Optional[sqlite3.Connection] = None
+        self.pid: Optional[int] = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['connection'] = None
+        state['pid'] = None
+        return state
+
+    @classmethod
+    def get_code_identity(cls, code: types.CodeType) -> bytes:
+        """
+        Get identity of code object: bytecode, names and constants, nested code objects (inner functions, lambdas)
+        are included recursively.
+
+        :param code: code object of function.
+        :return: identity.
+        """
+        consts = []
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                const = cls.get_code_identity(const)
+            elif isinstance(const, frozenset):
+                # order of items of set depends on hash seed of process
+                const = sorted(repr(item) for item in const)
+            consts.append(const)
+        return sha256(code.co_code + repr((code.co_names, consts)).encode()).digest()
+
+    @classmethod
+    def get_value_fingerprint(cls, value: Any, seen: set) -> bytes:
+        """
+        Get fingerprint of value used by objective function (default, closure cell, argument of partial), functions
+        are fingerprinted by identity.
+
+        :param value: value.
+        :param seen: ids of functions which identity is being got, for recursive functions.
+        :return: fingerprint.
+        """
+        if callable(value) and not isinstance(value, type):
+            return cls.get_function_identity(value, seen)
+        return cls.get_data_fingerprint(value)
+
+    @classmethod
+    def get_function_identity(cls, obj_function: Callable, seen: set = None) -> bytes:
+        """
+        Get identity of objective function: module and qualified name; for function defined in Python its code,
+        defaults and contents of closure cells; arguments of functools.partial; instance of bound method or of
+        callable class.
+
+        :param obj_function: objective function.
+        :param seen: ids of functions which identity is being got, for recursive functions.
+        :return: identity.
+        """
+        seen = set() if seen is None else seen
+        if id(obj_function) in seen:
+            return b'recursion'
+        seen.add(id(obj_function))
+        if isinstance(obj_function, partial):
+            parts = [cls.get_function_identity(obj_function.func, seen)]
+            parts.extend(cls.get_value_fingerprint(arg, seen) for arg in obj_function.args)
+            parts.extend(key.encode() + cls.get_value_fingerprint(value, seen)
+                         for key, value in sorted(obj_function.keywords.items()))
+            return sha256(b'partial' + b''.join(parts)).digest()
+        if isinstance(obj_function, types.MethodType):
+            return sha256(cls.get_function_identity(obj_function.__func__, seen) +
+                          cls.get_data_fingerprint(obj_function.__self__)).digest()
+
+        code = getattr(obj_function, '__code__', None)
+        if code is None and isinstance(type(obj_function).__call__, types.FunctionType):
+            # callable instance: method __call__ of its class and its attributes
+            func = type(obj_function)
+            parts = [cls.get_function_identity(func.__call__, seen), cls.get_data_fingerprint(obj_function)]
+        else:
+            func = obj_function
+            parts = []
+        identity = f'{getattr(func, "__module__", None)}.{getattr(func, "__qualname__", type(func).__qualname__)}'
+        parts.insert(0, identity.encode())
+        if code is not None:
+            parts.append(cls.get_code_identity(code))
+            parts.append(cls.get_data_fingerprint((obj_function.__defaults__, obj_function.__kwdefaults__)))
+            for cell in obj_function.__closure__ or ():
+                try:
+                    parts.append(cls.get_value_fingerprint(cell.cell_contents, seen))
+                except ValueError:
+                    # empty cell of not yet assigned variable
+                    parts.append(b'')
+        return sha256(b''.join(parts)).digest()
+
+    @staticmethod
+    def get_data_fingerprint(input_data: Any) -> bytes:
+        """
+        Get fingerprint of input data of objective function.
+
+        :param input_data: additional information for calculating the value of the objective function.
+        :return: fingerprint.
+        """
+        try:
+            data = pickle.dumps(input_data, protocol=4)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            data = repr(input_data).encode()
+        return sha256(data).digest()
+
+    def bind(self, obj_function: Callable, input_data: Any = None) -> None:
+        """
+        Set namespace of keys for objective function and its input data.
+
+        :param obj_function: objective function.
+        :param input_data: additional information for calculating the value of the objective function.
+        :return: None
+        """
+        self.namespace = sha256(self.get_function_identity(obj_function) + self.get_data_fingerprint(input_data) +
+                                repr(self.version).encode()).digest()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Get connection to database, every process opens own connection.
+
+        :return: connection.
+        """
+        if self.connection is None or self.pid != os.getpid():
+            self.connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS evaluations (key BLOB PRIMARY KEY, value BLOB)')
+            self.connection.commit()
+            self.pid = os.getpid()
+        return self.connection
+
+    def get_hash(self, key: Hashable) -> bytes:
+        """
+        Get key of database row.
+
+        :param key: key of genotype.
+        :return: hash of namespace and key.
+        """
+        return sha256(self.namespace + repr(key).encode()).digest()
+
+    def get(self, key: Hashable) -> Optional[Union[int, float, tuple]]:
+        """
+        Get stored values from database.
+
+        :param key: key of genotype.
+        :return: stored values or None if key is not found.
+        """
+        key_hash = self.get_hash(key)
+        if key_hash in self.buffer:
+            self.hits += 1
+            return pickle.loads(self.buffer[key_hash])
+
+        row = self.get_connection().execute('SELECT value FROM evaluations WHERE key = ?', (key_hash,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key: Hashable, values: Union[int, float, tuple]) -> None:
+        """
+        Store values in buffer, they are written to database by flush().
+
+        :param key: key of genotype.
+        :param values: stored values.
+        :return: None
+        """
+        if values is None:
+            return
+        self.buffer[self.get_hash(key)] = pickle.dumps(values, protocol=4)
+
+    def flush(self) -> None:
+        """
+        Write buffered values to database in one transaction. Values written by another process are kept.
+
+        :return: None
+        """
+        if not self.buffer:
+            return
+        connection = self.get_connection()
+        with connection:
+            connection.executemany('INSERT OR IGNORE INTO evaluations (key, value) VALUES (?, ?)',
+                                   self.buffer.items())
+        self.buffer.clear()
+
+    def __len__(self) -> int:
+        return self.get_connection().execute('SELECT COUNT(*) FROM evaluations').fetchone()[0] + len(self.buffer)
+
+    def close(self) -> None:
+        """
+        Write buffered values and close connection to database.
+
+        :return: None
+        """
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
@@ -1,5 +1,10 @@
 from .order_crossover import OrderCrossover
+from .pmx_crossover import PMXCrossover
+from .cycle_crossover import CycleCrossover
 from .base_crossover import BaseCrossover
 from .one_point_crossover import OnePointCrossover
 from .two_point_crossover import TwoPointCrossover
 from .uniform_crossover import UniformCrossover
+from .packed_one_point_crossover import PackedOnePointCrossover
+from .packed_two_point_crossover import PackedTwoPointCrossover
+from .packed_uniform_crossover import PackedUniformCrossover
@@ -1,18 +1,38 @@
-from random import randint
 from abc import ABC, abstractmethod
-from baumeva.ga import GaData
+from copy import copy
+from baumeva.ga import GaData, RandomComponent
 
 
-class BaseCrossover(ABC):
+class BaseCrossover(RandomComponent, ABC):
     """
     Abstract class for implementing crossover operations in a genetic algorithm.
+    Parents are shared with population, so crossover have to create new genotypes for children.
+    Pair of parents is crossed with probability crossover_percent, else children are copies of parents. Copy has
+    "delta" record with objective score and genotype of parent, fitness uses it instead of objective function
+    (see BaseCombinatoryMutation).
     """
-    def __init__(self) -> None:
+
+    def __init__(self, crossover_percent: float = 1.0) -> None:
         """
         Initialize the BaseCrossover instance.
+
+        :param crossover_percent: probability of crossover of pair of parents, float value from 0 to 1 (default: 1.0).
         :return: None
         """
         self.num_offsprings: int = 1
+        self.crossover_percent = crossover_percent
+        self.check_crossover_percent()
+
+    def check_crossover_percent(self) -> None:
+        """
+        Check the validity of the crossover percent parameter.
+
+        :return: None
+        """
+        if type(self.crossover_percent) not in (int, float) or self.crossover_percent < 0 or \
+                self.crossover_percent > 1:
+            raise Exception(f'{self.crossover_percent} is not expected, please use float value of crossover_percent'
+                            f' from 0 to 1')
 
     @abstractmethod
     def crossover(self, parent_1: list, parent_2: list, child_1: dict, child_2: dict) -> tuple:
@@ -26,6 +46,16 @@ class BaseCrossover(ABC):
         """
         pass
 
+    @staticmethod
+    def get_len_individ(ga_data: GaData) -> int:
+        """
+        Get length of genotype of individuals.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: number of gens.
+        """
+        return len(ga_data.population[0]['genotype'])
+
     def get_children(self, parent_1: list, parent_2: list, ga_data: GaData) -> tuple:
         """
         Generate offspring using crossover.
@@ -40,9 +70,18 @@ class BaseCrossover(ABC):
         child_2 = ga_data.population.get_empty_individ()
 
         child_1, child_2 = self.crossover(parent_1, parent_2, child_1, child_2)
+        return self.get_offsprings(child_1, child_2)
 
+    def get_offsprings(self, child_1: dict, child_2: dict) -> tuple:
+        """
+        Get offsprings of pair: one random child or both children.
+
+        :param child_1: first offspring.
+        :param child_2: second offspring.
+        :return: A tuple containing offspring individuals.
+        """
         if self.num_offsprings == 1:
-            coin = randint(1, 2)
+            coin = self.rnd.randint(1, 2)
             if coin == 1:
                 return (child_1, )
             else:
@@ -50,6 +89,31 @@ class BaseCrossover(ABC):
         else:
             return child_1, child_2
 
+    def is_crossover(self) -> bool:
+        """
+        Determine if pair of parents should be crossed, random number is drawn only if crossover_percent < 1.
+
+        :return: True if crossover should be performed, False if children are copies of parents.
+        """
+        return self.crossover_percent >= 1 or self.rnd.random() < self.crossover_percent
+
+    def get_copies(self, parent_1: dict, parent_2: dict, ga_data: GaData) -> tuple:
+        """
+        Get copies of parents with "delta" records: objective score and genotype of parent, list of moves.
+
+        :param parent_1: first parent individual.
+        :param parent_2: second parent individual.
+        :param ga_data: GaData instance containing population and related data.
+        :return: A tuple containing offspring individuals.
+        """
+        children = []
+        for parent in (parent_1, parent_2):
+            child = ga_data.population.get_empty_individ()
+            child['genotype'] = copy(parent['genotype'])
+            child['delta'] = {'obj_score': parent['obj_score'], 'genotype': parent['genotype'], 'moves': []}
+            children.append(child)
+        return self.get_offsprings(children[0], children[1])
+
     def execute(self, ga_data: GaData) -> None:
         """
         Execute the crossover operation.
@@ -59,8 +123,11 @@ class BaseCrossover(ABC):
         """
         ga_data.children = ga_data.population.get_empty_copy()
         for i in range(0, int(len(ga_data.parents)), 2):
-            parent_1 = ga_data.parents[i]['genotype']
-            parent_2 = ga_data.parents[i+1]['genotype']
-            pair_children = self.get_children(parent_1, parent_2, ga_data=ga_data)
+            if self.is_crossover():
+                parent_1 = ga_data.parents[i]['genotype']
+                parent_2 = ga_data.parents[i+1]['genotype']
+                pair_children = self.get_children(parent_1, parent_2, ga_data=ga_data)
+            else:
+                pair_children = self.get_copies(ga_data.parents[i], ga_data.parents[i+1], ga_data=ga_data)
             for child in pair_children:
                 ga_data.children.append(child)
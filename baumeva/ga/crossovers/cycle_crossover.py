@@ -0,0 +1,60 @@
+from typing import List
+from .base_crossover import BaseCrossover
+
+
+class CycleCrossover(BaseCrossover):
+    """
+    A class for implementing cycle crossover (CX) for ordered genotypes in a genetic algorithm.
+    Positions are divided into cycles (position of gen of second parent in first parent is the next one), children
+    get gens of cycles from parents by turns, so every gen keeps position of one of parents. Positions of gens are
+    stored in dicts, so every child costs O(n). If parents have different gens (track is shorter than number of
+    points), cycles are chains, ends of chains are gens of only one parent.
+    Inherits from BaseCrossover.
+    """
+    def __init__(self, crossover_percent: float = 1.0) -> None:
+        """
+        Initialize the CycleCrossover instance.
+
+        :param crossover_percent: probability of crossover of pair of parents, float value from 0 to 1 (default: 1.0).
+        :return: None
+        """
+        super().__init__(crossover_percent=crossover_percent)
+
+    @staticmethod
+    def get_cycles(parent_1: list, parent_2: list) -> List[List[int]]:
+        """
+        Get cycles of positions.
+
+        :param parent_1: genotype of first parent.
+        :param parent_2: genotype of second parent.
+        :return: list of cycles, every cycle is list of positions.
+        """
+        positions_1 = {gen: idx for idx, gen in enumerate(parent_1)}
+        positions_2 = {gen: idx for idx, gen in enumerate(parent_2)}
+        is_visited = [False] * len(parent_1)
+        cycles = []
+        for idx_start in range(len(parent_1)):
+            if is_visited[idx_start]:
+                continue
+            cycle = []
+            idx = idx_start
+            while idx is not None and not is_visited[idx]:
+                is_visited[idx] = True
+                cycle.append(idx)
+                idx = positions_1.get(parent_2[idx])
+            idx = positions_2.get(parent_1[idx_start])
+            while idx is not None and not is_visited[idx]:
+                is_visited[idx] = True
+                cycle.append(idx)
+                idx = positions_2.get(parent_1[idx])
+            cycles.append(cycle)
+        return cycles
+
+    def crossover(self, parent_1: list, parent_2: list, child_1: dict, child_2: dict) -> tuple:
+        genotype_1, genotype_2 = list(parent_1), list(parent_2)
+        for cycle in self.get_cycles(parent_1, parent_2)[1::2]:
+            for idx in cycle:
+                genotype_1[idx], genotype_2[idx] = parent_2[idx], parent_1[idx]
+        child_1['genotype'] = genotype_1
+        child_2['genotype'] = genotype_2
+        return child_1, child_2
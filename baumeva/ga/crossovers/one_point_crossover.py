@@ -1,4 +1,3 @@
-from random import randint
 from .base_crossover import BaseCrossover
 from baumeva.ga import GaData
 
@@ -8,17 +7,18 @@ class OnePointCrossover(BaseCrossover):
     A class for implementing one-point crossover in a genetic algorithm.
     Inherits from BaseCrossover.
     """
-    def __init__(self) -> None:
+    def __init__(self, crossover_percent: float = 1.0) -> None:
         """
         Initialize the OnePointCrossover instance.
 
+        :param crossover_percent: probability of crossover of pair of parents, float value from 0 to 1 (default: 1.0).
         :return: None
         """
-        super().__init__()
+        super().__init__(crossover_percent=crossover_percent)
         self.len_individ = None
 
     def crossover(self, parent_1: list, parent_2: list, child_1: dict, child_2: dict) -> tuple:
-        idx_point = randint(1, self.len_individ - 1)
+        idx_point = self.rnd.randint(1, self.len_individ - 1)
         child_1['genotype'] = parent_1[:idx_point] + parent_2[idx_point:]
         child_2['genotype'] = parent_2[:idx_point] + parent_1[idx_point:]
         return child_1, child_2
@@ -30,5 +30,5 @@ class OnePointCrossover(BaseCrossover):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        self.len_individ = len(ga_data.population[0]['genotype'])
+        self.len_individ = self.get_len_individ(ga_data)
         super().execute(ga_data)
@@ -1,21 +1,32 @@
-from random import sample
 from .base_crossover import BaseCrossover
-from baumeva.ga import GaData
+from baumeva.ga import GaData, ArrayPopulation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class OrderCrossover(BaseCrossover):
     """
-    A class for implementing order crossover in a genetic algorithm.
+    A class for implementing order crossover in a genetic algorithm. Gens of segment are stored in set, so every child
+    costs O(n). In batch mode all children of generation are made from matrix of parents genotypes at once,
+    requires numpy, batch mode is used only with crossover_percent equal 1.
     Inherits from BaseCrossover.
     """
-    def __init__(self) -> None:
+    def __init__(self, is_batch: bool = False, crossover_percent: float = 1.0) -> None:
         """
         Initialize the OrderCrossover instance.
 
+        :param is_batch: If True all children are made with numpy arrays at once (default: False).
+        :param crossover_percent: probability of crossover of pair of parents, float value from 0 to 1 (default: 1.0).
         :return: None
         """
-        super().__init__()
+        if is_batch and np is None:
+            raise Exception(f'Batch order crossover requires numpy, please install it: pip install numpy')
+        super().__init__(crossover_percent=crossover_percent)
         self.len_individ = None
+        self.is_batch = is_batch
 
     def get_idx_segment(self) -> list:
         """
@@ -23,7 +34,7 @@ class OrderCrossover(BaseCrossover):
 
         :return: A list containing the indices of the crossover segment.
         """
-        idx_segment = sample(range(1, self.len_individ), 2)
+        idx_segment = self.rnd.sample(range(1, self.len_individ), 2)
         idx_segment.sort()
         return idx_segment
 
@@ -33,15 +44,89 @@ class OrderCrossover(BaseCrossover):
         left_side = idx_segment[0]
 
         segment = parent_1[idx_segment[0]:idx_segment[1]]
-        new_gens = [x for x in parent_2 if x not in segment]
+        segment_gens = set(segment)
+        new_gens = [x for x in parent_2 if x not in segment_gens]
         child_1['genotype'] = new_gens[right_side:right_side+left_side] + segment + new_gens[:right_side]
 
         segment = parent_2[idx_segment[0]:idx_segment[1]]
-        new_gens = [x for x in parent_1 if x not in segment]
+        segment_gens = set(segment)
+        new_gens = [x for x in parent_1 if x not in segment_gens]
         child_2['genotype'] = new_gens[right_side:right_side + left_side] + segment + new_gens[:right_side]
 
         return child_1, child_2
 
+    def get_genotypes(self, ga_data: GaData):
+        """
+        Get genotypes of parents as matrix, genotypes of ArrayPopulation are taken from its array.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: 2-D numpy array, row for every parent.
+        """
+        parents = ga_data.parents
+        if isinstance(parents, ArrayPopulation):
+            column = parents.columns.get('genotype')
+            if column is not None and column.kind == 'i' and column.width == self.len_individ and \
+                    column.is_numeric(len(parents)):
+                return column.data[:len(parents)]
+        return np.array([parent['genotype'] for parent in parents], dtype=np.int64)
+
+    @staticmethod
+    def batch_crossover(donors, receivers, idx_start, idx_end):
+        """
+        Make children of all pairs: segment of child is taken from donor, other gens are taken from receiver
+        in its order, as in crossover().
+
+        :param donors: 2-D numpy array of genotypes, gives segments.
+        :param receivers: 2-D numpy array of genotypes, gives other gens.
+        :param idx_start: numpy array of start indices of segments.
+        :param idx_end: numpy array of end indices of segments.
+        :return: 2-D numpy array of children genotypes.
+        """
+        num_pairs, len_individ = donors.shape
+        rows = np.arange(num_pairs)[:, None]
+        cols = np.arange(len_individ)
+        is_segment = (cols >= idx_start[:, None]) & (cols < idx_end[:, None])
+        low = min(donors.min(), receivers.min())
+        in_segment = np.zeros((num_pairs, max(donors.max(), receivers.max()) - low + 1), dtype=bool)
+        in_segment[rows, donors - low] = is_segment
+        order = np.argsort(in_segment[rows, receivers - low], axis=1, kind='stable')
+        new_gens = np.take_along_axis(receivers, order, axis=1)
+        idx_new_gens = np.where(cols < idx_start[:, None], cols + len_individ - idx_end[:, None],
+                                cols - idx_end[:, None])
+        children = np.take_along_axis(new_gens, np.clip(idx_new_gens, 0, len_individ - 1), axis=1)
+        children[is_segment] = donors[is_segment]
+        return children
+
+    def batch_execute(self, ga_data: GaData) -> None:
+        """
+        Make all children of generation at once from matrix of parents genotypes.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        ga_data.children = ga_data.population.get_empty_copy()
+        num_pairs = len(ga_data.parents) // 2
+        if num_pairs == 0:
+            return
+        rng = np.random.default_rng(self.rnd.getrandbits(128))
+        genotypes = self.get_genotypes(ga_data)
+        parents_1, parents_2 = genotypes[0:2 * num_pairs:2], genotypes[1:2 * num_pairs:2]
+        idx_first = rng.integers(1, self.len_individ, num_pairs)
+        idx_second = rng.integers(1, self.len_individ - 1, num_pairs)
+        idx_second += idx_second >= idx_first
+        idx_start, idx_end = np.minimum(idx_first, idx_second), np.maximum(idx_first, idx_second)
+
+        children_1 = self.batch_crossover(parents_1, parents_2, idx_start, idx_end)
+        children_2 = self.batch_crossover(parents_2, parents_1, idx_start, idx_end)
+        if self.num_offsprings == 1:
+            children = np.where(rng.integers(0, 2, num_pairs)[:, None] == 0, children_1, children_2)
+        else:
+            children = np.stack((children_1, children_2), axis=1).reshape(-1, self.len_individ)
+        for genotype in children.tolist():
+            child = ga_data.population.get_empty_individ()
+            child['genotype'] = genotype
+            ga_data.children.append(child)
+
     def execute(self, ga_data: GaData) -> None:
         """
         Execute the order crossover operation.
@@ -49,5 +134,8 @@ class OrderCrossover(BaseCrossover):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        self.len_individ = len(ga_data.population[0]['genotype'])
-        super().execute(ga_data)
+        self.len_individ = self.get_len_individ(ga_data)
+        if self.is_batch and self.crossover_percent >= 1:
+            self.batch_execute(ga_data)
+        else:
+            super().execute(ga_data)
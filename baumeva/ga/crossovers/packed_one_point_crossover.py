@@ -0,0 +1,27 @@
+from .one_point_crossover import OnePointCrossover
+from baumeva.ga import GaData
+
+
+class PackedOnePointCrossover(OnePointCrossover):
+    """
+    A class for implementing one-point crossover of genotypes packed into integers (PackedBinaryPopulation).
+    Inherits from OnePointCrossover.
+    """
+
+    def crossover(self, parent_1: int, parent_2: int, child_1: dict, child_2: dict) -> tuple:
+        idx_point = self.rnd.randint(1, self.len_individ - 1)
+        mask = (1 << (self.len_individ - idx_point)) - 1
+        diff = (parent_1 ^ parent_2) & mask
+        child_1['genotype'] = parent_1 ^ diff
+        child_2['genotype'] = parent_2 ^ diff
+        return child_1, child_2
+
+    @staticmethod
+    def get_len_individ(ga_data: GaData) -> int:
+        """
+        Get number of bits of packed genotypes.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: number of bits.
+        """
+        return ga_data.population.idx_bits[-1]
@@ -0,0 +1,28 @@
+from .two_point_crossover import TwoPointCrossover
+from baumeva.ga import GaData
+
+
+class PackedTwoPointCrossover(TwoPointCrossover):
+    """
+    A class for implementing two-point crossover of genotypes packed into integers (PackedBinaryPopulation).
+    Inherits from TwoPointCrossover.
+    """
+
+    def crossover(self, parent_1: int, parent_2: int, child_1: dict, child_2: dict) -> tuple:
+        idx_segment = self.rnd.sample(range(1, self.len_individ), 2)
+        idx_segment.sort()
+        mask = ((1 << (idx_segment[1] - idx_segment[0])) - 1) << (self.len_individ - idx_segment[1])
+        diff = (parent_1 ^ parent_2) & mask
+        child_1['genotype'] = parent_1 ^ diff
+        child_2['genotype'] = parent_2 ^ diff
+        return child_1, child_2
+
+    @staticmethod
+    def get_len_individ(ga_data: GaData) -> int:
+        """
+        Get number of bits of packed genotypes.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: number of bits.
+        """
+        return ga_data.population.idx_bits[-1]
@@ -0,0 +1,27 @@
+from .uniform_crossover import UniformCrossover
+from baumeva.ga import GaData
+
+
+class PackedUniformCrossover(UniformCrossover):
+    """
+    A class for implementing uniform crossover of genotypes packed into integers (PackedBinaryPopulation),
+    parent of every bit is given by one random integer.
+    Inherits from UniformCrossover.
+    """
+
+    def crossover(self, parent_1: int, parent_2: int, child_1: dict, child_2: dict) -> tuple:
+        mask = self.rnd.getrandbits(self.len_individ)
+        new_gens = parent_1 ^ ((parent_1 ^ parent_2) & mask)
+        child_1['genotype'] = new_gens
+        child_2['genotype'] = new_gens
+        return child_1, child_2
+
+    @staticmethod
+    def get_len_individ(ga_data: GaData) -> int:
+        """
+        Get number of bits of packed genotypes.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: number of bits.
+        """
+        return ga_data.population.idx_bits[-1]
@@ -0,0 +1,58 @@
+from .base_crossover import BaseCrossover
+from baumeva.ga import GaData
+
+
+class PMXCrossover(BaseCrossover):
+    """
+    A class for implementing partially mapped crossover (PMX) for ordered genotypes in a genetic algorithm.
+    Child gets segment of one parent, other gens are taken from second parent in place, gens repeated in segment
+    are replaced by mapping of segment. Positions of segment gens are stored in dict, so every child costs O(n).
+    Inherits from BaseCrossover.
+    """
+    def __init__(self, crossover_percent: float = 1.0) -> None:
+        """
+        Initialize the PMXCrossover instance.
+
+        :param crossover_percent: probability of crossover of pair of parents, float value from 0 to 1 (default: 1.0).
+        :return: None
+        """
+        super().__init__(crossover_percent=crossover_percent)
+        self.len_individ = None
+
+    @staticmethod
+    def get_child(donor: list, receiver: list, idx_start: int, idx_end: int) -> list:
+        """
+        Get genotype of child with segment of donor.
+
+        :param donor: genotype of parent, gives segment.
+        :param receiver: genotype of parent, gives other gens.
+        :param idx_start: start index of segment.
+        :param idx_end: end index of segment.
+        :return: genotype of child.
+        """
+        segment_positions = {donor[idx]: idx for idx in range(idx_start, idx_end)}
+        child = list(receiver)
+        child[idx_start:idx_end] = donor[idx_start:idx_end]
+        for idx in list(range(idx_start)) + list(range(idx_end, len(receiver))):
+            gen = receiver[idx]
+            while gen in segment_positions:
+                gen = receiver[segment_positions[gen]]
+            child[idx] = gen
+        return child
+
+    def crossover(self, parent_1: list, parent_2: list, child_1: dict, child_2: dict) -> tuple:
+        idx_segment = self.rnd.sample(range(1, self.len_individ), 2)
+        idx_segment.sort()
+        child_1['genotype'] = self.get_child(parent_1, parent_2, idx_segment[0], idx_segment[1])
+        child_2['genotype'] = self.get_child(parent_2, parent_1, idx_segment[0], idx_segment[1])
+        return child_1, child_2
+
+    def execute(self, ga_data: GaData) -> None:
+        """
+        Execute the partially mapped crossover operation.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        self.len_individ = self.get_len_individ(ga_data)
+        super().execute(ga_data)
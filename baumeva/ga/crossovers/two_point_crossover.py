@@ -1,4 +1,3 @@
-from random import sample
 from .base_crossover import BaseCrossover
 from baumeva.ga import GaData
 
@@ -8,17 +7,18 @@ class TwoPointCrossover(BaseCrossover):
     A class for implementing two-point crossover in a genetic algorithm.
     Inherits from BaseCrossover.
     """
-    def __init__(self) -> None:
+    def __init__(self, crossover_percent: float = 1.0) -> None:
         """
         Initialize the TwoPointCrossover instance.
 
+        :param crossover_percent: probability of crossover of pair of parents, float value from 0 to 1 (default: 1.0).
         :return: None
         """
-        super().__init__()
+        super().__init__(crossover_percent=crossover_percent)
         self.len_individ = None
 
     def crossover(self, parent_1: list, parent_2: list, child_1: dict, child_2: dict) -> tuple:
-        idx_segment = sample(range(1, self.len_individ), 2)
+        idx_segment = self.rnd.sample(range(1, self.len_individ), 2)
         idx_segment.sort()
         child_1['genotype'] = parent_1[:idx_segment[0]] + parent_2[idx_segment[0]:idx_segment[1]] + parent_1[
                                                                                                     idx_segment[1]:]
@@ -33,5 +33,5 @@ class TwoPointCrossover(BaseCrossover):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        self.len_individ = len(ga_data.population[0]['genotype'])
+        self.len_individ = self.get_len_individ(ga_data)
         super().execute(ga_data)
@@ -1,4 +1,3 @@
-from random import randint
 from .base_crossover import BaseCrossover
 from baumeva.ga import GaData
 
@@ -8,20 +7,21 @@ class UniformCrossover(BaseCrossover):
     A class for implementing uniform crossover in a genetic algorithm.
     Inherits from BaseCrossover.
     """
-    def __init__(self) -> None:
+    def __init__(self, crossover_percent: float = 1.0) -> None:
         """
         Initialize the UniformCrossover instance.
 
+        :param crossover_percent: probability of crossover of pair of parents, float value from 0 to 1 (default: 1.0).
         :return: None
         """
-        super().__init__()
+        super().__init__(crossover_percent=crossover_percent)
         self.len_individ = None
 
     def crossover(self, parent_1: list, parent_2: list, child_1: dict, child_2: dict) -> tuple:
 
         new_gens = []
         for i in range(self.len_individ):
-            coin = randint(1, 2)
+            coin = self.rnd.randint(1, 2)
             if coin == 1:
                 new_gens.append(parent_1[i])
             else:
@@ -38,5 +38,5 @@ class UniformCrossover(BaseCrossover):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        self.len_individ = len(ga_data.population[0]['genotype'])
+        self.len_individ = self.get_len_individ(ga_data)
         super().execute(ga_data)
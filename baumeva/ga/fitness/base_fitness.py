@@ -1,13 +1,55 @@
+import inspect
+import os
 from abc import ABC, abstractmethod
-from typing import Union, Callable, List, Any
-from baumeva.ga import BasePenalty
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Union, Callable, List, Any, Optional
+from baumeva.ga import BasePenalty, BaseCache, AsyncEvaluator
 from baumeva.ga.ga_data import GaData
+from baumeva.ga.moves import apply_move
 from warnings import warn
 
 
+def calc_values(obj_function: Callable, input_data: Any, genotype: List[Union[int, float]]) -> Any:
+    """
+    Call objective function for one genotype. Defined on module level, so it can be sent to worker processes.
+
+    :param obj_function: objective function.
+    :param input_data: additional information for calculating the value of the objective function.
+    :param genotype: the genotype of an individual.
+    :return: raw values of objective function.
+    """
+    if input_data:
+        return obj_function(input_data, genotype)
+    else:
+        return obj_function(genotype)
+
+
+def calc_delta(delta: Callable, input_data: Any, genotype: List[Union[int, float]], move: tuple) -> Any:
+    """
+    Call delta of objective function for one move of genotype.
+
+    :param delta: delta function of objective function: delta(genotype, move) or delta(input_data, genotype, move).
+    :param input_data: additional information for calculating the value of the objective function.
+    :param genotype: the genotype of an individual before move.
+    :param move: tuple, name of move and its indices (see baumeva.ga.moves.apply_move).
+    :return: change of objective value after move.
+    """
+    if input_data:
+        return delta(input_data, genotype, move)
+    else:
+        return delta(genotype, move)
+
+
 class BaseFitness(ABC):
     """
     Abstract class for calculating fitness value of one population.
+    Objective function can have attribute delta - function delta(genotype, move) (or delta(input_data, genotype,
+    move)) which returns change of objective value after move of combinatory mutation. Children which are copies of
+    parents (crossover_percent < 1) get objective value of parent plus delta of their moves without call of objective
+    function, it is used only for non-conditional optimization.
+    Objective function can be async (async def), it is calculated concurrently for all genotypes of generation by
+    AsyncEvaluator, it is useful for I/O-bound objective functions.
     attribute: __is_conditional_opt: conditional optimization task or not.
     attribute: __idx_opt_value: index of optimization value from object function.
     """
@@ -20,7 +62,13 @@ class BaseFitness(ABC):
                  obj_value: Union[int, float] = None,
                  input_data: Any = None,
                  penalty: BasePenalty = None,
-                 conditions: list = None) -> None:
+                 conditions: list = None,
+                 workers: int = None,
+                 executor: Executor = None,
+                 chunksize: int = None,
+                 cache: BaseCache = None,
+                 is_batch: bool = False,
+                 async_evaluator: AsyncEvaluator = None) -> None:
         """
         Initialize the BaseFitness instance.
 
@@ -41,6 +89,26 @@ class BaseFitness(ABC):
                                     dp = DynamicPenalty()
                                     HyperbolaFitness(obj_function=my_func, obj_value=0, penalty=dp,
                                                      conditions=['optimize', '<=', '!='])
+        :param workers: number of worker processes for parallel calculation of objective function. Objective function
+                        and input data have to be picklable (defined on module level). Default: None (serial).
+        :param executor: any concurrent.futures.Executor for calculation of objective function, will be used
+                         instead of own process pool. Executor is not closed by fitness. Default: None.
+        :param chunksize: number of individuals sent to worker in one task. Default: None (calculated automatically).
+        :param cache: subclass of BaseCache(), stores values of objective function by genotype (phenotype for binary
+                      population), objective function is not called for stored genotypes. Default: None.
+        :param is_batch: if True, objective function gets list of all not evaluated genotypes (rows of matrix) and
+                         returns sequence of values for every row (list, matrix n x k or vector n, for example numpy
+                         array). Default: False.
+                         Example:
+                            def my_func(x: list):
+                                x = numpy.asarray(x)
+                                return x[:, 0]**2 + x[:, 1]**2
+        :param async_evaluator: AsyncEvaluator() for async objective function (async def), sets limit of simultaneous
+                                calls, timeout and retries of calls. Default: None (AsyncEvaluator() with default
+                                parameters is used for async objective function).
+                                Example:
+                                   async def my_func(x: list):
+                                       return await request_to_simulator(x)
         :return: None
         """
 
@@ -49,7 +117,99 @@ class BaseFitness(ABC):
         self.input_data = input_data
         self.penalty = penalty
         self.conditions = ['optimize'] if conditions is None else conditions
+        self.workers = workers
+        self.executor = executor
+        self.chunksize = chunksize
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.cache = cache
+        self.is_batch = is_batch
+        self.async_evaluator = async_evaluator
+        self.is_async = inspect.iscoroutinefunction(obj_function) or \
+            inspect.iscoroutinefunction(getattr(obj_function, '__call__', None))
         self.check_task()
+        self.check_workers()
+        self.check_async()
+        self.check_cache()
+
+    def check_workers(self) -> None:
+        """
+        Check the validity of the parallel evaluation parameters.
+
+        :return: None.
+        """
+        if self.workers is not None and (type(self.workers) is not int or self.workers < 1):
+            raise Exception(f'workers must be positive integer or None, not {self.workers}')
+        if self.executor is not None and isinstance(self.executor, Executor) is False:
+            raise Exception(f'Unexpected executor: {self.executor}, use subclass of concurrent.futures.Executor')
+        if self.chunksize is not None and (type(self.chunksize) is not int or self.chunksize < 1):
+            raise Exception(f'chunksize must be positive integer or None, not {self.chunksize}')
+
+    def check_async(self) -> None:
+        """
+        Check the validity of the async evaluation parameters, AsyncEvaluator is created for async objective function.
+
+        :return: None.
+        """
+        if self.async_evaluator is not None and isinstance(self.async_evaluator, AsyncEvaluator) is False:
+            raise Exception(f'Unexpected async_evaluator: {self.async_evaluator}, use AsyncEvaluator')
+        if self.is_async:
+            if self.workers is not None or self.executor is not None:
+                raise Exception(f'Async objective function can not be used with workers or executor, '
+                                f'use async_evaluator')
+            if self.async_evaluator is None:
+                self.async_evaluator = AsyncEvaluator()
+        elif self.async_evaluator is not None:
+            raise Exception(f'async_evaluator requires async objective function (async def)')
+
+    def check_cache(self) -> None:
+        """
+        Check the validity of the cache parameter.
+
+        :return: None.
+        """
+        if self.cache is not None:
+            if isinstance(self.cache, BaseCache) is False:
+                raise Exception(f'Unexpected cache: {self.cache}, use subclass of BaseCache')
+            self.cache.bind(self.obj_function, self.input_data)
+
+    def get_executor(self) -> Optional[Executor]:
+        """
+        Get executor for parallel calculation of objective function. Own process pool is created at first call.
+
+        :return: executor or None for serial calculation.
+        """
+        if self.executor is not None:
+            return self.executor
+        if self.workers is None:
+            return None
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self.pool
+
+    def get_chunksize(self, num_tasks: int) -> int:
+        """
+        Calculate number of individuals sent to worker in one task: about 4 tasks for every worker.
+
+        :param num_tasks: number of individuals to calculate.
+        :return: chunksize.
+        """
+        if self.chunksize is not None:
+            return self.chunksize
+        num_workers = self.workers or os.cpu_count() or 1
+        return max(1, -(-num_tasks // (4 * num_workers)))
+
+    def shutdown(self) -> None:
+        """
+        Close own process pool and event loop of async evaluator, if they were created. New ones will be created on
+        the next execute.
+
+        :return: None.
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        if self.async_evaluator is not None:
+            self.async_evaluator.close()
 
     def set_opt_value(self) -> None:
         """
@@ -90,6 +250,25 @@ class BaseFitness(ABC):
         else:
             return self.penalty.execute(conditionals=self.conditions, values=values)
 
+    def get_penalty_values(self, values_list: List[List[Union[int, float]]], idx_generation: int,
+                           best_individ: dict) -> List[Union[int, float]]:
+        """
+        Calculate the penalty values of several individuals at once, penalty is calculated over columns of conditions.
+
+        :param values_list: values of conditions for every individual.
+        :param idx_generation: the index of the current generation.
+        :param best_individ: the best individual found so far.
+        :return: list of penalty values.
+        """
+        if self.penalty.name() == 'DynamicPenalty':
+            return self.penalty.execute_batch(conditionals=self.conditions, values_list=values_list,
+                                              iter_generation=idx_generation)
+        elif self.penalty.name() == 'AdaptivePenalty':
+            return self.penalty.execute_batch(conditionals=self.conditions, values_list=values_list,
+                                              iter_generation=idx_generation, best_individ=best_individ)
+        else:
+            return self.penalty.execute_batch(conditionals=self.conditions, values_list=values_list)
+
     def check_input(self, values: List[Union[int, float]]) -> List[Union[int, float]]:
         """
         Checks whether the number of values returned from objective function is correct.
@@ -110,6 +289,7 @@ class BaseFitness(ABC):
                                     f' optimization must be equal 1')
             except TypeError:
                 return values
+            return values[0]
 
     def calc_obj_func(self, genotype: List[Union[int, float]]) -> Union[int, float, list]:
         """
@@ -118,13 +298,143 @@ class BaseFitness(ABC):
         :param genotype: the genotype of an individual.
         :return: one or more values.
         """
-        if self.input_data:
-            values = self.obj_function(self.input_data, genotype)
-        else:
-            values = self.obj_function(genotype)
+        values = calc_values(self.obj_function, self.input_data, genotype)
 
         return self.check_input(values)
 
+    def calc_batch(self, genotypes: List[List[Union[int, float]]]) -> list:
+        """
+        Method for calculating objective function with batch protocol: one call for all genotypes or one call for
+        every chunk of genotypes in case of executor.
+
+        :param genotypes: genotypes of individuals.
+        :return: list of values in the same order as genotypes.
+        """
+        executor = self.get_executor()
+        if self.is_async:
+            values_list = self.async_evaluator.evaluate(self.obj_function, self.input_data, [genotypes])[0]
+        elif executor is None:
+            values_list = calc_values(self.obj_function, self.input_data, genotypes)
+        else:
+            chunksize = self.get_chunksize(len(genotypes))
+            chunks = [genotypes[i:i + chunksize] for i in range(0, len(genotypes), chunksize)]
+            func = partial(calc_values, self.obj_function, self.input_data)
+            values_list = [values for chunk_values in executor.map(func, chunks) for values in chunk_values]
+
+        if len(values_list) != len(genotypes):
+            raise Exception(f'Objective function returned {len(values_list)} rows of values for {len(genotypes)}'
+                            f' genotypes')
+        return [self.check_input(values) for values in values_list]
+
+    def calc_population(self, genotypes: List[List[Union[int, float]]]) -> list:
+        """
+        Method for calculating objective function for several genotypes, serial, with executor or concurrently with
+        async evaluator.
+
+        :param genotypes: genotypes of individuals.
+        :return: list of values in the same order as genotypes.
+        """
+        if self.is_batch and len(genotypes) > 0:
+            return self.calc_batch(genotypes)
+
+        if self.is_async:
+            values_list = self.async_evaluator.evaluate(self.obj_function, self.input_data, genotypes)
+            return [self.check_input(values) for values in values_list]
+
+        executor = self.get_executor()
+        if executor is None or len(genotypes) == 0:
+            return [self.calc_obj_func(genotype=genotype) for genotype in genotypes]
+
+        func = partial(calc_values, self.obj_function, self.input_data)
+        values_list = executor.map(func, genotypes, chunksize=self.get_chunksize(len(genotypes)))
+        return [self.check_input(values) for values in values_list]
+
+    def get_values(self, genotypes: List[List[Union[int, float]]], ga_data: GaData) -> list:
+        """
+        Method for getting values of objective function for several genotypes, stored values are taken from cache,
+        objective function is calculated once for every other unique genotype.
+
+        :param genotypes: genotypes of individuals.
+        :param ga_data: GaData instance, gets counters of cache.
+        :return: list of values in the same order as genotypes.
+        """
+        if self.cache is None:
+            ga_data.obj_calls += len(genotypes)
+            return self.calc_population(genotypes)
+
+        hits, misses, evictions = self.cache.hits, self.cache.misses, self.cache.evictions
+        values_list = [None] * len(genotypes)
+        missed = {}
+        for idx, genotype in enumerate(genotypes):
+            key = self.cache.get_key(genotype)
+            if key in missed:
+                self.cache.hits += 1
+                missed[key].append(idx)
+                continue
+            values = self.cache.get(key)
+            if values is None:
+                missed[key] = [idx]
+            else:
+                values_list[idx] = self.cache.unpack(values)
+
+        keys = list(missed.keys())
+        ga_data.obj_calls += len(keys)
+        calc_values_list = self.calc_population([genotypes[missed[key][0]] for key in keys])
+        for key, values in zip(keys, calc_values_list):
+            values = self.cache.pack(values)
+            self.cache.put(key, values)
+            for idx in missed[key]:
+                values_list[idx] = self.cache.unpack(values)
+        self.cache.flush()
+
+        ga_data.cache_hits += self.cache.hits - hits
+        ga_data.cache_misses += self.cache.misses - misses
+        ga_data.cache_evictions += self.cache.evictions - evictions
+        return values_list
+
+    def get_delta_value(self, individ: dict) -> Any:
+        """
+        Get objective value of individual from "delta" record: objective value of parent plus delta of every move.
+        Moves are applied to copy of parent genotype, if result differs from genotype of individual (it was changed
+        without record) value is not got.
+
+        :param individ: data of an individual.
+        :return: objective value or None if it has to be calculated by objective function.
+        """
+        record = individ.get('delta')
+        if record is None or self.__is_conditional_opt:
+            return None
+        value = record['obj_score']
+        genotype = record['genotype']
+        if record['moves']:
+            delta = getattr(self.obj_function, 'delta', None)
+            if delta is None:
+                return None
+            genotype = list(genotype)
+            for move in record['moves']:
+                value += calc_delta(delta, self.input_data, genotype, move)
+                genotype = apply_move(genotype, move)
+        if genotype != individ['genotype']:
+            return None
+        return value
+
+    def get_delta_values(self, individuals: List[dict], ga_data: GaData) -> list:
+        """
+        Get objective values of individuals from "delta" records, records are removed.
+
+        :param individuals: individuals without fitness score.
+        :param ga_data: GaData instance, gets counter of delta evaluations.
+        :return: list of objective values, None for individuals which have to be calculated by objective function.
+        """
+        delta_values = []
+        for individ in individuals:
+            value = self.get_delta_value(individ)
+            if value is not None:
+                ga_data.delta_calls += 1
+            delta_values.append(value)
+        ga_data.population.remove_key('delta', individuals)
+        return delta_values
+
     @abstractmethod
     def get_fitness_score(self, individ: dict, penalty_value: Union[int, float] = 0) ->\
             Union[int, float]:
@@ -137,6 +447,15 @@ class BaseFitness(ABC):
         """
         pass
 
+    def prepare_fitness(self, ga_data: GaData) -> None:
+        """
+        Prepare data of population which is needed for fitness scores, called after objective scores are set.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None.
+        """
+        pass
+
     def set_obj_score(self, values: List[Union[int, float]], individ: dict) -> None:
         """
         Gets next objective score from values of objective function.
@@ -147,6 +466,36 @@ class BaseFitness(ABC):
         """
         individ['obj_score'] = values.pop(self.__idx_opt_value)
 
+    def set_scores(self, individuals: List[dict], values_list: list, ga_data: GaData) -> None:
+        """
+        Assign objective score, feasibility and fitness score to individuals from values of objective function.
+
+        :param individuals: specimens which get the scores.
+        :param values_list: values of objective function for every individual.
+        :param ga_data: GaData instance containing population and related data.
+        :return: None.
+        """
+        if self.__is_conditional_opt:
+            for individ, values in zip(individuals, values_list):
+                self.set_obj_score(values, individ)
+                for i_v, v in enumerate(values):
+                    if self.conditions[i_v] == '<=':
+                        if v > 0:
+                            individ['feasible'] = False
+                    else:
+                        if v != 0:
+                            individ['feasible'] = False
+            penalty_values = self.get_penalty_values(values_list=values_list, idx_generation=ga_data.idx_generation,
+                                                     best_individ=ga_data.best_solution)
+        else:
+            for individ, values in zip(individuals, values_list):
+                individ['obj_score'] = values
+            penalty_values = [0] * len(individuals)
+
+        self.prepare_fitness(ga_data)
+        for individ, penalty_value in zip(individuals, penalty_values):
+            individ['score'] = self.get_fitness_score(individ, penalty_value)
+
     def execute(self, ga_data: GaData) -> None:
         """
         Calculate and assign fitness scores to individuals in the population.
@@ -156,29 +505,16 @@ class BaseFitness(ABC):
         """
         if ga_data.population.is_phenotype:
             ga_data.population.get_phenotype()
+
+        pending = [individ for individ in ga_data.population if individ['score'] is None]
+        delta_values = self.get_delta_values(pending, ga_data)
+        if ga_data.population.is_phenotype:
             ga_data.population.swap()
 
-        for individ in ga_data.population:
-            if individ['score'] is None:
-                values = self.calc_obj_func(genotype=individ['genotype'])
-                if self.__is_conditional_opt:
-                    self.set_obj_score(values, individ)
-                    for i_v, v in enumerate(values):
-                        if self.conditions[i_v] == '<=':
-                            if v > 0:
-                                individ['feasible'] = False
-                        else:
-                            if v != 0:
-                                individ['feasible'] = False
-                        # individ['feasible'] = True if ((v <= 0) and (v == 0)) else False
-                        # print(v)
-                    penalty_value = self.get_penalty_value(values=values, idx_generation=ga_data.idx_generation,
-                                                           best_individ=ga_data.best_solution)
-                    individ['score'] = self.get_fitness_score(individ, penalty_value)
-                else:
-                    individ['obj_score'] = values
-                    penalty_value = 0
-                individ['score'] = self.get_fitness_score(individ, penalty_value)
+        calculated = iter(self.get_values([individ['genotype'] for individ, value in zip(pending, delta_values)
+                                           if value is None], ga_data))
+        values_list = [next(calculated) if value is None else value for value in delta_values]
+        self.set_scores(pending, values_list, ga_data)
 
         if ga_data.population.is_phenotype:
             ga_data.population.swap()
@@ -1,6 +1,7 @@
+from concurrent.futures import Executor
 from typing import List, Union, Callable, Any
 from .base_fitness import BaseFitness
-from baumeva.ga import BasePenalty
+from baumeva.ga import BasePenalty, BaseCache, AsyncEvaluator
 from baumeva.ga.multi_ga_data import MultiGaData
 
 
@@ -17,7 +18,13 @@ class MultiFitness(BaseFitness):
                  obj_value: Union[int, float, List[Union[int, float]]] = None,
                  input_data: Any = None,
                  penalty: BasePenalty = None,
-                 conditions: list = None) -> None:
+                 conditions: list = None,
+                 workers: int = None,
+                 executor: Executor = None,
+                 chunksize: int = None,
+                 cache: BaseCache = None,
+                 is_batch: bool = False,
+                 async_evaluator: AsyncEvaluator = None) -> None:
         """
         Initialize the BaseFitness instance.
 
@@ -38,10 +45,18 @@ class MultiFitness(BaseFitness):
                                     dp = DynamicPenalty()
                                     HyperbolaFitness(obj_function=my_func, obj_value=0, penalty=dp,
                                                      conditions=['optimize', '<=', '!='])
+        :param workers: number of worker processes for parallel calculation of objective function. Default: None.
+        :param executor: any concurrent.futures.Executor for calculation of objective function. Default: None.
+        :param chunksize: number of individuals sent to worker in one task. Default: None.
+        :param cache: subclass of BaseCache(), stores values of objective function. Default: None.
+        :param is_batch: if True, objective function gets list of genotypes and returns values for every genotype.
+                         Default: False.
+        :param async_evaluator: AsyncEvaluator() for async objective function. Default: None.
         :return: None
         """
 
-        super().__init__(obj_function, obj_value, input_data, penalty, conditions)
+        super().__init__(obj_function, obj_value, input_data, penalty, conditions, workers, executor, chunksize, cache,
+                         is_batch, async_evaluator)
 
     def get_fitness_score(self, obj_score: Union[int, float], penalty_value: Union[int, float] = 0) ->\
             Union[int, float]:
@@ -90,46 +105,108 @@ class MultiFitness(BaseFitness):
         for idx in self.__idx_opt_value:
             individ['obj_score'].append(values.pop(idx))
 
-    def inferior(self, x: dict, y: dict) -> Union[dict, None]:
+    @staticmethod
+    def inferior(x: dict, y: dict) -> Union[dict, None]:
         """
-        Computes the inferior of 2 individuals
+        Computes the inferior of 2 individuals by their objective scores.
 
         :param x: dict, first individual data.
         :param y: dict, second individual data.
         :return: dict, containing the inferior of x and y if there is one, None if there are no inferior individuals
         """
-        x_score = list(self.obj_function(x['phenotype']))
-        y_score = list(self.obj_function(y['phenotype']))
+        x_score = list(x['obj_score'])
+        y_score = list(y['obj_score'])
 
         if x_score == y_score:
             return None
-
-        max_score = x_score.copy()
-        for i in range(len(y_score)):
-            if max_score[i] < y_score[i]:
-                max_score[i] = y_score[i]
-
-        if max_score == x_score:
+        if all(x_value >= y_value for x_value, y_value in zip(x_score, y_score)):
             return x
-        elif max_score == y_score:
+        if all(x_value <= y_value for x_value, y_value in zip(x_score, y_score)):
             return y
-        else:
-            return None
+        return None
+
+    @staticmethod
+    def count_dominating_2d(scores: List[tuple]) -> List[int]:
+        """
+        Counts individuals dominating every individual for 2 objectives in O(N log N): individuals are sorted by first
+        objective and second objectives of processed individuals are counted in binary indexed tree.
+
+        :param scores: list of objective scores.
+        :return: list of numbers of dominating individuals.
+        """
+        values = sorted(set(score[1] for score in scores))
+        positions = {value: idx + 1 for idx, value in enumerate(values)}
+        tree = [0] * (len(values) + 1)
+        order = sorted(range(len(scores)), key=lambda i: scores[i])
+        equals = {}
+        for score in scores:
+            equals[score] = equals.get(score, 0) + 1
+
+        counts = [0] * len(scores)
+        start = 0
+        while start < len(order):
+            end = start
+            while end < len(order) and scores[order[end]][0] == scores[order[start]][0]:
+                pos = positions[scores[order[end]][1]]
+                while pos < len(tree):
+                    tree[pos] += 1
+                    pos += pos & -pos
+                end += 1
+            for i in order[start:end]:
+                pos = positions[scores[i][1]]
+                num_weaker = 0
+                while pos > 0:
+                    num_weaker += tree[pos]
+                    pos -= pos & -pos
+                counts[i] = num_weaker - equals[scores[i]]
+            start = end
+        return counts
+
+    @staticmethod
+    def count_dominating(scores: List[tuple]) -> List[int]:
+        """
+        Counts individuals dominating every individual (all objective scores are less or equal and not all equal).
+        Bookkeeping of pairwise comparisons as in Deb's fast non-dominated sorting for any number of objectives.
+
+        :param scores: list of objective scores.
+        :return: list of numbers of dominating individuals.
+        """
+        counts = [0] * len(scores)
+        for i in range(len(scores)):
+            x_score = scores[i]
+            for j in range(i + 1, len(scores)):
+                y_score = scores[j]
+                if x_score == y_score:
+                    continue
+                if all(x_value >= y_value for x_value, y_value in zip(x_score, y_score)):
+                    counts[i] += 1
+                elif all(x_value <= y_value for x_value, y_value in zip(x_score, y_score)):
+                    counts[j] += 1
+        return counts
 
     def assign_ranks(self, ga_data: MultiGaData) -> None:
         """
-        Assigns a rank to every individual in population equal to 1 + number of individuals dominating it
+        Assigns a rank to every individual in population equal to 1 + number of individuals dominating it, objective
+        scores of individuals are used, so objective function is not called again.
 
         :return: None
         """
-        for individ in ga_data.population:
-            individ['rank'] = 1
+        scores = [tuple(individ['obj_score']) for individ in ga_data.population]
+        if len(scores) > 0 and len(scores[0]) == 2:
+            counts = self.count_dominating_2d(scores)
+        else:
+            counts = self.count_dominating(scores)
+        for individ, count in zip(ga_data.population, counts):
+            individ['rank'] = 1 + count
+
+    def prepare_fitness(self, ga_data: MultiGaData) -> None:
+        """
+        Assigns ranks after objective scores of all individuals are set.
 
-        for i in range(len(ga_data.population)):
-            for j in range(i+1, len(ga_data.population)):
-                inf = self.inferior(ga_data.population[i], ga_data.population[j])
-                if inf is not None:
-                    inf['rank'] += 1
+        :param ga_data: MultiGaData instance containing population and related data.
+        :return: None.
+        """
+        self.assign_ranks(ga_data)
 
     def execute(self, ga_data: MultiGaData) -> None:
         """
@@ -138,8 +215,4 @@ class MultiFitness(BaseFitness):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        if ga_data.population.is_phenotype:
-            ga_data.population.get_phenotype()
-        self.assign_ranks(ga_data)
-
-        super().execute(ga_data)
\ No newline at end of file
+        super().execute(ga_data)
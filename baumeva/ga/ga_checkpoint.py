@@ -0,0 +1,329 @@
+import os
+import pickle
+import tempfile
+from array import array
+from copy import copy
+from time import perf_counter
+from typing import Any, Optional, Union
+from .ga_data import GaData
+from .populations import BasePopulation
+from .ga_engine import GaEngine
+from .random_component import RandomComponent
+
+
+class GaCheckpoint:
+    """
+    Class for saving state of genetic algorithm run to file and resuming it. Checkpoint adds hook after every generation
+    to GaEngine and saves state every every_generations generations or every every_seconds seconds.
+    State is pickled: GaData (population, histories, best solution, counters, profile) and states of operators
+    (random generators, see RandomComponent.get_state()), so resumed run gives the same results as run without stop.
+    Population is stored by columns (genotype, score and other keys of individuals) in compact binary form, columns
+    of history and profile are stored as bytes of arrays.
+    Cache of fitness is not stored. File is written to temporary file and replaced atomically.
+    """
+    version: int = 2
+    missing: object = object()
+
+    def __init__(self, file_path: str, every_generations: int = None, every_seconds: float = None) -> None:
+        """
+        Initialize the GaCheckpoint instance.
+
+        :param file_path: path to checkpoint file.
+        :param every_generations: number of generations between checkpoints.
+        :param every_seconds: wall time between checkpoints, seconds.
+        :return: None
+        """
+        if every_generations is None and every_seconds is None:
+            raise Exception(f'Set every_generations or every_seconds of checkpoint')
+        self.file_path = file_path
+        self.every_generations = every_generations
+        self.every_seconds = every_seconds
+        self.engine: Union[GaEngine, None] = None
+        self.last_time: float = perf_counter()
+
+    def attach(self, engine: GaEngine) -> None:
+        """
+        Add hook of checkpoint to engine.
+
+        :param engine: GaEngine instance.
+        :return: None
+        """
+        self.engine = engine
+        self.last_time = perf_counter()
+        engine.add_hook('generation', self.after_generation, when='after')
+
+    def detach(self, engine: GaEngine) -> None:
+        """
+        Remove hook of checkpoint from engine.
+
+        :param engine: GaEngine instance.
+        :return: None
+        """
+        engine.remove_hook('generation', self.after_generation, when='after')
+        self.engine = None
+
+    def is_due(self, ga_data: GaData) -> bool:
+        """
+        Check if checkpoint has to be saved after generation.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: bool.
+        """
+        if self.every_generations is not None and ga_data.idx_generation % self.every_generations == 0:
+            return True
+        return self.every_seconds is not None and perf_counter() - self.last_time >= self.every_seconds
+
+    def after_generation(self, ga_data: GaData, stage: str) -> None:
+        """
+        Save checkpoint if it is due, hook of stage "generation".
+
+        :param ga_data: GaData instance containing population and related data.
+        :param stage: name of stage.
+        :return: None
+        """
+        if self.is_due(ga_data):
+            self.save(self.file_path, self.engine, ga_data)
+            self.last_time = perf_counter()
+
+    @staticmethod
+    def get_operators(engine: GaEngine) -> dict:
+        """
+        Get operators of stages with own random generators.
+
+        :param engine: GaEngine instance.
+        :return: dict of operators by names of stages.
+        """
+        operators = {}
+        for name, func in engine.stages:
+            operator = getattr(func, '__self__', None)
+            if isinstance(operator, RandomComponent):
+                operators[name] = operator
+        return operators
+
+    @staticmethod
+    def get_format(values: list) -> Optional[str]:
+        """
+        Get format of binary form of values: 'b' - bools, 'q' - 64-bit integers, 'n' - non-negative integers of any
+        size (packed genotypes), 'd' - floats, '01' - characters '0' and '1' (binary genotypes, one bit per value),
+        'c' - single ASCII characters.
+
+        :param values: list of values.
+        :return: format or None if values have no binary form.
+        """
+        types = set(map(type, values))
+        if types == {bool}:
+            return 'b'
+        if types == {int}:
+            if -2 ** 63 <= min(values) and max(values) < 2 ** 63:
+                return 'q'
+            return 'n' if min(values) >= 0 else None
+        if types == {float}:
+            return 'd'
+        if types == {str} and set(values) <= {'0', '1'}:
+            return '01'
+        if types == {str} and all(len(value) == 1 and value.isascii() for value in values):
+            return 'c'
+        return None
+
+    @classmethod
+    def pack_column(cls, values: list) -> dict:
+        """
+        Pack column of population to compact binary form. Lists of equal length (genotypes, phenotypes) are flattened,
+        values without binary form ("delta" records, tuples of objective scores) are kept as list.
+
+        :param values: values of individuals, missing keys are marked by GaCheckpoint.missing.
+        :return: dict: format, width of rows, size of integers (number of bits for '01'), data and mask (0 - value,
+                 1 - None, 2 - no key).
+        """
+        present = [value for value in values if value is not None and value is not cls.missing]
+        mask = bytes(0 if value is not None and value is not cls.missing else 1 if value is None else 2
+                     for value in values)
+        column = {'format': 'list', 'width': None, 'size': None, 'data': present,
+                  'mask': mask if any(mask) else None}
+        if present and all(type(value) is list for value in present) and len(present[0]) > 0 and \
+                all(len(value) == len(present[0]) for value in present):
+            column['width'] = len(present[0])
+            flat = [item for value in present for item in value]
+        else:
+            flat = present
+        value_format = cls.get_format(flat) if flat else None
+        if value_format is None:
+            column['width'] = None
+            return column
+        column['format'] = value_format
+        if value_format == 'b':
+            column['data'] = bytes(flat)
+        elif value_format == '01':
+            column['size'] = len(flat)
+            column['data'] = int(''.join(flat), 2).to_bytes((len(flat) + 7) // 8, 'little')
+        elif value_format == 'c':
+            column['data'] = ''.join(flat).encode('ascii')
+        elif value_format == 'n':
+            column['size'] = max(1, max((value.bit_length() + 7) // 8 for value in flat))
+            column['data'] = b''.join(value.to_bytes(column['size'], 'little') for value in flat)
+        else:
+            column['data'] = array(value_format, flat).tobytes()
+        return column
+
+    @classmethod
+    def unpack_column(cls, column: dict, num_rows: int) -> list:
+        """
+        Unpack column of population from binary form (see pack_column()).
+
+        :param column: packed column.
+        :param num_rows: number of individuals.
+        :return: values of individuals, missing keys are marked by GaCheckpoint.missing.
+        """
+        value_format, data = column['format'], column['data']
+        if value_format == 'b':
+            flat = [bool(value) for value in data]
+        elif value_format == '01':
+            flat = list(format(int.from_bytes(data, 'little'), 'b').zfill(column['size']))
+        elif value_format == 'c':
+            flat = list(data.decode('ascii'))
+        elif value_format == 'n':
+            flat = [int.from_bytes(data[idx:idx + column['size']], 'little')
+                    for idx in range(0, len(data), column['size'])]
+        elif value_format == 'list':
+            flat = data
+        else:
+            values = array(value_format)
+            values.frombytes(data)
+            flat = values.tolist()
+        width = column['width']
+        present = iter(flat if width is None else [flat[idx:idx + width] for idx in range(0, len(flat), width)])
+        if column['mask'] is None:
+            return list(present)
+        return [next(present) if flag == 0 else None if flag == 1 else cls.missing for flag in column['mask']]
+
+    @classmethod
+    def pack_population(cls, population: BasePopulation) -> dict:
+        """
+        Pack population: attributes (parameters, random generator) and columns of values of individuals.
+
+        :param population: population of run.
+        :return: dict: class, attributes, number of individuals and packed columns by keys.
+        """
+        columns = {}
+        for idx, individ in enumerate(population):
+            for key, value in individ.items():
+                if key not in columns:
+                    columns[key] = [cls.missing] * idx
+                columns[key].append(value)
+            for key, values in columns.items():
+                if len(values) == idx:
+                    values.append(cls.missing)
+        return {'class': type(population), 'attributes': population.__dict__, 'num_individ': len(population),
+                'columns': {key: cls.pack_column(values) for key, values in columns.items()}}
+
+    @classmethod
+    def unpack_population(cls, state: dict) -> BasePopulation:
+        """
+        Create population from packed state (see pack_population()).
+
+        :param state: packed population.
+        :return: population.
+        """
+        population = state['class']()
+        population.__dict__.update(state['attributes'])
+        columns = {key: cls.unpack_column(column, state['num_individ']) for key, column in state['columns'].items()}
+        population.extend({key: values[idx] for key, values in columns.items() if values[idx] is not cls.missing}
+                          for idx in range(state['num_individ']))
+        return population
+
+    @staticmethod
+    def pack_arrays(columns: Optional[dict]) -> Optional[dict]:
+        """
+        Pack columns of history or profile: arrays are stored as bytes, lists (pareto sets) as they are.
+
+        :param columns: dict of columns by names or None.
+        :return: dict of (typecode, data) by names or None.
+        """
+        if columns is None:
+            return None
+        return {name: (column.typecode, column.tobytes()) if isinstance(column, array) else (None, column)
+                for name, column in columns.items()}
+
+    @staticmethod
+    def unpack_arrays(columns: Optional[dict]) -> Optional[dict]:
+        """
+        Unpack columns of history or profile (see pack_arrays()).
+
+        :param columns: dict of (typecode, data) by names or None.
+        :return: dict of columns by names or None.
+        """
+        if columns is None:
+            return None
+        unpacked = {}
+        for name, (typecode, data) in columns.items():
+            if typecode is None:
+                unpacked[name] = data
+            else:
+                unpacked[name] = array(typecode)
+                unpacked[name].frombytes(data)
+        return unpacked
+
+    @classmethod
+    def save(cls, file_path: str, engine: GaEngine, ga_data: GaData) -> None:
+        """
+        Save state of run to file atomically.
+
+        :param file_path: path to checkpoint file.
+        :param engine: GaEngine of run.
+        :param ga_data: GaData instance after generation.
+        :return: None
+        """
+        population = cls.pack_population(ga_data.population)
+        history, profile = cls.pack_arrays(ga_data.history), cls.pack_arrays(ga_data.profile)
+        ga_data = copy(ga_data)
+        ga_data.population = None
+        ga_data.parents = None
+        ga_data.children = None
+        ga_data.history = None
+        ga_data.profile = None
+        state = {'version': cls.version,
+                 'stages': [name for name, _ in engine.stages],
+                 'operators': {name: operator.get_state() for name, operator in cls.get_operators(engine).items()},
+                 'ga_data': ga_data,
+                 'population': population,
+                 'history': history,
+                 'profile': profile}
+        dir_path = os.path.dirname(os.path.abspath(file_path))
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=dir_path, prefix='.checkpoint_')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, file_path: str, engine: GaEngine) -> GaData:
+        """
+        Load state of run from file: states of operators are set to engine, stages of engine have to be the same as
+        stages of saved run.
+
+        :param file_path: path to checkpoint file.
+        :param engine: GaEngine with operators of run.
+        :return: GaData of run.
+        """
+        with open(file_path, 'rb') as file:
+            state = pickle.load(file)
+        if state.get('version') != cls.version:
+            raise Exception(f'Unsupported version of checkpoint: {state.get("version")}, expected: {cls.version}')
+        stages = [name for name, _ in engine.stages]
+        if state['stages'] != stages:
+            raise Exception(f'Stages of checkpoint {state["stages"]} differ from stages of engine {stages}')
+        operators = cls.get_operators(engine)
+        for name, operator_state in state['operators'].items():
+            if name not in operators:
+                raise Exception(f'Operator of stage {name} has no random generator, checkpoint is not for this engine')
+            operators[name].set_state(operator_state)
+        ga_data = state['ga_data']
+        ga_data.population = cls.unpack_population(state['population'])
+        ga_data.history = cls.unpack_arrays(state['history'])
+        ga_data.profile = cls.unpack_arrays(state['profile'])
+        return ga_data
@@ -1,10 +1,19 @@
-from copy import deepcopy
+import csv
+from array import array
+from copy import copy
+from typing import List, Any, Union
 from .populations import BasePopulation
+from .sinks import BaseSink
 
 
 class GaData:
     """
     Class for holding and managing data related to a genetic algorithm run.
+    History is stored in arrays of floats (one value per stored generation), retention of history is set by
+    history_size (only the last generations are stored) and history_step (only every k-th generation is stored).
+    Sink gets row of history of every generation, so history of long run can be written to file with constant memory.
+    With history_size columns of history are trimmed when they reach 2 * history_size values, so retention costs
+    amortized O(1) per generation; historical_* attributes give lists of only the last history_size values.
 
     Attributes:
         idx_generation (int): Index of the current generation.
@@ -12,40 +21,112 @@ class GaData:
         population (BasePopulation): Current population of individuals.
         parents (BasePopulation): Selected parent individuals for crossover.
         children (BasePopulation): Offspring individuals produced by crossover.
-        historical_best (list): List of historical best scores for each generation.
-        historical_mediocre (list): List of historical average scores for each generation.
-        historical_worst (list): List of historical worst scores for each generation.
+        historical_best (list): Historical best scores of stored generations.
+        historical_mediocre (list): Historical median scores of stored generations.
+        historical_worst (list): Historical worst scores of stored generations.
+        historical_idx_generation (list): Indices of stored generations.
+        history (dict): Columns of history (arrays) by names: idx_generation, best, mediocre, worst, can have up to
+                        2 * history_size values.
+        history_size (int): Number of the last stored generations, None - all generations are stored.
+        history_step (int): Every history_step-th generation is stored.
+        sink (BaseSink): Sink of rows of history of every generation or None.
+        best_score (Any): Best score of the last generation.
+        statistics (dict): Statistics of scores of the last generation (see BasePopulation.get_statistics()).
         best_solution (dict): Dictionary representing the best individual solution found so far.
+        cache_hits (int): Number of objective values found in cache of fitness.
+        cache_misses (int): Number of objective values not found in cache of fitness.
+        cache_evictions (int): Number of objective values removed from cache of fitness.
+        obj_calls (int): Number of genotypes evaluated by objective function.
+        delta_calls (int): Number of genotypes evaluated by delta of objective function from score of parent.
+        profile (dict): Columns of per generation measurements (arrays of floats), filled by GaProfiler.
 
     Methods:
         get_avg_score()
         update()
+        get_profile_table()
+        save_profile()
     """
     idx_generation: int = 0
     num_generation_no_improve: int = 0
     population: BasePopulation = None
     parents: BasePopulation = None
     children: BasePopulation = None
-    historical_best: list = None
-    historical_mediocre: list = None
-    historical_worst: list = None
+    history: dict = None
+    history_size: Union[int, None] = None
+    history_step: int = 1
+    sink: Union[BaseSink, None] = None
+    best_score: Any = None
+    statistics: dict = None
     best_solution: dict = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+    obj_calls: int = 0
+    delta_calls: int = 0
+    profile: dict = None
 
-    def __init__(self, num_generations: int, children_percent: float = 0.95, early_stop: int = 10) -> None:
+    def __init__(self, num_generations: int, children_percent: float = 0.95, early_stop: int = 10,
+                 history_size: int = None, history_step: int = 1, sink: BaseSink = None) -> None:
         """
         Initialize the GaData instance.
 
         :param num_generations: number of generations the genetic algorithm will run.
         :param children_percent: percentage of children to be created as part of new offsprings.
         :param early_stop: number of consecutive generations with no improvement to trigger early stopping.
+        :param history_size: number of the last generations stored in history, None - all generations are stored.
+        :param history_step: every history_step-th generation is stored in history.
+        :param sink: subclass of BaseSink, gets row of history of every generation, example: CsvSink('history.csv').
         :return: None
         """
         self.num_generations = num_generations
         self.early_stop = early_stop
         self.children_percent = children_percent
-        self.historical_best = []
-        self.historical_mediocre = []
-        self.historical_worst = []
+        self.history_size = history_size
+        self.history_step = history_step
+        self.sink = sink
+        if self.sink is not None:
+            self.sink.reset()
+        self.history = {'idx_generation': array('q'), 'best': array('d'), 'mediocre': array('d'),
+                        'worst': array('d')}
+
+    def get_history(self, name: str) -> Union[array, list]:
+        """
+        Get column of history retained by history_size.
+
+        :param name: name of column: 'idx_generation', 'best', 'mediocre' or 'worst'.
+        :return: column, it is copied only if it has more than history_size values.
+        """
+        column = self.history[name]
+        if self.history_size is not None and len(column) > self.history_size:
+            return column[len(column) - self.history_size:]
+        return column
+
+    @property
+    def historical_idx_generation(self) -> list:
+        return list(self.get_history('idx_generation'))
+
+    @property
+    def historical_best(self) -> list:
+        return list(self.get_history('best'))
+
+    @property
+    def historical_mediocre(self) -> list:
+        return list(self.get_history('mediocre'))
+
+    @property
+    def historical_worst(self) -> list:
+        return list(self.get_history('worst'))
+
+    @staticmethod
+    def copy_individ(individ: dict) -> dict:
+        """
+        Copy individual for best solution: values (genotype, phenotype, scores) are flat, so they are copied
+        shallowly instead of deepcopy.
+
+        :param individ: dict (or IndividView) with values of individual.
+        :return: dict with copied values.
+        """
+        return {key: copy(value) for key, value in individ.items()}
 
     def get_avg_score(self) -> float:
         """
@@ -53,38 +134,115 @@ class GaData:
 
         :return: аverage score of the population.
         """
-        avg = 0
-        for individ in self.population:
-            avg += individ['score']
-        avg /= len(self.population)
-        return avg
+        return self.population.get_statistics()['mean']
 
     def update(self) -> None:
         """
-        Update the GaData instance with information about the current generation.
+        Update the GaData instance with information about the current generation. Statistics of scores are got
+        without sorting of population.
 
         :return: None
         """
-        if not self.population.is_sorted:
-            self.population.sort_by_dict()
-
-        self.historical_best.append(self.population[-1]['score'])
-        self.historical_mediocre.append(self.population[int(len(self.population)/2)]['score'])
-        self.historical_worst.append(self.population[0]['score'])
+        self.statistics = self.population.get_statistics()
+        best_individ = self.population[self.statistics['idx_best']]
+        self.best_score = best_individ['score']
+        self.add_history(self.best_score, self.statistics['median'], self.statistics['worst'])
 
         if self.best_solution is None:
-            self.best_solution = deepcopy(self.population[-1])
+            self.best_solution = self.copy_individ(best_individ)
             self.best_solution['idx_generation'] = self.idx_generation
 
-        elif self.best_solution['score'] < self.population[-1]['score']:
-            self.best_solution = deepcopy(self.population[-1])
+        elif self.best_solution['score'] < self.best_score:
+            self.best_solution = self.copy_individ(best_individ)
             self.best_solution['idx_generation'] = self.idx_generation
             self.num_generation_no_improve = 0
         else:
             self.num_generation_no_improve += 1
 
+        if self.sink is not None:
+            self.sink.write(self.get_history_row())
         self.idx_generation += 1
 
+    def get_history_columns(self) -> list:
+        """
+        Get columns of history, they are changed together by retention of history.
+
+        :return: list of columns.
+        """
+        return list(self.history.values())
+
+    def add_history(self, best: Any, mediocre: Any, worst: Any) -> None:
+        """
+        Add the current generation to history according to retention: every history_step-th generation is stored,
+        only history_size last stored generations are kept. Columns are trimmed to history_size values when they
+        reach 2 * history_size values, so old values are removed once per history_size generations.
+
+        :param best: best value of generation for historical_best.
+        :param mediocre: median score of generation.
+        :param worst: worst score of generation.
+        :return: None
+        """
+        if self.idx_generation % self.history_step != 0:
+            return
+        self.history['idx_generation'].append(self.idx_generation)
+        self.history['best'].append(best)
+        self.history['mediocre'].append(mediocre)
+        self.history['worst'].append(worst)
+        if self.history_size is not None and len(self.history['idx_generation']) >= 2 * max(self.history_size, 1):
+            num_removed = len(self.history['idx_generation']) - self.history_size
+            for column in self.get_history_columns():
+                del column[:num_removed]
+
+    def get_history_row(self) -> dict:
+        """
+        Get row of history of the current generation for sink.
+
+        :return: dict of values by names of columns.
+        """
+        return {'idx_generation': self.idx_generation,
+                'best': self.best_score,
+                'mediocre': self.statistics['median'],
+                'worst': self.statistics['worst'],
+                'mean': self.statistics['mean'],
+                'std': self.statistics['std'],
+                'feasible_ratio': self.statistics['feasible_ratio'],
+                'num_generation_no_improve': self.num_generation_no_improve,
+                'obj_calls': self.obj_calls}
+
+    def close_sink(self) -> None:
+        """
+        Close file of sink, it is opened again by the next row.
+
+        :return: None
+        """
+        if self.sink is not None:
+            self.sink.close()
+
+    def get_profile_table(self) -> List[dict]:
+        """
+        Get measurements of profile as table, one row for every generation.
+
+        :return: list of rows, row is dict with column names as keys.
+        """
+        if self.profile is None:
+            return []
+        columns = list(self.profile.keys())
+        return [dict(zip(columns, row)) for row in zip(*self.profile.values())]
+
+    def save_profile(self, file_path: str) -> None:
+        """
+        Save measurements of profile to csv file, one row for every generation.
+
+        :param file_path: path to csv file.
+        :return: None
+        """
+        if self.profile is None:
+            raise Exception(f'Profile is empty, attach GaProfiler to engine before optimization')
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.profile.keys())
+            writer.writerows(zip(*self.profile.values()))
+
     def print_best_solution(self) -> None:
         """
         Method for print params of the best individ.
@@ -0,0 +1,334 @@
+from time import perf_counter
+from typing import Callable, List, Iterator, Union
+from .ga_data import GaData
+from .ga_snapshot import GaSnapshot
+from .fitness import BaseFitness
+from .selections import BaseSelection
+from .crossovers import BaseCrossover
+from .mutations import BaseMutation
+from .new_generation import NewGeneration
+from .random_component import RandomComponent
+from baumeva.seed_sequence import SeedSequence
+
+
+class GaEngine:
+    """
+    Class for performing the generation loop of a genetic algorithm. Generation is a pipeline of stages, every stage
+    is a function of GaData, functions can be called before and after every stage with hooks.
+    Hooks of stage "generation" are called before and after every generation.
+    Run can be performed generation by generation with iterate() or next_generation(), state of run is stored in
+    GaData, so it can be resumed by next call.
+
+    Attributes:
+        stages (list): list of [name, function] pairs in order of execution.
+        hooks (dict): lists of hooks by (when, stage) keys, when is "before" or "after".
+        fitness (BaseFitness): fitness of GA, is shut down at the end of optimization.
+        is_cancelled (bool): if True iterate() stops before next generation, is set by cancel().
+        stop_reason (str): reason of the last stop of iterate(): "num_generations", "early_stop", "cancel",
+                           "max_time", "max_evaluations", None if iteration was not finished by engine.
+    """
+    stage_names: tuple = ('selection', 'crossover', 'mutation', 'new_generation', 'fitness', 'update')
+    first_stage_names: tuple = ('fitness', 'update')
+
+    def __init__(self,
+                 fitness: BaseFitness = None,
+                 selection: BaseSelection = None,
+                 crossover: BaseCrossover = None,
+                 mutation: BaseMutation = None,
+                 new_generation: NewGeneration = None) -> None:
+        """
+        Initialize the GaEngine instance, operators can be set later with set_operators().
+
+        :param fitness: initialized subclass of BaseFitness.
+        :param selection: initialized subclass of BaseSelection.
+        :param crossover: initialized subclass of BaseCrossover.
+        :param mutation: initialized subclass of BaseMutation.
+        :param new_generation: initialized class NewGeneration.
+        :return: None
+        """
+        self.fitness = None
+        self.is_cancelled = False
+        self.stop_reason = None
+        self.stages: List[list] = [[name, None] for name in self.stage_names]
+        self.hooks: dict = {}
+        self.set_stage('update', self.update)
+        self.set_operators(fitness=fitness, selection=selection, crossover=crossover, mutation=mutation,
+                           new_generation=new_generation)
+
+    def set_operators(self,
+                      fitness: BaseFitness = None,
+                      selection: BaseSelection = None,
+                      crossover: BaseCrossover = None,
+                      mutation: BaseMutation = None,
+                      new_generation: NewGeneration = None) -> None:
+        """
+        Set operators of GA as functions of stages, operators equal None are not changed.
+
+        :param fitness: initialized subclass of BaseFitness.
+        :param selection: initialized subclass of BaseSelection.
+        :param crossover: initialized subclass of BaseCrossover.
+        :param mutation: initialized subclass of BaseMutation.
+        :param new_generation: initialized class NewGeneration.
+        :return: None
+        """
+        for name, operator in (('fitness', fitness), ('selection', selection), ('crossover', crossover),
+                               ('mutation', mutation), ('new_generation', new_generation)):
+            if operator is not None:
+                self.set_stage(name, operator.execute)
+        if fitness is not None:
+            self.fitness = fitness
+
+    def set_seed(self, seed_sequence: SeedSequence) -> None:
+        """
+        Set own random generators of operators: every stage gets next child of seed sequence in order of pipeline,
+        so stages do not share random state.
+
+        :param seed_sequence: SeedSequence of engine.
+        :return: None
+        """
+        for (_, func), child in zip(self.stages, seed_sequence.spawn(len(self.stages))):
+            operator = getattr(func, '__self__', None)
+            if isinstance(operator, RandomComponent):
+                operator.set_seed(child)
+
+    def get_stage_idx(self, name: str) -> int:
+        """
+        Get index of stage in pipeline.
+
+        :param name: name of stage.
+        :return: index of stage.
+        """
+        for idx, (stage_name, _) in enumerate(self.stages):
+            if stage_name == name:
+                return idx
+        raise Exception(f'Unknown stage: {name}, stages: {[stage[0] for stage in self.stages]}')
+
+    def set_stage(self, name: str, func: Callable[[GaData], None]) -> None:
+        """
+        Replace function of stage.
+
+        :param name: name of stage.
+        :param func: function of GaData.
+        :return: None
+        """
+        self.stages[self.get_stage_idx(name)][1] = func
+
+    def add_stage(self, name: str, func: Callable[[GaData], None], before: str = 'update') -> None:
+        """
+        Add new stage to pipeline of generation.
+
+        :param name: name of new stage.
+        :param func: function of GaData.
+        :param before: name of stage, new stage is executed before it. If None, new stage is the last one.
+        :return: None
+        """
+        if name in [stage[0] for stage in self.stages] or name == 'generation':
+            raise Exception(f'Stage {name} already exists')
+        idx = len(self.stages) if before is None else self.get_stage_idx(before)
+        self.stages.insert(idx, [name, func])
+
+    def add_hook(self, stage: str, hook: Callable[[GaData, str], None], when: str = 'after') -> None:
+        """
+        Add hook to stage, hook gets GaData and name of stage.
+
+        :param stage: name of stage or "generation".
+        :param hook: function of GaData and name of stage.
+        :param when: "before" or "after" stage.
+        :return: None
+        """
+        if when not in ('before', 'after'):
+            raise Exception(f'when must be equal "before" or "after", not {when}')
+        if stage != 'generation':
+            self.get_stage_idx(stage)
+        self.hooks.setdefault((when, stage), []).append(hook)
+
+    def remove_hook(self, stage: str, hook: Callable[[GaData, str], None], when: str = 'after') -> None:
+        """
+        Remove hook from stage.
+
+        :param stage: name of stage or "generation".
+        :param hook: function added with add_hook().
+        :param when: "before" or "after" stage.
+        :return: None
+        """
+        hooks = self.hooks.get((when, stage), [])
+        if hook not in hooks:
+            raise Exception(f'Hook {hook} is not added {when} stage {stage}')
+        hooks.remove(hook)
+        if len(hooks) == 0:
+            del self.hooks[(when, stage)]
+
+    def run_hooks(self, when: str, stage: str, ga_data: GaData) -> None:
+        """
+        Call hooks of stage.
+
+        :param when: "before" or "after" stage.
+        :param stage: name of stage or "generation".
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        for hook in self.hooks.get((when, stage), ()):
+            hook(ga_data, stage)
+
+    def run_stages(self, ga_data: GaData, names: tuple = None) -> None:
+        """
+        Perform one generation: stages of pipeline with their hooks.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param names: names of stages to perform, if None all stages are performed.
+        :return: None
+        """
+        if not self.hooks:
+            for name, func in self.stages:
+                if names is None or name in names:
+                    func(ga_data)
+            return
+
+        self.run_hooks('before', 'generation', ga_data)
+        for name, func in self.stages:
+            if names is None or name in names:
+                self.run_hooks('before', name, ga_data)
+                func(ga_data)
+                self.run_hooks('after', name, ga_data)
+        self.run_hooks('after', 'generation', ga_data)
+
+    @staticmethod
+    def update(ga_data: GaData) -> None:
+        """
+        Update history of GaData, function of stage "update".
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        ga_data.update()
+
+    @staticmethod
+    def is_stop(ga_data: GaData) -> bool:
+        """
+        Check early stopping criteria.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: bool.
+        """
+        return ga_data.num_generation_no_improve > ga_data.early_stop
+
+    def first_generation(self, ga_data: GaData) -> None:
+        """
+        Evaluate the first generation, only stages "fitness" and "update" are performed.
+
+        :param ga_data: GaData instance with filled population.
+        :return: None
+        """
+        self.run_stages(ga_data, self.first_stage_names)
+
+    def step(self, ga_data: GaData) -> None:
+        """
+        Perform one generation after the first one.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        self.run_stages(ga_data)
+
+    def check_stages(self) -> None:
+        """
+        Check that functions of all stages are set.
+
+        :return: None
+        """
+        for name, func in self.stages:
+            if func is None:
+                raise Exception(f'Operator of stage {name} is not set')
+
+    def is_finished(self, ga_data: GaData) -> bool:
+        """
+        Check if run is finished: all generations are performed or early stopping criteria is met.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: bool.
+        """
+        return ga_data.idx_generation > 0 and (ga_data.idx_generation >= ga_data.num_generations or
+                                               self.is_stop(ga_data))
+
+    def next_generation(self, ga_data: GaData) -> Union[GaSnapshot, None]:
+        """
+        Perform next generation of run: the first one or step(). Fitness is not shut down.
+
+        :param ga_data: GaData instance with filled population.
+        :return: GaSnapshot of performed generation or None if run is finished.
+        """
+        if self.is_finished(ga_data):
+            return None
+        time_start = perf_counter()
+        if ga_data.idx_generation == 0:
+            self.first_generation(ga_data)
+        else:
+            self.step(ga_data)
+        return GaSnapshot(ga_data, perf_counter() - time_start)
+
+    def cancel(self) -> None:
+        """
+        Stop iterate() before next generation, can be called from hook or other thread.
+
+        :return: None
+        """
+        self.is_cancelled = True
+
+    def get_stop_reason(self, ga_data: GaData, time_start: float, max_time: Union[float, None],
+                        max_evaluations: Union[int, None]) -> Union[str, None]:
+        """
+        Check stopping criteria of iterate().
+
+        :param ga_data: GaData instance containing population and related data.
+        :param time_start: value of perf_counter() at start of iteration.
+        :param max_time: limit of wall time of iteration in seconds or None.
+        :param max_evaluations: limit of number of objective function calls of run or None.
+        :return: reason of stop or None if next generation has to be performed.
+        """
+        if self.is_finished(ga_data):
+            return 'num_generations' if ga_data.idx_generation >= ga_data.num_generations else 'early_stop'
+        if self.is_cancelled:
+            return 'cancel'
+        if max_time is not None and perf_counter() - time_start >= max_time:
+            return 'max_time'
+        if max_evaluations is not None and ga_data.obj_calls >= max_evaluations:
+            return 'max_evaluations'
+        return None
+
+    def iterate(self, ga_data: GaData, max_time: float = None, max_evaluations: int = None) -> Iterator[GaSnapshot]:
+        """
+        Perform genetic algorithm on GaData generation by generation, GaSnapshot is yielded after every generation.
+        Run is continued from state of GaData, so it can be resumed by next call after stop or break of loop.
+        Fitness is shut down and file of sink of GaData is closed when iteration is finished or closed.
+
+        :param ga_data: GaData instance with filled population.
+        :param max_time: limit of wall time of this iteration in seconds, checked before every generation.
+        :param max_evaluations: limit of number of objective function calls of run (ga_data.obj_calls), checked
+                                before every generation.
+        :return: iterator of GaSnapshot.
+        """
+        self.check_stages()
+        self.is_cancelled = False
+        self.stop_reason = None
+        time_start = perf_counter()
+        try:
+            while True:
+                self.stop_reason = self.get_stop_reason(ga_data, time_start, max_time, max_evaluations)
+                if self.stop_reason is not None:
+                    break
+                yield self.next_generation(ga_data)
+        finally:
+            if self.fitness is not None:
+                self.fitness.shutdown()
+            ga_data.close_sink()
+
+    def optimize(self, ga_data: GaData) -> GaData:
+        """
+        Perform genetic algorithm on GaData with filled population.
+
+        :param ga_data: GaData instance with filled population.
+        :return: GaData
+        """
+        for _ in self.iterate(ga_data):
+            pass
+        return ga_data
@@ -0,0 +1,143 @@
+import tracemalloc
+from array import array
+from time import perf_counter
+from .ga_data import GaData
+from .ga_engine import GaEngine
+
+
+class GaProfiler:
+    """
+    Class for measuring stages of genetic algorithm. Profiler adds hooks to GaEngine and stores measurements of every
+    generation in GaData.profile: dict of arrays with columns:
+        idx_generation - index of generation;
+        time - wall time of generation, seconds;
+        <stage>_time - wall time of every stage, seconds;
+        obj_calls, delta_calls, cache_hits, cache_misses - numbers of objective function calls, delta evaluations
+        and cache hits/misses in generation;
+        memory, <stage>_memory - peak of allocated memory in generation and stages, bytes, only if is_memory
+        (Python < 3.9 has no tracemalloc.reset_peak(), so change of allocated memory is measured instead of peak).
+    Without profiler engine has no hooks, so measurements cost nothing.
+    """
+
+    def __init__(self, is_memory: bool = False) -> None:
+        """
+        Initialize the GaProfiler instance.
+
+        :param is_memory: if True, peak allocation is measured with tracemalloc, it slows down GA.
+        :return: None
+        """
+        self.is_memory = is_memory
+        self.stage_names: list = []
+        self.row: dict = {}
+        self.start_time: float = 0
+        self.start_memory: int = 0
+        self.counters: tuple = (0, 0, 0, 0)
+        self.is_tracing: bool = False
+
+    def get_columns(self) -> list:
+        """
+        Get names of columns of profile.
+
+        :return: list of column names.
+        """
+        columns = ['idx_generation', 'time'] + [f'{name}_time' for name in self.stage_names]
+        columns += ['obj_calls', 'delta_calls', 'cache_hits', 'cache_misses']
+        if self.is_memory:
+            columns += ['memory'] + [f'{name}_memory' for name in self.stage_names]
+        return columns
+
+    def attach(self, engine: GaEngine) -> None:
+        """
+        Add hooks of profiler to every stage of engine.
+
+        :param engine: GaEngine instance.
+        :return: None
+        """
+        self.stage_names = [stage[0] for stage in engine.stages]
+        engine.add_hook('generation', self.before_generation, when='before')
+        engine.add_hook('generation', self.after_generation, when='after')
+        for name in self.stage_names:
+            engine.add_hook(name, self.before_stage, when='before')
+            engine.add_hook(name, self.after_stage, when='after')
+
+    def detach(self, engine: GaEngine) -> None:
+        """
+        Remove hooks of profiler from engine.
+
+        :param engine: GaEngine instance.
+        :return: None
+        """
+        engine.remove_hook('generation', self.before_generation, when='before')
+        engine.remove_hook('generation', self.after_generation, when='after')
+        for name in self.stage_names:
+            engine.remove_hook(name, self.before_stage, when='before')
+            engine.remove_hook(name, self.after_stage, when='after')
+        if self.is_tracing:
+            tracemalloc.stop()
+            self.is_tracing = False
+
+    def before_generation(self, ga_data: GaData, stage: str) -> None:
+        """
+        Start measurements of generation.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param stage: name of stage.
+        :return: None
+        """
+        if ga_data.profile is None:
+            ga_data.profile = {column: array('d') for column in self.get_columns()}
+        if self.is_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.is_tracing = True
+        self.row = dict.fromkeys(ga_data.profile, 0)
+        self.row['idx_generation'] = ga_data.idx_generation
+        self.counters = (ga_data.obj_calls, ga_data.cache_hits, ga_data.cache_misses, ga_data.delta_calls)
+        self.start_time = perf_counter()
+
+    def after_generation(self, ga_data: GaData, stage: str) -> None:
+        """
+        Finish measurements of generation and append them to profile.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param stage: name of stage.
+        :return: None
+        """
+        self.row['time'] = perf_counter() - self.start_time
+        self.row['obj_calls'] = ga_data.obj_calls - self.counters[0]
+        self.row['cache_hits'] = ga_data.cache_hits - self.counters[1]
+        self.row['cache_misses'] = ga_data.cache_misses - self.counters[2]
+        self.row['delta_calls'] = ga_data.delta_calls - self.counters[3]
+        for column, values in ga_data.profile.items():
+            values.append(self.row.get(column, 0))
+
+    def before_stage(self, ga_data: GaData, stage: str) -> None:
+        """
+        Start measurements of stage.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param stage: name of stage.
+        :return: None
+        """
+        if self.is_memory:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            self.start_memory = tracemalloc.get_traced_memory()[0]
+        self.row[f'{stage}_time'] = perf_counter()
+
+    def after_stage(self, ga_data: GaData, stage: str) -> None:
+        """
+        Finish measurements of stage.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param stage: name of stage.
+        :return: None
+        """
+        self.row[f'{stage}_time'] = perf_counter() - self.row[f'{stage}_time']
+        if self.is_memory:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, 'reset_peak'):
+                memory = peak_memory - self.start_memory
+            else:
+                memory = max(current_memory - self.start_memory, 0)
+            self.row[f'{stage}_memory'] = memory
+            self.row['memory'] = max(self.row['memory'], memory)
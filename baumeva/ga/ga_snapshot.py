@@ -0,0 +1,33 @@
+from typing import Any
+from .ga_data import GaData
+
+
+class GaSnapshot:
+    """
+    Class for lightweight state of genetic algorithm run after one generation, it is yielded by GaEngine.iterate().
+    Population is not copied, best solution is a reference to best solution of GaData.
+
+    Attributes:
+        idx_generation (int): Index of the performed generation.
+        best_score (Any): Best fitness score of the generation (pareto set for MultiGaData).
+        best_solution (dict): Best individual solution found so far.
+        num_generation_no_improve (int): Number of consecutive generations with no improvement.
+        obj_calls (int): Number of genotypes evaluated by objective function from start of run.
+        time (float): Wall time of the generation in seconds.
+        ga_data (GaData): GaData of run, it is changed by next generations.
+    """
+    def __init__(self, ga_data: GaData, time: float) -> None:
+        """
+        Initialize the GaSnapshot instance.
+
+        :param ga_data: GaData instance after generation.
+        :param time: wall time of the generation in seconds.
+        :return: None
+        """
+        self.idx_generation: int = ga_data.idx_generation - 1
+        self.best_score: Any = ga_data.best_score
+        self.best_solution: dict = ga_data.best_solution
+        self.num_generation_no_improve: int = ga_data.num_generation_no_improve
+        self.obj_calls: int = ga_data.obj_calls
+        self.time: float = time
+        self.ga_data: GaData = ga_data
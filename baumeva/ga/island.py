@@ -0,0 +1,117 @@
+import traceback
+from copy import deepcopy
+from multiprocessing.connection import Connection
+from typing import List
+from .ga_data import GaData
+from .ga_engine import GaEngine
+
+
+def island_worker(connection: Connection, island: 'Island') -> None:
+    """
+    Perform island in worker process, commands are received from connection:
+        ('evolve', num_generations, migrants) - answer is ('ok', (migrants, is_stop));
+        ('finish', ) - answer is ('ok', ga_data), worker ends.
+    Exceptions are sent as ('error', traceback). Process pool of fitness (workers) is closed before worker ends.
+
+    :param connection: connection to main process.
+    :param island: Island instance.
+    :return: None
+    """
+    try:
+        island.start()
+        while True:
+            command = connection.recv()
+            if command[0] == 'evolve':
+                connection.send(('ok', island.evolve(command[1], command[2])))
+            else:
+                connection.send(('ok', island.finish()))
+                break
+    except Exception:
+        try:
+            connection.send(('error', traceback.format_exc()))
+        except OSError:
+            # main process closed connection
+            pass
+    finally:
+        island.engine.fitness.shutdown()
+        connection.close()
+
+
+class Island:
+    """
+    Class for one population of island model: GaData with own operators (GaEngine), population and operators
+    have own random generators, so islands are reproducible in any process.
+    """
+
+    def __init__(self, idx_island: int, engine: GaEngine, ga_data: GaData, num_migrants: int) -> None:
+        """
+        Initialize the Island instance.
+
+        :param idx_island: index of island.
+        :param engine: GaEngine with operators of island.
+        :param ga_data: GaData with filled population.
+        :param num_migrants: number of the best individuals sent to other island.
+        :return: None
+        """
+        self.idx_island = idx_island
+        self.engine = engine
+        self.ga_data = ga_data
+        self.num_migrants = num_migrants
+
+    def start(self) -> None:
+        """
+        Evaluate the first generation of island.
+
+        :return: None
+        """
+        self.engine.first_generation(self.ga_data)
+
+    def get_migrants(self) -> List[dict]:
+        """
+        Get copies of the best individuals of population, population is sorted for it.
+
+        :return: list of individuals.
+        """
+        if self.num_migrants == 0:
+            return []
+        if not self.ga_data.population.is_sorted:
+            self.ga_data.population.sort_by_dict()
+        return [deepcopy(individ) for individ in self.ga_data.population[-self.num_migrants:]]
+
+    def add_migrants(self, migrants: List[dict]) -> None:
+        """
+        Replace the worst individuals of population with migrants.
+
+        :param migrants: list of individuals from other island.
+        :return: None
+        """
+        if not migrants:
+            return
+        if not self.ga_data.population.is_sorted:
+            self.ga_data.population.sort_by_dict()
+        for idx, migrant in enumerate(migrants):
+            self.ga_data.population[idx] = migrant
+        self.ga_data.population.sort_by_dict()
+
+    def evolve(self, num_generations: int, migrants: List[dict]) -> tuple:
+        """
+        Add migrants and perform generations.
+
+        :param num_generations: number of generations to perform.
+        :param migrants: list of individuals from other island.
+        :return: migrants of island and early stopping criteria.
+        """
+        self.add_migrants(migrants)
+        for _ in range(num_generations):
+            self.engine.step(self.ga_data)
+        return self.get_migrants(), self.engine.is_stop(self.ga_data)
+
+    def finish(self) -> GaData:
+        """
+        Shut down fitness of island.
+
+        :return: GaData of island.
+        """
+        if self.engine.fitness is not None:
+            self.engine.fitness.shutdown()
+        return self.ga_data
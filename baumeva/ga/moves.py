@@ -0,0 +1,30 @@
+from typing import List, Tuple
+
+
+def apply_move(genotype: list, move: Tuple) -> List:
+    """
+    Apply move of combinatory mutation to genotype. Moves:
+        ('swap', idx_1, idx_2) - gens idx_1 and idx_2 are swapped;
+        ('move', idx_from, idx_to) - gen is removed from idx_from and inserted to idx_to;
+        ('inversion', idx_start, idx_end) - gens from idx_start to idx_end (inclusive) are reversed;
+        ('shift', idx_start, idx_end, idx_insert) - chain of gens idx_start:idx_end is removed and inserted to
+                                                    idx_insert of the rest genotype.
+
+    :param genotype: list of gens, it is changed in place when it is possible.
+    :param move: tuple, name of move and its indices.
+    :return: genotype after move.
+    """
+    name = move[0]
+    if name == 'swap':
+        genotype[move[1]], genotype[move[2]] = genotype[move[2]], genotype[move[1]]
+    elif name == 'move':
+        genotype.insert(move[2], genotype.pop(move[1]))
+    elif name == 'inversion':
+        genotype[move[1]:move[2] + 1] = genotype[move[1]:move[2] + 1][::-1]
+    elif name == 'shift':
+        chain = genotype[move[1]:move[2]]
+        del genotype[move[1]:move[2]]
+        genotype[move[3]:move[3]] = chain
+    else:
+        raise Exception(f'Unknown move: {move}, moves: "swap", "move", "inversion", "shift"')
+    return genotype
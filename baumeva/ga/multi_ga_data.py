@@ -1,6 +1,6 @@
-from copy import deepcopy
-from typing import List, Union
+from typing import Any, List, Union
 from .ga_data import GaData
+from .sinks import BaseSink
 
 
 class MultiGaData(GaData):
@@ -8,16 +8,23 @@ class MultiGaData(GaData):
     Class for holding and managing data related to a genetic algorithm run in multiple objective optimization case.
     """
 
-    def __init__(self, num_generations: int, children_percent: float = 0.95, early_stop: int = 10) -> None:
+    def __init__(self, num_generations: int, children_percent: float = 0.95, early_stop: int = 10,
+                 history_size: int = None, history_step: int = 1, sink: BaseSink = None) -> None:
         """
-        Initialize the MultiGaData instance.
+        Initialize the MultiGaData instance. History is stored in lists (historical_best is list of pareto sets),
+        sink gets size of pareto set. Pareto sets of all stored generations are kept, so memory of history is
+        constant only with history_size.
 
         :param num_generations: number of generations the genetic algorithm will run.
         :param children_percent: percentage of children to be created as part of new offsprings.
         :param early_stop: number of consecutive generations with no improvement to trigger early stopping.
+        :param history_size: number of the last generations stored in history, None - all generations are stored.
+        :param history_step: every history_step-th generation is stored in history.
+        :param sink: subclass of BaseSink, gets row of history of every generation, example: CsvSink('history.csv').
         :return: None
         """
-        super().__init__(num_generations, children_percent, early_stop)
+        super().__init__(num_generations, children_percent, early_stop, history_size, history_step, sink)
+        self.history.update(best=[], mediocre=[], worst=[])
 
     def get_avg_score(self) -> float:
         """
@@ -48,20 +55,48 @@ class MultiGaData(GaData):
             else:
                 break
 
-        self.historical_best.append(pareto_set)
+        self.best_score = pareto_set
+        self.add_history(pareto_set, self.population[int(len(self.population)/2)]['score'], self.population[0]['score'])
 
         if self.best_solution is None:
             self.best_solution = {'pareto_set':[]}
 
         if self.best_solution['pareto_set'] != pareto_set:
-            self.best_solution['pareto_set'] = deepcopy(pareto_set)
+            self.best_solution['pareto_set'] = [self.copy_individ(individ) for individ in pareto_set]
             self.best_solution['idx_generation'] = self.idx_generation
             self.num_generation_no_improve = 0
         else:
             self.num_generation_no_improve += 1
 
+        if self.sink is not None:
+            self.sink.write(self.get_history_row())
         self.idx_generation += 1
 
+    def add_history(self, best: Any, mediocre: Any, worst: Any) -> None:
+        """
+        Add the current generation to history (see GaData.add_history()), pareto set is stored as copies of
+        individuals, so history does not keep populations alive.
+
+        :param best: pareto set of generation.
+        :param mediocre: median score of generation.
+        :param worst: worst score of generation.
+        :return: None
+        """
+        if self.idx_generation % self.history_step == 0:
+            best = [self.copy_individ(individ) for individ in best]
+        super().add_history(best, mediocre, worst)
+
+    def get_history_row(self) -> dict:
+        """
+        Get row of history of the current generation for sink, best is size of pareto set.
+
+        :return: dict of values by names of columns.
+        """
+        return {'idx_generation': self.idx_generation,
+                'best': len(self.best_score),
+                'num_generation_no_improve': self.num_generation_no_improve,
+                'obj_calls': self.obj_calls}
+
     @staticmethod
     def print_list(head, lst, label) -> None:
         print(f'\t{head}:')
@@ -22,6 +22,8 @@ class MultiNewGeneration(NewGeneration):
                 elites.append(individ)
             else:
                 break
+        if self.is_unique:
+            elites = self.get_unique(ga_data, elites, self.get_seen(ga_data))
 
         return elites
 
@@ -32,6 +34,8 @@ class MultiNewGeneration(NewGeneration):
         :param ga_data: MultiGaData instance containing population and related data.
         :return: None
         """
+        if self.is_unique:
+            self.remove_clones(ga_data)
         ga_data.children.__dict__ = ga_data.population.__dict__
         if ga_data.population.is_phenotype:
             ga_data.population.get_phenotype()
@@ -6,3 +6,4 @@ from .movement_mutation import MovementMutation
 from .shift_mutation import ShiftMutation
 from .bin_string_mutation import BinStringMutation
 from .categorical_mutation import CategoricalMutation
+from .packed_bin_string_mutation import PackedBinStringMutation
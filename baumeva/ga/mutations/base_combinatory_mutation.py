@@ -1,13 +1,15 @@
 from abc import abstractmethod
 from typing import Union
-from random import randint
 from .base_mutation import BaseMutation
 from baumeva.ga import GaData
+from baumeva.ga.moves import apply_move
 
 
 class BaseCombinatoryMutation(BaseMutation):
     """
-    Abstract class for implementing combinatory mutation operations in a genetic algorithm.
+    Abstract class for implementing combinatory mutation operations in a genetic algorithm. Mutation is a move
+    (see baumeva.ga.moves.apply_move), moves are recorded to children with "delta" record (copies of parents),
+    so fitness can get objective value of child as value of parent plus delta of moves.
     Inherits from BaseMutation.
     """
 
@@ -48,11 +50,26 @@ class BaseCombinatoryMutation(BaseMutation):
 
         :return: True if mutation should be performed, False otherwise.
         """
-        if randint(0, self.rnd_samples-1) <= self.mutation_lvl * self.rnd_samples:
+        if self.rnd.randint(0, self.rnd_samples-1) <= self.mutation_lvl * self.rnd_samples:
             return True
         else:
             return False
 
+    @staticmethod
+    def move(child: dict, move: tuple) -> dict:
+        """
+        Apply move to genotype of child and record it.
+
+        :param child: a dictionary representing the child individual.
+        :param move: tuple, name of move and its indices.
+        :return: the mutated child individual.
+        """
+        child['genotype'] = apply_move(child['genotype'], move)
+        record = child.get('delta')
+        if record is not None:
+            record['moves'].append(move)
+        return child
+
     @abstractmethod
     def get_mutation(self, child: dict) -> dict:
         """
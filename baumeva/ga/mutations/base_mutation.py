@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Union
-from baumeva.ga import GaData
+from baumeva.ga import GaData, RandomComponent
 
 
-class BaseMutation(ABC):
+class BaseMutation(RandomComponent, ABC):
     """
     Abstract class for implementing mutation operations in a genetic algorithm.
     """
@@ -1,10 +1,22 @@
-from typing import Union
-from random import randint
+from itertools import groupby
+from math import floor, log
+from typing import List, Union
 from .base_mutation import BaseMutation
-from baumeva.ga import GaData
+from baumeva.ga import GaData, ArrayPopulation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class BinStringMutation(BaseMutation):
+    """
+    A class for implementing binary mutation: every bit of children is flipped with probability of mutation.
+    Bits of all children of generation are one stream, positions of flipped bits are got by geometric gaps between
+    them, so number of random calls is proportional to number of flipped bits, not to number of all bits.
+    Inherits from BaseMutation.
+    """
 
     def __init__(self, mutation_lvl: Union[str, float] = 'normal') -> None:
         """
@@ -56,11 +68,51 @@ class BinStringMutation(BaseMutation):
 
         :return: True if mutation should be performed, False otherwise.
         """
-        if randint(0, self.rnd_samples-1) <= self.mutation_lvl * self.rnd_samples:
+        if self.rnd.randint(0, self.rnd_samples-1) <= self.mutation_lvl * self.rnd_samples:
             return True
         else:
             return False
 
+    def get_flip_probability(self) -> float:
+        """
+        Get probability of flip of one bit, it is equal to probability of determines_mutation().
+
+        :return: probability.
+        """
+        return min(1.0, (floor(self.mutation_lvl * self.rnd_samples) + 1) / self.rnd_samples)
+
+    def get_positions(self, num_bits: int) -> List[int]:
+        """
+        Get positions of flipped bits: gaps between them have geometric distribution, so every bit is flipped
+        independently with probability of get_flip_probability().
+
+        :param num_bits: number of bits.
+        :return: increasing list of positions.
+        """
+        probability = self.get_flip_probability()
+        if probability >= 1:
+            return list(range(num_bits))
+        log_q = log(1 - probability)
+        positions = []
+        pos = int(log(1 - self.rnd.random()) / log_q)
+        while pos < num_bits:
+            positions.append(pos)
+            pos += 1 + int(log(1 - self.rnd.random()) / log_q)
+        return positions
+
+    def flip_bits(self, child: dict, positions: List[int]) -> None:
+        """
+        Flip bits of child genotype.
+
+        :param child: A dictionary representing the child individual.
+        :param positions: positions of flipped bits.
+        :return: None.
+        """
+        genotype = child['genotype']
+        for i_gen in positions:
+            genotype[i_gen] = '1' if genotype[i_gen] == '0' else '0'
+        child['genotype'] = genotype
+
     def get_mutation(self, child: dict) -> None:
         """
         Perform binary mutation on a child individual.
@@ -68,13 +120,24 @@ class BinStringMutation(BaseMutation):
         :param child: A dictionary representing the child individual.
         :return: None.
         """
-        for i_gen, gen in enumerate(child['genotype']):
-            is_mutation = self.determines_mutation()
-            if is_mutation:
-                if gen == '0':
-                    child['genotype'][i_gen] = '1'
-                else:
-                    child['genotype'][i_gen] = '0'
+        self.flip_bits(child, self.get_positions(len(child['genotype'])))
+
+    def mutate_array(self, children: ArrayPopulation, positions: List[int], len_individ: int) -> bool:
+        """
+        Flip bits of all children stored in array by one xor with mask of positions.
+
+        :param children: ArrayPopulation of children.
+        :param positions: positions of flipped bits in stream of all children.
+        :param len_individ: number of bits of individual.
+        :return: False if genotypes are not stored in array of one-char strings, True otherwise.
+        """
+        column = children.columns.get('genotype')
+        if column is None or column.kind != 'S' or column.width != len_individ:
+            return False
+        mask = np.zeros((len(children), len_individ), dtype=np.uint8)
+        mask.ravel()[positions] = ord('0') ^ ord('1')
+        column.data[:len(children)] ^= mask
+        return True
 
     def execute(self, ga_data: GaData) -> None:
         """
@@ -83,6 +146,11 @@ class BinStringMutation(BaseMutation):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        self.update_mutation_lvl(ga_data.population.idx_bits[-1])
-        for child in ga_data.children:
-            self.get_mutation(child)
+        len_individ = ga_data.population.idx_bits[-1]
+        self.update_mutation_lvl(len_individ)
+        children = ga_data.children
+        positions = self.get_positions(len(children) * len_individ)
+        if isinstance(children, ArrayPopulation) and self.mutate_array(children, positions, len_individ):
+            return
+        for idx_child, child_positions in groupby(positions, key=lambda pos: pos // len_individ):
+            self.flip_bits(children[idx_child], [pos - idx_child * len_individ for pos in child_positions])
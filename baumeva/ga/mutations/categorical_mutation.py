@@ -1,5 +1,4 @@
 from typing import Union
-from random import randint, choice, randrange
 from .base_mutation import BaseMutation
 from baumeva.ga import GaData
 
@@ -56,7 +55,7 @@ class CategoricalMutation(BaseMutation):
 
         :return: True if mutation should be performed, False otherwise.
         """
-        if randint(0, self.rnd_samples - 1) <= self.mutation_lvl * self.rnd_samples:
+        if self.rnd.randint(0, self.rnd_samples - 1) <= self.mutation_lvl * self.rnd_samples:
             return True
         else:
             return False
@@ -69,20 +68,22 @@ class CategoricalMutation(BaseMutation):
         :param gen_pool: A tuple, gens attribute from population class
         :return: None.
         """
-        for i_gen, gen in enumerate(child['genotype']):
+        genotype = child['genotype']
+        for i_gen, gen in enumerate(genotype):
             is_mutation = self.determines_mutation()
             if is_mutation:
                 if isinstance(gen_pool[i_gen], list):
                     if len(gen_pool[i_gen]) > 1:
-                        child['genotype'][i_gen] = choice([x for x in gen_pool[i_gen] if x != child['genotype'][i_gen]])
+                        genotype[i_gen] = self.rnd.choice([x for x in gen_pool[i_gen] if x != genotype[i_gen]])
                     else:
                         continue
                 else:
                     if len(range(gen_pool[i_gen][0], gen_pool[i_gen][1]+1, gen_pool[i_gen][2])) > 1:
-                        child['genotype'][i_gen] = \
-                            choice([x for x in range(gen_pool[i_gen][0], gen_pool[i_gen][1]+1, gen_pool[i_gen][2]) if x != child['genotype'][i_gen]])
+                        gen_range = range(gen_pool[i_gen][0], gen_pool[i_gen][1]+1, gen_pool[i_gen][2])
+                        genotype[i_gen] = self.rnd.choice([x for x in gen_range if x != genotype[i_gen]])
                     else:
                         continue
+        child['genotype'] = genotype
 
     def execute(self, ga_data: GaData) -> None:
         """
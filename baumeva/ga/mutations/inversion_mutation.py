@@ -1,4 +1,3 @@
-from random import sample
 from .base_combinatory_mutation import BaseCombinatoryMutation
 
 
@@ -15,17 +14,6 @@ class InversionMutation(BaseCombinatoryMutation):
         :param child: A dictionary representing the child individual.
         :return: The mutated child individual.
         """
-
-        idx_segment = sample(range(0, len(child['genotype'])), 2)
+        idx_segment = self.rnd.sample(range(0, len(child['genotype'])), 2)
         idx_segment.sort()
-
-        segment = child['genotype'][idx_segment[0]:idx_segment[1]+1]
-        segment.reverse()
-        left_side = child['genotype'][:idx_segment[0]]
-        right_side = child['genotype'][idx_segment[1]+1:]
-
-        child['genotype'] = left_side + segment + right_side
-        return child
-
-
-
+        return self.move(child, ('inversion', idx_segment[0], idx_segment[1]))
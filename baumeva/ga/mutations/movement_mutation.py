@@ -1,4 +1,3 @@
-from random import sample
 from .base_combinatory_mutation import BaseCombinatoryMutation
 
 
@@ -15,7 +14,5 @@ class MovementMutation(BaseCombinatoryMutation):
         :param child: A dictionary representing the child individual.
         :return: The mutated child individual.
         """
-        idx_move = sample(range(0, len(child['genotype'])), 2)
-        z = child['genotype'].pop(idx_move[0])
-        child['genotype'].insert(idx_move[1], z)
-        return child
+        idx_move = self.rnd.sample(range(0, len(child['genotype'])), 2)
+        return self.move(child, ('move', idx_move[0], idx_move[1]))
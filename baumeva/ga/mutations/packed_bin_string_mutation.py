@@ -0,0 +1,44 @@
+from typing import List
+from .bin_string_mutation import BinStringMutation
+from baumeva.ga import GaData
+
+
+class PackedBinStringMutation(BinStringMutation):
+    """
+    A class for implementing binary mutation of genotypes packed into integers (PackedBinaryPopulation),
+    flipped bits are collected into mask and flipped by one xor.
+    Inherits from BinStringMutation.
+    """
+    len_individ: int = None
+
+    def flip_bits(self, child: dict, positions: List[int]) -> None:
+        """
+        Flip bits of child genotype, position 0 is the highest bit.
+
+        :param child: A dictionary representing the child individual.
+        :param positions: positions of flipped bits.
+        :return: None.
+        """
+        mask = 0
+        for i_gen in positions:
+            mask |= 1 << (self.len_individ - 1 - i_gen)
+        child['genotype'] ^= mask
+
+    def get_mutation(self, child: dict) -> None:
+        """
+        Perform binary mutation on a child individual.
+
+        :param child: A dictionary representing the child individual.
+        :return: None.
+        """
+        self.flip_bits(child, self.get_positions(self.len_individ))
+
+    def execute(self, ga_data: GaData) -> None:
+        """
+        Execute the mutation operation.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        self.len_individ = ga_data.population.idx_bits[-1]
+        super().execute(ga_data)
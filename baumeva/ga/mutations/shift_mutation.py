@@ -1,4 +1,3 @@
-from random import randint, choice
 from .base_combinatory_mutation import BaseCombinatoryMutation
 
 
@@ -15,15 +14,9 @@ class ShiftMutation(BaseCombinatoryMutation):
         :param child: A dictionary representing the child individual.
         :return: The mutated child individual.
         """
-
-        chain_length = randint(1, len(child['genotype']) - 2)
-        s_idx = randint(0, len(child['genotype']) - chain_length)
+        len_individ = len(child['genotype'])
+        chain_length = self.rnd.randint(1, len_individ - 2)
+        s_idx = self.rnd.randint(0, len_individ - chain_length)
         e_idx = s_idx + chain_length
-
-        chain = child['genotype'][s_idx:e_idx]
-        del child['genotype'][s_idx:e_idx]
-
-        i_idx = choice([idx for idx in range(len(child['genotype']) + 1) if idx != s_idx])
-        child['genotype'][i_idx:i_idx] = chain
-
-        return child
+        i_idx = self.rnd.choice([idx for idx in range(len_individ - chain_length + 1) if idx != s_idx])
+        return self.move(child, ('shift', s_idx, e_idx, i_idx))
@@ -1,4 +1,3 @@
-from random import sample
 from .base_combinatory_mutation import BaseCombinatoryMutation
 
 
@@ -15,9 +14,5 @@ class SwapMutation(BaseCombinatoryMutation):
         :param child: A dictionary representing the child individual.
         :return: The mutated child individual.
         """
-
-        idx_swap = sample(range(0, len(child['genotype'])), 2)
-        child['genotype'][idx_swap[0]], child['genotype'][idx_swap[1]] =\
-            child['genotype'][idx_swap[1]], child['genotype'][idx_swap[0]]
-
-        return child
+        idx_swap = self.rnd.sample(range(0, len(child['genotype'])), 2)
+        return self.move(child, ('swap', idx_swap[0], idx_swap[1]))
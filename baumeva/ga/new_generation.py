@@ -1,20 +1,25 @@
-from random import sample
 from .ga_data import GaData
+from .random_component import RandomComponent
 
 
-class NewGeneration:
+class NewGeneration(RandomComponent):
     """
-    Class for creating a new generation of individuals in a genetic algorithm.
+    Class for creating a new generation of individuals in a genetic algorithm. Best parents are found without sorting
+    of population (see BasePopulation.get_top_idx()), population is sorted only for random transfer of parents.
     """
 
-    def __init__(self, transfer_parents: str = 'best') -> None:
+    def __init__(self, transfer_parents: str = 'best', is_unique: bool = False) -> None:
         """
         Initialize the NewGeneration instance.
 
         :param transfer_parents: strategy for transferring parents to the next generation.
+        :param is_unique: if True, offspring with genotypes which are already in new generation are rejected and
+                          replaced by parent individuals or new random individuals, so new generation has no
+                          duplicate genotypes while search space has new genotypes.
         :return: None
         """
         self.transfer_parents = transfer_parents
+        self.is_unique = is_unique
         self.check_transfer_parent()
 
     def check_transfer_parent(self) -> None:
@@ -27,38 +32,130 @@ class NewGeneration:
         if self.transfer_parents not in ['best', 'random']:
             raise Exception(f'transfer_parents must be equal "best" or "random", not {self.transfer_parents}')
 
+    @staticmethod
+    def get_unique(ga_data: GaData, individuals, seen: set) -> list:
+        """
+        Get individuals whose genotypes are not in seen, the first individual with every genotype is kept.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param individuals: iterable of individuals.
+        :param seen: set of genotype keys, keys of returned individuals are added to it.
+        :return: list of individuals.
+        """
+        unique = []
+        for individ in individuals:
+            key = ga_data.population.get_genotype_key(individ['genotype'])
+            if key not in seen:
+                seen.add(key)
+                unique.append(individ)
+        return unique
+
+    def get_seen(self, ga_data: GaData) -> set:
+        """
+        Get genotype keys which elites must not have: keys of offspring in unique mode, else empty set.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: set of genotype keys.
+        """
+        if not self.is_unique:
+            return set()
+        return set(ga_data.population.get_genotype_key(individ['genotype']) for individ in ga_data.children)
+
     def add_best(self, ga_data: GaData, num_elites) -> list:
         """
-        Add best parent individuals to the offspring (elitism strategy).
+        Add best parent individuals to the offspring (elitism strategy). Population is scanned from the best
+        individual to the worst, individuals with already taken genotypes are skipped. Only the best candidates are
+        taken from population, number of candidates is increased while it is not enough.
 
         :param ga_data: GaData instance containing population and related data.
         :param num_elites: number of parent individuals to add.
         :return: list of elites to add to the population.
         """
-        elites = ga_data.population[-num_elites - 1:]
-        if ga_data.population.is_duplicate(elites):
-            loop_counter = 0
-            z_counter = 0
-            while ga_data.population.is_duplicate(elites):
-                break_out_loop = False
-                for i in range(1, len(elites)):
-                    for j in range(1, len(elites) - (i - 1)):
-                        if elites[-i]['genotype'] == elites[-i - j]['genotype']:
-                            del elites[-i - j]
-                            break_out_loop = True
-                            break
-                    if break_out_loop:
+        seen_offspring = self.get_seen(ga_data)
+        num_candidates = min(2 * (num_elites + 1), len(ga_data.population))
+        while True:
+            seen = set(seen_offspring)
+            elites = []
+            for idx in ga_data.population.get_top_idx(num_candidates):
+                individ = ga_data.population[idx]
+                key = ga_data.population.get_genotype_key(individ['genotype'])
+                if key not in seen:
+                    seen.add(key)
+                    elites.append(individ)
+                    if len(elites) == num_elites + 1:
                         break
+            if len(elites) == num_elites + 1 or num_candidates == len(ga_data.population):
+                break
+            num_candidates = min(4 * num_candidates, len(ga_data.population))
+        elites.reverse()
+        if len(elites) < num_elites + 1:
+            elites[0:0] = self.get_new_individuals(ga_data, num_elites + 1 - len(elites), seen)
 
-                z_counter += 1
-                if -num_elites - 1 - z_counter < 0:
-                    elites[0:0] = sample(ga_data.population, num_elites + 1 - len(elites))
-                    break
-                elites.insert(0, ga_data.population[-num_elites - 1 - z_counter])
+        return elites
+
+    def get_new_individuals(self, ga_data: GaData, num_individ: int, seen: set) -> list:
+        """
+        Get new random individuals with genotypes which are not in seen, they are added to the offspring in unique mode
+        when population has not enough different genotypes. Random parents (duplicates) are taken only if search space
+        has no new genotypes.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param num_individ: number of individuals.
+        :param seen: set of genotype keys, keys of new individuals are added to it.
+        :return: list of individuals.
+        """
+        individuals = []
+        for i in range(num_individ):
+            genotype = ga_data.population.get_new_genotype(seen)
+            if genotype is None:
+                individuals.extend(self.rnd.sample(ga_data.population, num_individ - len(individuals)))
+                break
+            individ = ga_data.population.get_empty_individ()
+            individ['genotype'] = genotype
+            individuals.append(individ)
+        return individuals
+
+    def remove_clones(self, ga_data: GaData) -> None:
+        """
+        Remove offspring with genotypes which are already in offspring.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        unique = self.get_unique(ga_data, ga_data.children, set())
+        if len(unique) < len(ga_data.children):
+            children = ga_data.children.get_empty_copy()
+            children.extend(unique)
+            ga_data.children = children
+
+    def add_random(self, ga_data: GaData, num_elites) -> list:
+        """
+        Add random parent individuals and the best one to the offspring, population is sorted for it.
+
+        :param ga_data: GaData instance containing population and related data.
+        :param num_elites: number of parent individuals to add.
+        :return: list of elites to add to the population.
+        """
+        if not ga_data.population.is_sorted:
+            ga_data.population.sort_by_dict()
+        if self.is_unique:
+            seen = self.get_seen(ga_data)
+            candidates = self.get_unique(ga_data, reversed(ga_data.population), seen)
+            if len(candidates) > num_elites:
+                elites = self.rnd.sample(candidates[1:], num_elites)
+                elites.append(candidates[0])
+            else:
+                elites = self.get_new_individuals(ga_data, num_elites + 1 - len(candidates), seen)
+                elites.extend(reversed(candidates))
+        else:
+            elites = self.rnd.sample(ga_data.population[:-1], num_elites)
+            loop_counter = 0
+            while ga_data.population.is_duplicate(elites):
+                elites = self.rnd.sample(ga_data.population[:-1], num_elites)
                 loop_counter += 1
                 if loop_counter >= len(ga_data.children):
                     break
-
+            elites.append(ga_data.population[-1])
         return elites
 
     def add_parents(self, ga_data: GaData, num_elites: int) -> None:
@@ -72,14 +169,7 @@ class NewGeneration:
         if self.transfer_parents == 'best':
             elites = self.add_best(ga_data, num_elites)
         else:
-            elites = sample(ga_data.population[:-1], num_elites)
-            loop_counter = 0
-            while ga_data.population.is_duplicate(elites):
-                elites = sample(ga_data.population[:-1], num_elites)
-                loop_counter += 1
-                if loop_counter >= len(ga_data.children):
-                    break
-            elites.append(ga_data.population[-1])
+            elites = self.add_random(ga_data, num_elites)
 
         ga_data.children.extend(elites)
 
@@ -90,15 +180,17 @@ class NewGeneration:
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
+        if self.is_unique:
+            self.remove_clones(ga_data)
         ga_data.children.__dict__ = ga_data.population.__dict__
-        if not ga_data.population.is_sorted:
-            ga_data.population.sort_by_dict()
 
         num_elites = ga_data.population.num_individ - len(ga_data.children)
         if num_elites > 0:
             self.add_parents(ga_data, num_elites=num_elites)
         else:
-            ga_data.children.append(ga_data.population[-1])
+            best = ga_data.population[ga_data.population.get_top_idx(1)[0]]
+            if ga_data.population.get_genotype_key(best['genotype']) not in self.get_seen(ga_data):
+                ga_data.children.append(best)
 
         ga_data.population = ga_data.children
         ga_data.population.is_sorted = False
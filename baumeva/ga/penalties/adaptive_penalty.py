@@ -36,18 +36,14 @@ class AdaptivePenalty(BasePenalty):
                 raise Exception(f'Unexpected sign for conditionals: {conditional}, please use "!=" or "<="')
             self.sum_conditional += res ** self.power
     
-    def execute(self, conditionals: List[str], values: List[float], best_individ, iter_generation: int = 0, **kwargs)\
-            -> float:
+    def get_lambda(self, best_individ, iter_generation: int = 0) -> float:
         """
-        Method for penalties score perform.
+        Method for calculating penalty coefficient depending on feasibility of the best individual.
 
-        :param values: values of conditionals. Length of values and conditional must be equals!
-        :param conditionals: list of conditionals, example: ['<=', '!=', '<=].
-                             Possible to use 2 types of conditional only: '<=', '!=';
+        :param best_individ: the best individual found so far.
         :param iter_generation: number of generation;
-        :return: self.penalty.
+        :return: coefficient.
         """
-        super().execute(conditionals, values, **kwargs)
         lambda_ = 10
         if iter_generation != 0:
             if best_individ["feasible"]:  # "b_i is the best element at generation, feasible region"
@@ -57,7 +53,35 @@ class AdaptivePenalty(BasePenalty):
             else:
                 lambda_ = lambda_
         else:
-            lambda_ = 0 
+            lambda_ = 0
+        return lambda_
+
+    def execute(self, conditionals: List[str], values: List[float], best_individ, iter_generation: int = 0, **kwargs)\
+            -> float:
+        """
+        Method for penalties score perform.
 
-        self.penalty = self.delta * lambda_ * self.sum_conditional
+        :param values: values of conditionals. Length of values and conditional must be equals!
+        :param conditionals: list of conditionals, example: ['<=', '!=', '<=].
+                             Possible to use 2 types of conditional only: '<=', '!=';
+        :param iter_generation: number of generation;
+        :return: self.penalty.
+        """
+        super().execute(conditionals, values, **kwargs)
+        self.penalty = self.delta * self.get_lambda(best_individ, iter_generation) * self.sum_conditional
         return self.penalty
+
+    def execute_batch(self, conditionals: List[str], values_list: List[List[float]], best_individ,
+                      iter_generation: int = 0, **kwargs) -> List[float]:
+        """
+        Method for penalties score perform for several individuals.
+
+        :param conditionals: list of conditionals, example: ['<=', '!=', '<=].
+        :param values_list: values of conditionals for every individual.
+        :param iter_generation: number of generation;
+        :return: list of penalties.
+        """
+        self.check_batch(conditionals, values_list)
+        lambda_ = self.get_lambda(best_individ, iter_generation)
+        return [self.delta * lambda_ * sum_conditional
+                for sum_conditional in self.get_sum_conditional_batch(conditionals, values_list)]
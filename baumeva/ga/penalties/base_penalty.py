@@ -49,3 +49,55 @@ class BasePenalty(ABC):
         self.get_sum_conditional_func(conditionals, values)
         return self.penalty
 
+    def check_batch(self, conditionals: List[str], values_list: List[List[float]]) -> None:
+        """
+        Check that every row of values has value for every conditional.
+
+        :param conditionals: list of conditionals, example: ['<=', '!=', '<=].
+        :param values_list: values of conditionals for every individual.
+        :return: None
+        """
+        for values in values_list:
+            if len(conditionals) != len(values):
+                raise Exception(f'Numbers of values and conditional must be equals, but given number of conditional:'
+                                f' {len(conditionals)} and number of values: {len(values)}')
+
+    @staticmethod
+    def get_violations(conditional: str, column: tuple) -> List[float]:
+        """
+        Get violations of one conditional for all individuals.
+
+        :param conditional: '<=' or '!='.
+        :param column: values of conditional for every individual.
+        :return: list of violations.
+        """
+        if conditional == '!=':
+            return [abs(value) for value in column]
+        elif conditional == '<=':
+            return [max(0, value) for value in column]
+        else:
+            raise Exception(f'Unexpected sign for conditionals: {conditional}, please use "!=" or "<="')
+
+    def get_sum_conditional_batch(self, conditionals: List[str], values_list: List[List[float]]) -> List[float]:
+        """
+        Sum of powered violations for every individual, calculated column by column of conditionals.
+
+        :param conditionals: list of conditionals, example: ['<=', '!=', '<=].
+        :param values_list: values of conditionals for every individual.
+        :return: list of sums.
+        """
+        sums = [0] * len(values_list)
+        for conditional, column in zip(conditionals, zip(*values_list)):
+            violations = self.get_violations(conditional, column)
+            sums = [sum_value + violation ** self.power for sum_value, violation in zip(sums, violations)]
+        return sums
+
+    def execute_batch(self, conditionals: List[str], values_list: List[List[float]], **kwargs) -> List[float]:
+        """
+        Method for penalties score perform for several individuals, by default execute() is called for every row.
+
+        :param conditionals: list of conditionals, example: ['<=', '!=', '<=].
+        :param values_list: values of conditionals for every individual.
+        :return: list of penalties.
+        """
+        return [self.execute(conditionals, values, **kwargs) for values in values_list]
@@ -37,3 +37,18 @@ class DynamicPenalty(BasePenalty):
         super().execute(conditionals, values)
         self.penalty = self.delta * ((self.c * iter_generation) ** self.alpha) * self.sum_conditional
         return self.penalty
+
+    def execute_batch(self, conditionals: List[str], values_list: List[List[Union[float, int]]],
+                      iter_generation: int = 0) -> List[float]:
+        """
+        Method for penalties score perform for several individuals.
+
+        :param conditionals: list of conditionals, example: ['<=', '!=', '<=].
+        :param values_list: values of conditionals for every individual.
+        :param iter_generation: number of generation;
+        :return: list of penalties.
+        """
+        self.check_batch(conditionals, values_list)
+        coefficient = self.delta * ((self.c * iter_generation) ** self.alpha)
+        return [coefficient * sum_conditional
+                for sum_conditional in self.get_sum_conditional_batch(conditionals, values_list)]
@@ -3,3 +3,10 @@ from .cat_population import CatPopulation
 from .order_cat_population import OrderCatPopulation
 from .binary_population import BinaryPopulation
 from .binary_gray_population import BinaryGrayPopulation
+from .array_population import ArrayPopulation, IndividView
+from .array_binary_population import ArrayBinaryPopulation
+from .array_binary_gray_population import ArrayBinaryGrayPopulation
+from .array_cat_population import ArrayCatPopulation
+from .array_order_cat_population import ArrayOrderCatPopulation
+from .packed_binary_population import PackedBinaryPopulation
+from .packed_binary_gray_population import PackedBinaryGrayPopulation
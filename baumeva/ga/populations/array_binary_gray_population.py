@@ -0,0 +1,30 @@
+from .array_binary_population import ArrayBinaryPopulation, np
+from .binary_gray_population import BinaryGrayPopulation
+
+
+class ArrayBinaryGrayPopulation(ArrayBinaryPopulation, BinaryGrayPopulation):
+    """
+    Class for representing a binary population with gray code stored in numpy arrays.
+    Inherits from ArrayBinaryPopulation and BinaryGrayPopulation.
+    """
+
+    @staticmethod
+    def decode_bits(bits):
+        """
+        Get bits of point indexes from gray code bits of gen by prefix xor.
+        :param bits: numpy array of bits of one gen, row for every individual;
+        :return: bits.
+        """
+        return np.bitwise_xor.accumulate(bits, axis=1)
+
+    @staticmethod
+    def get_empty_copy():
+        """
+        Get an empty instance of ArrayBinaryGrayPopulation.
+
+        :return: An empty instance of ArrayBinaryGrayPopulation.
+        """
+        new_population = ArrayBinaryGrayPopulation()
+        new_population.is_phenotype = True
+
+        return new_population
@@ -0,0 +1,62 @@
+from .array_population import ArrayPopulation, ArrayColumn, np
+from .binary_population import BinaryPopulation
+
+
+class ArrayBinaryPopulation(ArrayPopulation, BinaryPopulation):
+    """
+    Class for representing a binary population stored in numpy arrays.
+    Inherits from ArrayPopulation and BinaryPopulation.
+    """
+
+    @staticmethod
+    def decode_bits(bits):
+        """
+        Get bits of point indexes from bits of gen.
+        :param bits: numpy array of bits of one gen, row for every individual;
+        :return: bits.
+        """
+        return bits
+
+    def get_phenotype(self) -> None:
+        """
+        Method for adding phenotype to all new individuals at once: bits of every gen are multiplied by matrix
+        of binary weights.
+        :return: None.
+        """
+        genotype = self.columns.get('genotype')
+        if genotype is None or genotype.kind != 'S' or max(self.num_bits) > 62:
+            super().get_phenotype()
+            return
+        if 'phenotype' not in self.columns:
+            self.columns['phenotype'] = ArrayColumn(self.capacity)
+        rows = np.flatnonzero(~self.columns['phenotype'].is_set[:self.length])
+        if len(rows) == 0:
+            return
+
+        bits = genotype.data[rows] - ord('0')
+        phenotype = np.empty((len(rows), len(self.gens)))
+        for gen_idx, gen in enumerate(self.gens):
+            gen_bits = self.decode_bits(bits[:, self.idx_bits[gen_idx]:self.idx_bits[gen_idx + 1]])
+            weights = np.left_shift(1, np.arange(self.num_bits[gen_idx] - 1, -1, -1, dtype=np.int64))
+            phenotype[:, gen_idx] = gen[0] + (gen_bits @ weights) * self.real_step[gen_idx]
+        self.columns['phenotype'].set_rows(rows, phenotype, self.length)
+
+    def swap(self) -> None:
+        """
+        Method for swap genotype and phenotype, arrays are swapped without copying.
+        :return: None.
+        """
+        if 'genotype' in self.columns and 'phenotype' in self.columns:
+            self.columns['genotype'], self.columns['phenotype'] = self.columns['phenotype'], self.columns['genotype']
+
+    @staticmethod
+    def get_empty_copy():
+        """
+        Get an empty instance of ArrayBinaryPopulation.
+
+        :return: An empty instance of ArrayBinaryPopulation.
+        """
+        new_population = ArrayBinaryPopulation()
+        new_population.is_phenotype = True
+
+        return new_population
@@ -0,0 +1,18 @@
+from .array_population import ArrayPopulation
+from .cat_population import CatPopulation
+
+
+class ArrayCatPopulation(ArrayPopulation, CatPopulation):
+    """
+    Class for representing a categorical population stored in numpy arrays.
+    Inherits from ArrayPopulation and CatPopulation.
+    """
+
+    @staticmethod
+    def get_empty_copy():
+        """
+        Get an empty instance of ArrayCatPopulation.
+
+        :return: An empty instance of ArrayCatPopulation.
+        """
+        return ArrayCatPopulation()
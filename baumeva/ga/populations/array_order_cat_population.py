@@ -0,0 +1,18 @@
+from .array_population import ArrayPopulation
+from .order_cat_population import OrderCatPopulation
+
+
+class ArrayOrderCatPopulation(ArrayPopulation, OrderCatPopulation):
+    """
+    Class for representing ordered categorical population stored in numpy arrays.
+    Inherits from ArrayPopulation and OrderCatPopulation.
+    """
+
+    @staticmethod
+    def get_empty_copy():
+        """
+        Get an empty instance of ArrayOrderCatPopulation.
+
+        :return: An empty instance of ArrayOrderCatPopulation.
+        """
+        return ArrayOrderCatPopulation()
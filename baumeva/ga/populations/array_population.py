@@ -0,0 +1,586 @@
+from copy import deepcopy
+from copyreg import __newobj__
+from typing import Any, Iterable, Iterator, List, Optional, Union
+from .base_population import BasePopulation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ArrayColumn:
+    """
+    Class for storing one key of all individuals in numpy array. Numbers are stored in 1-D array, lists of numbers
+    or of one-char strings (genotype, phenotype) in rows of 2-D array, any other values in 1-D array of objects.
+    Kinds of column: 'b' - bool, 'i' - int, 'f' - float, 'S' - one-char strings, 'O' - objects, None - not defined yet.
+    """
+    __slots__ = ('kind', 'width', 'data', 'is_set')
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the ArrayColumn instance.
+
+        :param capacity: number of rows to allocate.
+        :return: None
+        """
+        self.kind: Optional[str] = None
+        self.width: Optional[int] = None
+        self.data = None
+        self.is_set = np.zeros(capacity, dtype=bool)
+
+    @staticmethod
+    def get_kind(value: Any) -> tuple:
+        """
+        Get kind of array for storing value.
+
+        :param value: value of individual.
+        :return: kind and width (length of list or None for scalar).
+        """
+        if isinstance(value, (list, tuple)):
+            types = set(map(type, value))
+            if types == {str}:
+                joined = ''.join(value)
+                if len(joined) == len(value) and joined.isascii():
+                    return 'S', len(value)
+                return 'O', len(value)
+            if types == {bool}:
+                return 'b', len(value)
+            if types == {int}:
+                return 'i', len(value)
+            if types and types <= {int, float}:
+                return 'f', len(value)
+            return 'O', len(value)
+
+        value_type = type(value)
+        if value_type is bool:
+            return 'b', None
+        if value_type is int:
+            return ('i', None) if -2 ** 63 <= value < 2 ** 63 else ('O', None)
+        if value_type is float:
+            return 'f', None
+        return 'O', None
+
+    def allocate(self, kind: str, width: Optional[int]) -> None:
+        """
+        Allocate array of given kind for all rows.
+
+        :param kind: kind of column.
+        :param width: length of stored lists or None for scalar values.
+        :return: None
+        """
+        self.kind = kind
+        self.width = width
+        dtypes = {'b': np.bool_, 'i': np.int64, 'f': np.float64, 'S': np.uint8, 'O': object}
+        if kind == 'O' or width is None:
+            self.data = np.empty(len(self.is_set), dtype=dtypes[kind])
+        else:
+            self.data = np.zeros((len(self.is_set), width), dtype=dtypes[kind])
+
+    def to_object(self, length: int) -> None:
+        """
+        Convert column to array of objects, is used when new value can not be stored in current array.
+
+        :param length: number of rows in population.
+        :return: None
+        """
+        values = [self.get(idx) for idx in range(length)]
+        self.allocate('O', self.width)
+        for idx, value in enumerate(values):
+            self.data[idx] = value
+
+    def resize(self, capacity: int) -> None:
+        """
+        Change number of allocated rows.
+
+        :param capacity: new number of rows.
+        :return: None
+        """
+        num_rows = min(capacity, len(self.is_set))
+        is_set = np.zeros(capacity, dtype=bool)
+        is_set[:num_rows] = self.is_set[:num_rows]
+        self.is_set = is_set
+        if self.data is not None:
+            data = np.zeros((capacity, ) + self.data.shape[1:], dtype=self.data.dtype)
+            data[:num_rows] = self.data[:num_rows]
+            self.data = data
+
+    def get(self, idx: int) -> Any:
+        """
+        Get value of individual.
+
+        :param idx: index of individual.
+        :return: stored value or None.
+        """
+        if not self.is_set[idx]:
+            return None
+        if self.kind == 'O':
+            return self.data[idx]
+        if self.kind == 'S':
+            return list(self.data[idx].tobytes().decode('ascii'))
+        if self.width is None:
+            return self.data[idx].item()
+        return self.data[idx].tolist()
+
+    def set(self, idx: int, value: Any, length: int) -> None:
+        """
+        Set value of individual, type of array is changed if value can not be stored in it.
+
+        :param idx: index of individual.
+        :param value: new value or None.
+        :param length: number of rows in population.
+        :return: None
+        """
+        if value is None:
+            self.is_set[idx] = False
+            if self.kind == 'O':
+                self.data[idx] = None
+            return
+
+        kind, width = self.get_kind(value)
+        if self.kind is None:
+            self.allocate(kind, width)
+        elif self.kind != 'O':
+            if width != self.width:
+                self.to_object(length)
+            elif kind != self.kind and not (self.kind == 'f' and kind == 'i'):
+                if self.kind == 'i' and kind == 'f':
+                    self.kind = 'f'
+                    self.data = self.data.astype(np.float64)
+                else:
+                    self.to_object(length)
+
+        if self.kind == 'S':
+            self.data[idx] = np.frombuffer(''.join(value).encode('ascii'), dtype=np.uint8)
+        else:
+            self.data[idx] = value
+        self.is_set[idx] = True
+
+    def set_rows(self, rows, values, length: int) -> None:
+        """
+        Set values of several individuals from numpy array.
+
+        :param rows: numpy array of indices of individuals.
+        :param values: 1-D or 2-D numpy array with values for every individual from rows.
+        :param length: number of rows in population.
+        :return: None
+        """
+        kind = {'b': 'b', 'i': 'i', 'u': 'i', 'f': 'f'}.get(values.dtype.kind)
+        width = values.shape[1] if values.ndim == 2 else None
+        if kind is None or self.kind not in (None, kind) or (self.kind is not None and width != self.width):
+            for idx, value in zip(rows, values):
+                self.set(idx, value.tolist(), length)
+            return
+        if self.kind is None:
+            self.allocate(kind, width)
+        self.data[rows] = values
+        self.is_set[rows] = True
+
+    def take(self, order, length: int) -> None:
+        """
+        Reorder first rows of column.
+
+        :param order: numpy array of indices, new order of individuals.
+        :param length: number of rows in population.
+        :return: None
+        """
+        self.is_set[:length] = self.is_set[order]
+        if self.data is not None:
+            self.data[:length] = self.data[order]
+
+    def is_numeric(self, length: int) -> bool:
+        """
+        Check that all values of population are set and stored in numeric array.
+
+        :param length: number of rows in population.
+        :return: bool.
+        """
+        return self.kind in ('b', 'i', 'f', 'S') and bool(self.is_set[:length].all())
+
+
+class IndividView:
+    """
+    Class for access to individual of ArrayPopulation, supports interface of dict.
+    Changes of values are stored in arrays of population; lists got from numeric arrays are copies, so after changing
+    of list (for example genotype) it has to be set back: child['genotype'] = genotype.
+    """
+    __slots__ = ('population', 'idx')
+
+    def __init__(self, population: 'ArrayPopulation', idx: int) -> None:
+        """
+        Initialize the IndividView instance.
+
+        :param population: population which stores individual.
+        :param idx: index of individual in population.
+        :return: None
+        """
+        self.population = population
+        self.idx = idx
+
+    def __getitem__(self, key: str) -> Any:
+        return self.population.get_value(self.idx, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.population.set_value(self.idx, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.population.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.population.columns))
+
+    def __len__(self) -> int:
+        return len(self.population.columns)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, IndividView):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return deepcopy(self.to_dict(), memo)
+
+    def keys(self):
+        return self.population.columns.keys()
+
+    def values(self) -> list:
+        return [column.get(self.idx) for column in self.population.columns.values()]
+
+    def items(self) -> list:
+        return [(key, column.get(self.idx)) for key, column in self.population.columns.items()]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.population.columns:
+            return self.population.get_value(self.idx, key)
+        return default
+
+    def to_dict(self) -> dict:
+        """
+        Get individual as dict.
+
+        :return: dict with all values of individual.
+        """
+        return dict(self.items())
+
+    def copy(self) -> dict:
+        return self.to_dict()
+
+
+class ArrayPopulation(BasePopulation):
+    """
+    Abstract class for representing a population stored in numpy arrays: one array for every key of individuals
+    (2-D array for genotype and phenotype), instead of list of dicts. Individuals are accessed through IndividView,
+    so all operators work with ArrayPopulation as with list of dicts. Requires numpy.
+    """
+    __slots__ = ('columns', 'length', 'capacity')
+
+    def __init__(self) -> None:
+        if np is None:
+            raise Exception(f'{self.__class__.__name__} requires numpy, please install it: pip install numpy')
+        super().__init__()
+        self.columns: dict = {}
+        self.length: int = 0
+        self.capacity: int = 0
+
+    def __reduce__(self):
+        return __newobj__, (self.__class__, ), (self.__dict__, {'columns': self.columns, 'length': self.length,
+                                                                'capacity': self.capacity})
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __bool__(self) -> bool:
+        return self.length > 0
+
+    def get_index(self, idx: int) -> int:
+        """
+        Get non-negative index of individual.
+
+        :param idx: index of individual, can be negative.
+        :return: index.
+        """
+        if idx < 0:
+            idx += self.length
+        if idx < 0 or idx >= self.length:
+            raise IndexError('population index out of range')
+        return idx
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[IndividView, List[IndividView]]:
+        if isinstance(idx, slice):
+            return [IndividView(self, i) for i in range(*idx.indices(self.length))]
+        return IndividView(self, self.get_index(idx))
+
+    def __setitem__(self, idx: int, individ: dict) -> None:
+        self.set_individ(self.get_index(idx), individ)
+
+    def __iter__(self) -> Iterator[IndividView]:
+        for idx in range(self.length):
+            yield IndividView(self, idx)
+
+    def __reversed__(self) -> Iterator[IndividView]:
+        for idx in reversed(range(self.length)):
+            yield IndividView(self, idx)
+
+    def __contains__(self, individ: Any) -> bool:
+        return any(view == individ for view in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, list):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr([view.to_dict() for view in self])
+
+    def get_value(self, idx: int, key: str) -> Any:
+        """
+        Get value of individual.
+
+        :param idx: index of individual.
+        :param key: key of individual, example: 'genotype'.
+        :return: value.
+        """
+        if key not in self.columns:
+            raise KeyError(key)
+        return self.columns[key].get(idx)
+
+    def set_value(self, idx: int, key: str, value: Any) -> None:
+        """
+        Set value of individual, column is created for new key.
+
+        :param idx: index of individual.
+        :param key: key of individual, example: 'genotype'.
+        :param value: new value.
+        :return: None
+        """
+        if key not in self.columns:
+            self.columns[key] = ArrayColumn(self.capacity)
+        self.columns[key].set(idx, value, self.length)
+
+    def remove_key(self, key: str, individuals: List[dict]) -> None:
+        """
+        Remove key from individuals of population: keys are columns, so column is removed for all individuals.
+
+        :param key: key of individual.
+        :param individuals: individuals of population.
+        :return: None
+        """
+        self.columns.pop(key, None)
+
+    def set_individ(self, idx: int, individ: dict) -> None:
+        """
+        Set all values of individual.
+
+        :param idx: index of individual.
+        :param individ: dict (or IndividView) with values of individual.
+        :return: None
+        """
+        for key in self.columns.keys() - individ.keys():
+            self.columns[key].set(idx, None, self.length)
+        for key, value in individ.items():
+            self.set_value(idx, key, value)
+
+    def append(self, individ: dict) -> None:
+        """
+        Add an individual to the end of population, values are copied into arrays.
+
+        :param individ: dict (or IndividView) with values of individual.
+        :return: None
+        """
+        if self.length == self.capacity:
+            self.capacity = max(16, 2 * self.capacity)
+            for column in self.columns.values():
+                column.resize(self.capacity)
+        self.length += 1
+        self.set_individ(self.length - 1, individ)
+
+    def extend(self, individuals: Iterable[dict]) -> None:
+        """
+        Add individuals to the end of population.
+
+        :param individuals: dicts (or IndividView) with values of individuals.
+        :return: None
+        """
+        for individ in list(individuals):
+            self.append(individ)
+
+    def extend_rows(self, population: 'ArrayPopulation', rows) -> None:
+        """
+        Add individuals of other ArrayPopulation to the end of population, arrays are copied by rows at once.
+
+        :param population: ArrayPopulation with individuals.
+        :param rows: indices of individuals in population.
+        :return: None
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        start, end = self.length, self.length + len(rows)
+        if end > self.capacity:
+            self.capacity = max(16, 2 * self.capacity, end)
+            for column in self.columns.values():
+                column.resize(self.capacity)
+        for key in self.columns.keys() - population.columns.keys():
+            self.columns[key].is_set[start:end] = False
+        self.length = end
+        for key, source in population.columns.items():
+            if key not in self.columns:
+                self.columns[key] = ArrayColumn(self.capacity)
+            column = self.columns[key]
+            if source.kind is None:
+                column.is_set[start:end] = False
+                continue
+            if column.kind is None:
+                column.allocate(source.kind, source.width)
+            if column.kind == source.kind and column.width == source.width:
+                column.data[start:end] = source.data[rows]
+                column.is_set[start:end] = source.is_set[rows]
+            else:
+                for idx, row in enumerate(rows.tolist(), start):
+                    column.set(idx, source.get(row), end)
+
+    def clear(self) -> None:
+        """
+        Remove all individuals from population.
+
+        :return: None
+        """
+        for column in self.columns.values():
+            column.is_set[:] = False
+        self.length = 0
+
+    def take(self, order) -> None:
+        """
+        Reorder individuals of population.
+
+        :param order: indices of individuals in new order.
+        :return: None
+        """
+        order = np.asarray(order, dtype=np.intp)
+        for column in self.columns.values():
+            column.take(order, self.length)
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """
+        Sort individuals of population in the same way as list.sort().
+
+        :param key: function of individual for comparison.
+        :param reverse: whether to sort in reverse order.
+        :return: None
+        """
+        views = list(self)
+        order = sorted(range(self.length), key=lambda i: key(views[i]) if key else views[i], reverse=reverse)
+        self.take(order)
+
+    def sort_by_dict(self, key_dict='score', reverse=False) -> None:
+        """
+        Sort the population based on a specified dictionary key, numeric keys are sorted by stable numpy sort,
+        so order is the same as order of list of dicts.
+
+        :param key_dict: the key in the individual dictionary used for sorting.
+        :param reverse: whether to sort in reverse order.
+
+        :return: None
+        """
+        column = self.columns.get(key_dict)
+        if column is None or column.width is not None or not column.is_numeric(self.length):
+            super().sort_by_dict(key_dict=key_dict, reverse=reverse)
+            return
+
+        values = column.data[:self.length]
+        if column.kind == 'b':
+            values = values.astype(np.int64)
+        self.take(np.argsort(-values if reverse else values, kind='stable'))
+        if key_dict == 'score':
+            self.is_sorted = True
+
+    def get_scores(self):
+        """
+        Get scores of population as numpy array, if they are stored in numeric column.
+
+        :return: 1-D numpy array of scores or None.
+        """
+        column = self.columns.get('score')
+        if column is None or column.width is not None or not column.is_numeric(self.length):
+            return None
+        scores = column.data[:self.length]
+        return scores.astype(np.int64) if column.kind == 'b' else scores
+
+    def get_statistics(self, is_diversity: bool = False) -> dict:
+        """
+        Get statistics of scores of population with vectorized operations (see BasePopulation.get_statistics()),
+        median is found by partition.
+
+        :param is_diversity: if True, ratio of unique genotypes ("diversity") is calculated too.
+        :return: dict of statistics.
+        """
+        scores = self.get_scores()
+        feasible = self.columns.get('feasible')
+        if scores is None or feasible is None or not feasible.is_numeric(self.length):
+            return super().get_statistics(is_diversity)
+        idx_best = self.length - 1 - int(np.argmax(scores[::-1]))
+        idx_median = int(self.length / 2)
+        statistics = {'idx_best': idx_best,
+                      'best': self.get_value(idx_best, 'score'),
+                      'worst': scores.min().item(),
+                      'mean': float(scores.mean()),
+                      'median': np.partition(scores, idx_median)[idx_median].item(),
+                      'std': float(scores.std()),
+                      'feasible_ratio': float(feasible.data[:self.length].mean())}
+        if is_diversity:
+            statistics['diversity'] = self.get_diversity()
+        return statistics
+
+    def get_diversity(self) -> float:
+        """
+        Get ratio of unique genotypes in population, rows of numeric genotype array are compared at once.
+
+        :return: ratio of unique genotypes.
+        """
+        column = self.columns.get('genotype')
+        if column is not None and column.width is not None and column.is_numeric(self.length):
+            return len(np.unique(column.data[:self.length], axis=0)) / self.length
+        return super().get_diversity()
+
+    def get_top_idx(self, num: int) -> List[int]:
+        """
+        Get indices of the best individuals by partition of scores (see BasePopulation.get_top_idx()).
+
+        :param num: number of indices.
+        :return: list of indices.
+        """
+        scores = self.get_scores()
+        num = min(num, self.length)
+        if scores is None or num <= 0:
+            return super().get_top_idx(num)
+        kth = np.partition(scores, self.length - num)[self.length - num]
+        above = np.flatnonzero(scores > kth)
+        equal = np.flatnonzero(scores == kth)[::-1][:num - len(above)]
+        idx = np.concatenate((above, equal))
+        return idx[np.lexsort((idx, scores[idx]))[::-1]].tolist()
+
+    def reset_idx_individ(self) -> None:
+        """
+        Reset indexes ('idx_individ' attribute) of individuals in the population.
+
+        :return: None
+        """
+        if 'idx_individ' not in self.columns:
+            self.columns['idx_individ'] = ArrayColumn(self.capacity)
+        self.columns['idx_individ'].set_rows(np.arange(self.length), np.arange(self.length), self.length)
+
+    def is_duplicate(self, array: list = None) -> bool:
+        """
+        Method for checking duplicate individuals in array.
+        :param array: list of individuals with 'genotype', by default rows of genotype array are compared;
+        :return: bool.
+        """
+        column = self.columns.get('genotype')
+        if array is not None or column is None or column.width is None or not column.is_numeric(self.length):
+            return super().is_duplicate(array)
+        return len(np.unique(column.data[:self.length], axis=0)) < self.length
@@ -1,12 +1,16 @@
+import heapq
+import math
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from random import seed
 from baumeva.global_generator import generator
+from baumeva.ga import RandomComponent
 
 
-class BasePopulation(ABC, list):
+class BasePopulation(RandomComponent, ABC, list):
     """
     Abstract class for representing a population in a genetic algorithm.
+    Population is sorted by score (is_sorted) only by operators which need order of all individuals, statistics and
+    the best individuals are got without sorting by get_statistics() and get_top_idx().
     """
     is_sorted: bool = False
     is_phenotype: bool = False
@@ -18,7 +22,6 @@ class BasePopulation(ABC, list):
     def __init__(self) -> None:
         super().__init__()
         self.rnd_seed = generator.rnd_seed
-        seed(self.rnd_seed)
 
     @abstractmethod
     def set_params(self, num_individ: int, gens: tuple, input_population: List[list] = None) -> None:
@@ -98,6 +101,64 @@ class BasePopulation(ABC, list):
         else:
             return None
 
+    def remove_key(self, key: str, individuals: List[dict]) -> None:
+        """
+        Remove key from individuals of population, example: "delta" record after evaluation.
+
+        :param key: key of individual.
+        :param individuals: individuals of population.
+        :return: None
+        """
+        for individ in individuals:
+            individ.pop(key, None)
+
+    @staticmethod
+    def get_genotype_key(genotype: list) -> tuple:
+        """
+        Get hashable key of genotype, is used for search of duplicates.
+
+        :param genotype: genotype of individual.
+        :return: tuple of gens.
+        """
+        return tuple(genotype)
+
+    def get_new_genotype(self, seen: set, max_attempts: int = 100):
+        """
+        Generate random genotype which is not in seen, key of genotype is added to seen.
+
+        :param seen: set of genotype keys.
+        :param max_attempts: number of generated genotypes before giving up (search space is nearly exhausted).
+        :return: genotype or None if all generated genotypes are in seen.
+        """
+        for i in range(max_attempts):
+            genotype = self.get_generated_individ()
+            key = self.get_genotype_key(genotype)
+            if key not in seen:
+                seen.add(key)
+                return genotype
+        return None
+
+    def replace_duplicates(self) -> None:
+        """
+        Replace genotypes which are already in population by new random genotypes, is used for the first generation
+        in unique mode. Phenotype and scores of replaced individuals are reset. Duplicates are kept only if search
+        space has no new genotypes (see get_new_genotype()).
+
+        :return: None
+        """
+        seen = set()
+        for individ in self:
+            key = self.get_genotype_key(individ['genotype'])
+            if key not in seen:
+                seen.add(key)
+                continue
+            genotype = self.get_new_genotype(seen)
+            if genotype is not None:
+                individ['genotype'] = genotype
+                for name in ('phenotype', 'score', 'obj_score'):
+                    if name in individ:
+                        individ[name] = None
+
     def is_duplicate(self, array: list = None) -> bool:
         """
         Method for checking duplicate individuals in array.
@@ -108,8 +169,65 @@ class BasePopulation(ABC, list):
             array = self
         num_ind = len(array)
 
-        if len(set(tuple(ind['genotype']) for ind in array)) < num_ind:
+        if len(set(self.get_genotype_key(ind['genotype']) for ind in array)) < num_ind:
             return True
         else:
             return False
 
+    def get_statistics(self, is_diversity: bool = False) -> dict:
+        """
+        Get statistics of scores of population in one pass without sorting of individuals: index of the best
+        individual (the last one of individuals with the best score, as in sorted population), best, worst, mean, std
+        (Welford's algorithm) and ratio of feasible individuals. Median (score of individual in the middle of sorted
+        population) is taken from sorted list of scores, sorting of floats is faster than selection in pure Python.
+
+        :param is_diversity: if True, ratio of unique genotypes ("diversity") is calculated too.
+        :return: dict of statistics.
+        """
+        scores = []
+        idx_best = 0
+        best = worst = self[0]['score']
+        mean = sum_squares = 0.0
+        num_feasible = 0
+        for idx, individ in enumerate(self):
+            score = individ['score']
+            scores.append(score)
+            if score >= best:
+                best = score
+                idx_best = idx
+            elif score < worst:
+                worst = score
+            delta = score - mean
+            mean += delta / (idx + 1)
+            sum_squares += delta * (score - mean)
+            if individ['feasible']:
+                num_feasible += 1
+        num_ind = len(scores)
+        statistics = {'idx_best': idx_best,
+                      'best': best,
+                      'worst': worst,
+                      'mean': mean,
+                      'median': sorted(scores)[num_ind // 2],
+                      'std': math.sqrt(sum_squares / num_ind),
+                      'feasible_ratio': num_feasible / num_ind}
+        if is_diversity:
+            statistics['diversity'] = self.get_diversity()
+        return statistics
+
+    def get_diversity(self) -> float:
+        """
+        Get ratio of unique genotypes in population.
+
+        :return: ratio of unique genotypes.
+        """
+        return len(set(self.get_genotype_key(individ['genotype']) for individ in self)) / len(self)
+
+    def get_top_idx(self, num: int) -> List[int]:
+        """
+        Get indices of the best individuals without sorting of population, in the same order as reversed sorted
+        population: from the best score to the worst, individuals with equal scores from the last one.
+
+        :param num: number of indices.
+        :return: list of indices.
+        """
+        return heapq.nlargest(num, range(len(self)), key=lambda idx: (self[idx]['score'], idx))
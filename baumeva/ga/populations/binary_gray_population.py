@@ -1,7 +1,26 @@
+from typing import List, Tuple
 from .binary_population import BinaryPopulation
 
 
 class BinaryGrayPopulation(BinaryPopulation):
+    gray_masks: List[Tuple[int, int]]
+
+    def get_gens_params(self) -> None:
+        """
+        Method for getting binary parameters of gens and masks for decoding gray code of all gens at once.
+        :return: None
+        """
+        super().get_gens_params()
+        self.gray_masks = []
+        shift = 1
+        while shift < max(self.num_bits, default=0):
+            mask = 0
+            for gen_shift, num_bits in zip(self.gen_shifts, self.num_bits):
+                if num_bits > shift:
+                    mask |= ((1 << (num_bits - shift)) - 1) << gen_shift
+            self.gray_masks.append((shift, mask))
+            shift *= 2
+
     @staticmethod
     def get_gray_value(value: int) -> int:
         """
@@ -33,20 +52,16 @@ class BinaryGrayPopulation(BinaryPopulation):
 
         return super().index_to_binary(value=value, num_bits=num_bits)
 
-    def binary_individ_to_float(self, genotype: list) -> list:
+    def decode_code(self, code: int) -> int:
         """
-        Method for decoding binary individ to float
-        :param genotype: binary genotype;
-        :return: list of real gens.
+        Method for getting indexes of points of all gens from integer gray code of genotype. Prefix xor of bits
+        is calculated for all gens at once, masks don't allow to xor bits of different gens.
+        :param code: integer gray code of genotype;
+        :return: integer with indexes of points in place of gens.
         """
-        phenotype = []
-        genotype_str = ''.join(genotype)
-        for gen_idx, gen_item in enumerate(self.gens):
-            index_point = int(genotype_str[self.idx_bits[gen_idx]:self.idx_bits[gen_idx + 1]], 2)
-            index_point = self.get_index_from_gray(index_point)
-            point = self.gens[gen_idx][0] + index_point * self.real_step[gen_idx]
-            phenotype.append(point)
-        return phenotype
+        for shift, mask in self.gray_masks:
+            code ^= (code >> shift) & mask
+        return code
 
     @staticmethod
     def get_empty_copy():
@@ -1,5 +1,4 @@
 from typing import List, Tuple
-from random import randint
 from .base_population import BasePopulation
 
 
@@ -12,6 +11,8 @@ class BinaryPopulation(BasePopulation):
     real_num_points: List[int]
     real_step: List[float]
     idx_bits: List[int]
+    gen_shifts: List[int]
+    gen_masks: List[int]
 
     def set_params(self, num_individ: int, gens: tuple, input_population: List[list] = None) -> None:
         """
@@ -35,6 +36,8 @@ class BinaryPopulation(BasePopulation):
         self.real_num_points = []
         self.real_step = []
         self.idx_bits = [0]
+        self.gen_shifts = []
+        self.gen_masks = []
 
     @staticmethod
     def get_real_number_of_points(num_points: int) -> Tuple[int, int]:
@@ -61,6 +64,9 @@ class BinaryPopulation(BasePopulation):
             self.num_bits.append(num_bits)
             self.real_num_points.append(real_num_points)
             self.idx_bits.append(self.idx_bits[-1] + num_bits)
+        for gen_idx, num_bits in enumerate(self.num_bits):
+            self.gen_shifts.append(self.idx_bits[-1] - self.idx_bits[gen_idx + 1])
+            self.gen_masks.append((1 << num_bits) - 1)
 
     @staticmethod
     def index_to_binary(value: int, num_bits: int) -> str:
@@ -82,7 +88,8 @@ class BinaryPopulation(BasePopulation):
         """
         genotype = ''
         for i in range(len(self.gens)):
-            genotype += self.index_to_binary(value=randint(0, self.real_num_points[i]), num_bits=self.num_bits[i])
+            genotype += self.index_to_binary(value=self.rnd.randint(0, self.real_num_points[i]),
+                                             num_bits=self.num_bits[i])
         return list(genotype)
 
     def float_individ_to_binary(self, float_gens: list) -> list:
@@ -103,19 +110,33 @@ class BinaryPopulation(BasePopulation):
 
         return list(genotype)
 
+    @staticmethod
+    def get_code(genotype: list) -> int:
+        """
+        Method for getting all bits of genotype as one integer, the first bit is the highest.
+        :param genotype: binary genotype;
+        :return: integer.
+        """
+        return int(''.join(genotype), 2)
+
+    def decode_code(self, code: int) -> int:
+        """
+        Method for getting indexes of points of all gens from integer code of genotype.
+        :param code: integer code of genotype;
+        :return: integer with indexes of points in place of gens.
+        """
+        return code
+
     def binary_individ_to_float(self, genotype: list) -> list:
         """
-        Method for decoding binary individ to float
+        Method for decoding binary individ to float, genotype is converted to integer once and gens are taken
+        by shifts and masks.
         :param genotype: binary genotype;
         :return: list of real gens.
         """
-        phenotype = []
-        genotype_str = ''.join(genotype)
-        for gen_idx, gen_item in enumerate(self.gens):
-            index_point = int(genotype_str[self.idx_bits[gen_idx]:self.idx_bits[gen_idx + 1]], 2)
-            point = self.gens[gen_idx][0] + index_point * self.real_step[gen_idx]
-            phenotype.append(point)
-        return phenotype
+        code = self.decode_code(self.get_code(genotype))
+        return [gen[0] + ((code >> shift) & mask) * step
+                for gen, shift, mask, step in zip(self.gens, self.gen_shifts, self.gen_masks, self.real_step)]
 
     def get_phenotype(self):
         """
@@ -1,5 +1,4 @@
 from typing import List
-from random import randrange, choice
 from .base_population import BasePopulation
 
 
@@ -36,9 +35,9 @@ class CatPopulation(BasePopulation):
         genotype = []
         for gen in self.gens:
             if isinstance(gen, tuple):
-                genotype.append(randrange(gen[0], gen[1]+1, gen[2]))
+                genotype.append(self.rnd.randrange(gen[0], gen[1]+1, gen[2]))
             elif isinstance(gen, list):
-                genotype.append(choice(gen))
+                genotype.append(self.rnd.choice(gen))
             else:
                 raise Exception(f'Unexpected data type of gen: {type(gen)}')
         return genotype
@@ -1,4 +1,3 @@
-from random import sample
 from typing import List
 from .cat_population import CatPopulation
 
@@ -17,7 +16,7 @@ class OrderCatPopulation(CatPopulation):
                    Example: (0, 30, 10) - 30 total points , but track contains only 10.
         :return: genotype: List[int]
         """
-        genotype = sample(range(self.gens[0], self.gens[1]+1), self.gens[2])
+        genotype = self.rnd.sample(range(self.gens[0], self.gens[1]+1), self.gens[2])
         return genotype
 
     @staticmethod
@@ -0,0 +1,29 @@
+from .packed_binary_population import PackedBinaryPopulation
+from .binary_gray_population import BinaryGrayPopulation
+
+
+class PackedBinaryGrayPopulation(PackedBinaryPopulation, BinaryGrayPopulation):
+    """
+    Class for representing a binary population with gray code, genotypes are packed into integers.
+    Inherits from PackedBinaryPopulation and BinaryGrayPopulation.
+    """
+
+    def index_to_code(self, value: int) -> int:
+        """
+        Get gray code of point index stored in genotype.
+        :param value: index of point;
+        :return: gray code of point.
+        """
+        return self.get_gray_value(value)
+
+    @staticmethod
+    def get_empty_copy():
+        """
+        Get an empty instance of PackedBinaryGrayPopulation.
+
+        :return: An empty instance of PackedBinaryGrayPopulation.
+        """
+        new_population = PackedBinaryGrayPopulation()
+        new_population.is_phenotype = True
+
+        return new_population
@@ -0,0 +1,86 @@
+from .binary_population import BinaryPopulation
+
+
+class PackedBinaryPopulation(BinaryPopulation):
+    """
+    Class for representing a binary population with genotypes packed into integers: the first bit of genotype is the
+    highest bit of integer. Crossovers and mutation have to work with integers: PackedOnePointCrossover,
+    PackedTwoPointCrossover, PackedUniformCrossover, PackedBinStringMutation.
+    Inherits from BinaryPopulation.
+    """
+
+    @staticmethod
+    def index_to_code(value: int) -> int:
+        """
+        Get code of point index stored in genotype.
+        :param value: index of point;
+        :return: code of point.
+        """
+        return value
+
+    def get_generated_individ(self) -> int:
+        """
+        Method for generation genotype of individ.
+        :return: integer with idx_bits[-1] bits.
+        """
+        genotype = 0
+        for i in range(len(self.gens)):
+            genotype = (genotype << self.num_bits[i]) | self.index_to_code(self.rnd.randint(0, self.real_num_points[i]))
+        return genotype
+
+    def float_individ_to_binary(self, float_gens: list) -> int:
+        """
+        Method for coding input individ to packed binary genotype
+        :param float_gens: input genotype;
+        :return: integer with idx_bits[-1] bits.
+        """
+        if len(float_gens) != len(self.gens):
+            raise Exception(f'Incorrect len of input individ: {float_gens}')
+        genotype = 0
+        for gen_idx, gen_value in enumerate(float_gens):
+            if gen_value < self.gens[gen_idx][0] or gen_value > self.gens[gen_idx][1]:
+                raise Exception(f'Gen: {gen_value} is out of range:'
+                                f' ({self.gens[gen_idx][0]}, {self.gens[gen_idx][1]})')
+            step_idx = round((gen_value - self.gens[gen_idx][0]) / self.real_step[gen_idx])
+            genotype = (genotype << self.num_bits[gen_idx]) | self.index_to_code(step_idx)
+
+        return genotype
+
+    @staticmethod
+    def get_code(genotype: int) -> int:
+        """
+        Method for getting all bits of genotype as one integer.
+        :param genotype: packed binary genotype;
+        :return: genotype.
+        """
+        return genotype
+
+    def get_bin_string(self, genotype: int) -> str:
+        """
+        Method for getting packed genotype as string of '0' and '1'.
+        :param genotype: packed binary genotype;
+        :return: str.
+        """
+        return BinaryPopulation.index_to_binary(value=genotype, num_bits=self.idx_bits[-1])
+
+    @staticmethod
+    def get_genotype_key(genotype: int) -> int:
+        """
+        Get hashable key of genotype.
+
+        :param genotype: packed binary genotype.
+        :return: genotype.
+        """
+        return genotype
+
+    @staticmethod
+    def get_empty_copy():
+        """
+        Get an empty instance of PackedBinaryPopulation.
+
+        :return: An empty instance of PackedBinaryPopulation.
+        """
+        new_population = PackedBinaryPopulation()
+        new_population.is_phenotype = True
+
+        return new_population
@@ -0,0 +1,56 @@
+from random import Random
+from typing import Optional
+from baumeva.global_generator import generator
+from baumeva.seed_sequence import SeedSequence
+
+
+class RandomComponent:
+    """
+    Class for components of genetic algorithm with own random generator (populations and operators).
+    Generator is given by set_seed(), else it is taken from sequence of generator.rnd_seed at the first use.
+    State of component between generations is got by get_state() and restored by set_state() (see GaCheckpoint),
+    components with other state between generations extend both methods.
+    """
+    _rnd: Optional[Random] = None
+
+    @property
+    def rnd(self) -> Random:
+        """
+        Random generator of component.
+
+        :return: random.Random instance.
+        """
+        if self._rnd is None:
+            self._rnd = generator.get_random()
+        return self._rnd
+
+    @rnd.setter
+    def rnd(self, value: Random) -> None:
+        self._rnd = value
+
+    def set_seed(self, seed_sequence: SeedSequence) -> None:
+        """
+        Set random generator of component from seed sequence.
+
+        :param seed_sequence: SeedSequence of component.
+        :return: None
+        """
+        self._rnd = seed_sequence.get_random()
+
+    def get_state(self) -> dict:
+        """
+        Get state of component to restore it later, must be picklable.
+
+        :return: dict with state of random generator.
+        """
+        return {'rnd': self.rnd.getstate()}
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restore state of component got by get_state().
+
+        :param state: dict with state of component.
+        :return: None
+        """
+        self._rnd = Random()
+        self._rnd.setstate(state['rnd'])
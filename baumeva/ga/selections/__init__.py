@@ -5,3 +5,4 @@ from .balanced_selection import BalancedSelection
 from .vega_balanced_selection import VEGABalancedSelection
 from .ranked_selection import RankedSelection
 from .vega_ranked_selection import VEGARankedSelection
+from .stochastic_universal_selection import StochasticUniversalSelection
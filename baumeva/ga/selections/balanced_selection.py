@@ -1,5 +1,4 @@
-from random import random
-from copy import deepcopy
+from bisect import bisect_right
 from .base_selection import BaseSelection
 from baumeva.ga import GaData
 
@@ -47,13 +46,13 @@ class BalancedSelection(BaseSelection):
 
     def get_index(self):
         """
-        Get the index of a selected individual using proportional selection.
+        Get the index of a selected individual using proportional selection, cumulative probabilities are searched
+        by bisection.
 
         :return: The index of the selected individual.
         """
-        rand_value = random()
-        idx = min(range(len(self.selection_scores)), key=lambda i: abs(self.selection_scores[i] - rand_value))
-        return idx if rand_value >= self.selection_scores[idx] else idx - 1
+        idx = bisect_right(self.selection_scores, self.rnd.random()) - 1
+        return min(idx, len(self.selection_scores) - 2)
 
     def balanced_selection(self, ga_data: GaData):
         """
@@ -71,7 +70,7 @@ class BalancedSelection(BaseSelection):
                 if len(idxs) == 0 or idx != idxs[-1]:
                     idxs.append(idx)
 
-            ga_data.parents.extend(deepcopy(ga_data.population[idx]) for idx in idxs)
+            ga_data.parents.extend(ga_data.population[idx] for idx in idxs)
 
     def execute(self, ga_data: GaData) -> None:
         """
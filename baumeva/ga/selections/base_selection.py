@@ -1,10 +1,11 @@
 from abc import ABC
-from baumeva.ga import GaData
+from baumeva.ga import GaData, RandomComponent
 
 
-class BaseSelection(ABC):
+class BaseSelection(RandomComponent, ABC):
     """
     Abstract class for implementing selection operations in a genetic algorithm.
+    Parents are references to individuals of population, they are not copied and must not be changed.
     """
 
     def execute(self, ga_data: GaData) -> None:
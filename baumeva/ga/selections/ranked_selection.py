@@ -18,28 +18,35 @@ class RankedSelection(BalancedSelection):
         """
         super().__init__()
 
+    @staticmethod
+    def get_ranks(scores: list) -> list:
+        """
+        Calculate ranks of sorted scores in one pass, equal scores get the average of their ranks.
+
+        :param scores: list of sorted scores.
+        :return: list of ranks.
+        """
+        ranks = []
+        start = 0
+        for idx in range(1, len(scores) + 1):
+            if idx == len(scores) or scores[idx] != scores[start]:
+                count = idx - start
+                ranks.extend([idx] if count == 1 else [(start + 1 + idx) / 2] * count)
+                start = idx
+        return ranks
+
     def add_probabilities(self, ga_data: GaData):
         """
-        Calculate ranks and selection probabilities based on individuals' scores.
+        Calculate ranks and selection probabilities based on individuals' scores, population is sorted for ranks.
 
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        prev_score = -1
-        count = 1
-        for idx in range(len(ga_data.population)):
-            rank = idx + 1
-            ga_data.population[idx]['rank'] = rank
-            if ga_data.population[idx]['score'] == prev_score:
-                count += 1
-                if rank == len(ga_data.population):
-                    for _idx in range(rank - count, rank):
-                        ga_data.population[_idx]['rank'] = (sum(range(rank - count, rank)) + count) / count
-            elif count > 1:
-                for _idx in range(idx - count, idx):
-                    ga_data.population[_idx]['rank'] = (sum(range(idx - count, idx)) + count) / count
-                count = 1
-            prev_score = ga_data.population[idx]['score']
+        if not ga_data.population.is_sorted:
+            ga_data.population.sort_by_dict()
+        ranks = self.get_ranks([individ['score'] for individ in ga_data.population])
+        for individ, rank in zip(ga_data.population, ranks):
+            individ['rank'] = rank
         super().add_probabilities(ga_data)
 
     def execute(self, ga_data: GaData) -> None:
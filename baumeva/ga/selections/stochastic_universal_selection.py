@@ -0,0 +1,70 @@
+from .balanced_selection import BalancedSelection
+from baumeva.ga import GaData
+
+
+class StochasticUniversalSelection(BalancedSelection):
+    """
+    Class for implementing stochastic universal sampling in a genetic algorithm. All parents are selected by
+    equally spaced pointers with one random offset, so number of copies of individual is close to expected one.
+    Inherits from BalancedSelection.
+    """
+
+    def __init__(self):
+        """
+        Initialize the StochasticUniversalSelection instance.
+
+        :return: None
+        """
+        super().__init__()
+
+    def get_indices(self, num_pointers: int) -> list:
+        """
+        Get indices of selected individuals by equally spaced pointers on cumulative probabilities.
+
+        :param num_pointers: number of individuals to select.
+        :return: shuffled list of indices of selected individuals.
+        """
+        step = 1 / num_pointers
+        pointer = self.rnd.random() * step
+        last_idx = len(self.selection_scores) - 2
+        idxs = []
+        idx = 0
+        for _ in range(num_pointers):
+            while idx < last_idx and self.selection_scores[idx + 1] <= pointer:
+                idx += 1
+            idxs.append(idx)
+            pointer += step
+        self.rnd.shuffle(idxs)
+        return idxs
+
+    def fix_pairs(self, idxs: list) -> None:
+        """
+        Change second index of pairs with the same indices, so parents in every pair are different.
+
+        :param idxs: list of indices of selected individuals.
+        :return: None
+        """
+        for i in range(0, len(idxs), 2):
+            if idxs[i] != idxs[i + 1]:
+                continue
+            for j in range(i + 2, len(idxs)):
+                if idxs[j] != idxs[i]:
+                    idxs[i + 1], idxs[j] = idxs[j], idxs[i + 1]
+                    break
+            else:
+                while idxs[i + 1] == idxs[i] and len(self.selection_scores) > 2:
+                    idxs[i + 1] = self.get_index()
+
+    def balanced_selection(self, ga_data: GaData):
+        """
+        Perform stochastic universal sampling to choose parents for crossover.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        total_num_parents = self.get_total_num_parents(ga_data)
+        if total_num_parents == 0:
+            return
+        idxs = self.get_indices(2 * total_num_parents)
+        self.fix_pairs(idxs)
+        ga_data.parents.extend(ga_data.population[idx] for idx in idxs)
@@ -1,23 +1,31 @@
-from random import sample
-from copy import deepcopy
 from .base_selection import BaseSelection
-from baumeva.ga import GaData
+from baumeva.ga import GaData, ArrayPopulation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TournamentSelection(BaseSelection):
     """
-    Class for implementing tournament selection in a genetic algorithm.
+    Class for implementing tournament selection in a genetic algorithm. In batch mode all tournaments of generation
+    are drawn as one matrix of indices and winners are found by argmax over vector of scores, requires numpy.
     Inherits from BaseSelection.
     """
 
-    def __init__(self, tournament_size: int = 3):
+    def __init__(self, tournament_size: int = 3, is_batch: bool = False):
         """
         Initialize the TournamentSelection instance.
 
         :param tournament_size: The size of each tournament (default: 3).
+        :param is_batch: If True tournaments are performed with numpy arrays at once (default: False).
         :return: None
         """
+        if is_batch and np is None:
+            raise Exception(f'Batch tournament requires numpy, please install it: pip install numpy')
         self.tournament_size = tournament_size
+        self.is_batch = is_batch
 
     def check_tournament_size(self, num_individ: int) -> None:
         """
@@ -55,6 +63,75 @@ class TournamentSelection(BaseSelection):
         """
         return int(ga_data.children_percent * ga_data.population.num_individ)
 
+    def get_scores(self, ga_data: GaData):
+        """
+        Get scores of all individuals, scores of ArrayPopulation are taken from its array without copying.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: 1-D numpy array of scores.
+        """
+        population = ga_data.population
+        if isinstance(population, ArrayPopulation):
+            column = population.columns.get('score')
+            if column is not None and column.width is None and column.is_numeric(len(population)):
+                return column.data[:len(population)]
+        return np.fromiter((individ['score'] for individ in population), dtype=np.float64, count=len(population))
+
+    def get_tournaments(self, rng, num_tournaments: int, num_individ: int):
+        """
+        Draw tournaments without repeated participants: rows with repeats are drawn again. If repeats are likely
+        (tournament is large for population) participants are the first ones of random permutations.
+
+        :param rng: numpy random generator.
+        :param num_tournaments: number of tournaments.
+        :param num_individ: number of individuals in population.
+        :return: numpy array of indices of participants with shape (num_tournaments, tournament_size).
+        """
+        if self.tournament_size * self.tournament_size > num_individ:
+            return np.argsort(rng.random((num_tournaments, num_individ)), axis=1)[:, :self.tournament_size]
+        tournaments = rng.integers(0, num_individ, size=(num_tournaments, self.tournament_size))
+        rows = np.arange(num_tournaments)
+        while len(rows) > 0:
+            participants = np.sort(tournaments[rows], axis=1)
+            rows = rows[(participants[:, 1:] == participants[:, :-1]).any(axis=1)]
+            tournaments[rows] = rng.integers(0, num_individ, size=(len(rows), self.tournament_size))
+        return tournaments
+
+    def get_winners(self, rng, scores, num_tournaments: int):
+        """
+        Get winners of tournaments, the first participant wins among equal scores as in get_best().
+
+        :param rng: numpy random generator.
+        :param scores: 1-D numpy array of scores.
+        :param num_tournaments: number of tournaments.
+        :return: numpy array of indices of winners.
+        """
+        tournaments = self.get_tournaments(rng, num_tournaments, len(scores))
+        return tournaments[np.arange(num_tournaments), np.argmax(scores[tournaments], axis=1)]
+
+    def batch_tournament(self, ga_data: GaData) -> None:
+        """
+        Perform all tournaments of generation at once. Second winner of pair is drawn again while it is equal to
+        the first one, so parents in every pair are different.
+
+        :param ga_data: GaData instance containing population and related data.
+        :return: None
+        """
+        total_num_parents = self.get_total_num_parents(ga_data)
+        if total_num_parents == 0:
+            return
+        rng = np.random.default_rng(self.rnd.getrandbits(128))
+        scores = self.get_scores(ga_data)
+        pairs = self.get_winners(rng, scores, 2 * total_num_parents).reshape(total_num_parents, 2)
+        rows = np.flatnonzero(pairs[:, 0] == pairs[:, 1])
+        while len(rows) > 0:
+            pairs[rows, 1] = self.get_winners(rng, scores, len(rows))
+            rows = rows[pairs[rows, 0] == pairs[rows, 1]]
+        if isinstance(ga_data.population, ArrayPopulation) and isinstance(ga_data.parents, ArrayPopulation):
+            ga_data.parents.extend_rows(ga_data.population, pairs.ravel())
+        else:
+            ga_data.parents.extend(ga_data.population[idx] for idx in pairs.ravel().tolist())
+
     def tournament(self, ga_data: GaData) -> None:
         """
         Perform the tournament selection process. At the end n (ga_data.children_percent *
@@ -63,17 +140,20 @@ class TournamentSelection(BaseSelection):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
+        if self.is_batch:
+            self.batch_tournament(ga_data)
+            return
         idx_total = list(range(len(ga_data.population)))
         total_num_parents = self.get_total_num_parents(ga_data)
         for i in range(total_num_parents):
             parents_pair = []
             while len(parents_pair) < 2:
-                tournament = sample(idx_total, self.tournament_size)
+                tournament = self.rnd.sample(idx_total, self.tournament_size)
                 best = self.get_best(tournament, ga_data)
                 if len(parents_pair) == 0 or best['idx_individ'] != parents_pair[0]['idx_individ']:
                     parents_pair.append(best)
 
-            ga_data.parents.extend(deepcopy(parent) for parent in parents_pair)
+            ga_data.parents.extend(parents_pair)
 
     def execute(self, ga_data: GaData) -> None:
         """
@@ -1,4 +1,5 @@
 from .vega_balanced_selection import VEGABalancedSelection
+from .ranked_selection import RankedSelection
 from baumeva.ga import MultiGaData
 
 
@@ -25,21 +26,9 @@ class VEGARankedSelection(VEGABalancedSelection):
         :param ga_data: GaData instance containing population and related data.
         :return: None
         """
-        prev_score = -1
-        count = 1
-        for idx in range(len(ga_data.population)):
-            rank = idx + 1
-            ga_data.population[idx]['rank'][self.idx] = rank
-            if ga_data.population[idx]['score'][self.idx] == prev_score:
-                count += 1
-                if rank == len(ga_data.population):
-                    for _idx in range(rank - count, rank):
-                        ga_data.population[_idx]['rank'][self.idx] = (sum(range(rank - count, rank)) + count) / count
-            elif count > 1:
-                for _idx in range(idx - count, idx):
-                    ga_data.population[_idx]['rank'][self.idx] = (sum(range(idx - count, idx)) + count) / count
-                count = 1
-            prev_score = ga_data.population[idx]['score'][self.idx]
+        ranks = RankedSelection.get_ranks([individ['score'][self.idx] for individ in ga_data.population])
+        for individ, rank in zip(ga_data.population, ranks):
+            individ['rank'][self.idx] = rank
         super().add_probabilities(ga_data)
 
     def execute(self, ga_data: MultiGaData) -> None:
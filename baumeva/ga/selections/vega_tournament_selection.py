@@ -1,5 +1,5 @@
-from .tournament_selection import TournamentSelection
-from baumeva.ga import MultiGaData
+from .tournament_selection import TournamentSelection, np
+from baumeva.ga import MultiGaData, ArrayPopulation
 
 
 class VEGATournamentSelection(TournamentSelection):
@@ -11,16 +11,17 @@ class VEGATournamentSelection(TournamentSelection):
 
     idx: int = 0
 
-    def __init__(self, num_objectives: int, tournament_size: int = 3):
+    def __init__(self, num_objectives: int, tournament_size: int = 3, is_batch: bool = False):
         """
         Initialize the TournamentSelection instance.
 
         :param num_objectives: The number of objectives.
         :param tournament_size: The size of each tournament (default: 3).
+        :param is_batch: If True tournaments are performed with numpy arrays at once (default: False).
         :return: None
         """
         self.num_objectives = num_objectives
-        super().__init__(tournament_size=tournament_size)
+        super().__init__(tournament_size=tournament_size, is_batch=is_batch)
 
     def get_best(self, tournament: list, ga_data: MultiGaData):
         """
@@ -36,6 +37,21 @@ class VEGATournamentSelection(TournamentSelection):
                 best = ga_data.population[idx]
         return best
 
+    def get_scores(self, ga_data: MultiGaData):
+        """
+        Get scores of all individuals by current objective.
+
+        :param ga_data: MultiGaData instance containing population and related data.
+        :return: 1-D numpy array of scores.
+        """
+        population = ga_data.population
+        if isinstance(population, ArrayPopulation):
+            column = population.columns.get('score')
+            if column is not None and column.width == self.num_objectives and column.is_numeric(len(population)):
+                return column.data[:len(population), self.idx]
+        return np.fromiter((individ['score'][self.idx] for individ in population), dtype=np.float64,
+                           count=len(population))
+
     def get_total_num_parents(self, ga_data: MultiGaData) -> int:
         """
         Method for calculation the total number of parents to select.
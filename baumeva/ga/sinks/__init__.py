@@ -0,0 +1,4 @@
+from .base_sink import BaseSink
+from .csv_sink import CsvSink
+from .jsonl_sink import JsonlSink
+from .binary_sink import BinarySink
@@ -0,0 +1,100 @@
+import os
+from abc import ABC, abstractmethod
+from typing import List, Union
+
+
+class BaseSink(ABC):
+    """
+    Abstract class for streaming rows of history of genetic algorithm (one row for every generation) to file.
+    File is opened at the first row and written in binary mode, position of the last row is stored when sink is
+    closed or pickled (see GaCheckpoint), so resumed run truncates rows written after checkpoint and continues file.
+    attribute: columns: names of columns, taken from the first row.
+    attribute: position: size of written part of file.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Initialize the BaseSink instance.
+
+        :param file_path: path to file.
+        :return: None
+        """
+        self.file_path = file_path
+        self.file = None
+        self.columns: Union[List[str], None] = None
+        self.position: int = 0
+
+    def open(self) -> None:
+        """
+        Open file: new file for the first row, else file is truncated to stored position.
+
+        :return: None
+        """
+        if self.position == 0:
+            self.file = open(self.file_path, 'wb')
+        else:
+            self.file = open(self.file_path, 'r+b')
+            self.file.seek(self.position)
+            self.file.truncate()
+
+    def reset(self) -> None:
+        """
+        Close file and start it again, is called by new GaData.
+
+        :return: None
+        """
+        self.close()
+        self.columns = None
+        self.position = 0
+
+    def get_header(self) -> bytes:
+        """
+        Get header of file, it is written before the first row.
+
+        :return: bytes of header.
+        """
+        return b''
+
+    @abstractmethod
+    def get_record(self, row: dict) -> bytes:
+        """
+        Get record of row.
+
+        :param row: dict of values by names of columns.
+        :return: bytes of record.
+        """
+        pass
+
+    def write(self, row: dict) -> None:
+        """
+        Write row to file.
+
+        :param row: dict of values by names of columns, every row has the same columns.
+        :return: None
+        """
+        if self.file is None:
+            self.open()
+        if self.columns is None:
+            self.columns = list(row)
+            self.file.write(self.get_header())
+        self.file.write(self.get_record(row))
+
+    def close(self) -> None:
+        """
+        Close file and store position of the last row, the next row opens file again.
+
+        :return: None
+        """
+        if self.file is not None:
+            self.position = self.file.tell()
+            self.file.close()
+            self.file = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        if self.file is not None:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            state['position'] = self.file.tell()
+        state['file'] = None
+        return state
@@ -0,0 +1,37 @@
+import json
+from array import array
+from typing import Dict
+from .base_sink import BaseSink
+
+
+class BinarySink(BaseSink):
+    """
+    Class for streaming rows of history to binary file: header line with JSON list of names of columns, then rows
+    as float64 values in native byte order. It is the most compact and fast sink, file is read by read().
+    Inherits from BaseSink.
+    """
+    magic: bytes = b'BAUMEVA-HISTORY '
+
+    def get_header(self) -> bytes:
+        return self.magic + json.dumps(self.columns).encode() + b'\n'
+
+    def get_record(self, row: dict) -> bytes:
+        return array('d', [row[column] for column in self.columns]).tobytes()
+
+    @classmethod
+    def read(cls, file_path: str) -> Dict[str, array]:
+        """
+        Read binary file of history.
+
+        :param file_path: path to file.
+        :return: dict of columns, every column is array of floats, incomplete last row is skipped.
+        """
+        with open(file_path, 'rb') as file:
+            header = file.readline()
+            if not header.startswith(cls.magic):
+                raise Exception(f'File {file_path} is not binary history file')
+            columns = json.loads(header[len(cls.magic):])
+            data = file.read()
+        values = array('d')
+        values.frombytes(data[:len(data) - len(data) % (values.itemsize * len(columns))])
+        return {column: values[idx::len(columns)] for idx, column in enumerate(columns)}
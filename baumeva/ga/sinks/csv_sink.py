@@ -0,0 +1,14 @@
+from .base_sink import BaseSink
+
+
+class CsvSink(BaseSink):
+    """
+    Class for streaming rows of history to csv file, the first line is names of columns.
+    Inherits from BaseSink.
+    """
+
+    def get_header(self) -> bytes:
+        return (','.join(self.columns) + '\n').encode()
+
+    def get_record(self, row: dict) -> bytes:
+        return (','.join(str(row[column]) for column in self.columns) + '\n').encode()
@@ -0,0 +1,12 @@
+import json
+from .base_sink import BaseSink
+
+
+class JsonlSink(BaseSink):
+    """
+    Class for streaming rows of history to JSON Lines file, every row is JSON object.
+    Inherits from BaseSink.
+    """
+
+    def get_record(self, row: dict) -> bytes:
+        return (json.dumps(row) + '\n').encode()
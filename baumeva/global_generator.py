@@ -1,7 +1,16 @@
+from random import Random
+from typing import Optional, Union
+from .seed_sequence import SeedSequence
+
 
 class GlobalGenerator:
+    """
+    Class for the default random seed of library. Components of GA without own random generator get one from
+    sequence of rnd_seed, setting of rnd_seed starts this sequence again.
+    """
     def __init__(self):
         self._rnd_seed = None
+        self._seed_sequence = SeedSequence(None)
 
     @property
     def rnd_seed(self):
@@ -10,6 +19,34 @@ class GlobalGenerator:
     @rnd_seed.setter
     def rnd_seed(self, value):
         self._rnd_seed = value
+        self._seed_sequence = SeedSequence(value)
+
+    def spawn(self) -> SeedSequence:
+        """
+        Get next child of sequence of rnd_seed.
+
+        :return: SeedSequence.
+        """
+        return self._seed_sequence.spawn(1)[0]
+
+    def get_random(self) -> Random:
+        """
+        Get random generator from next child of sequence of rnd_seed.
+
+        :return: random.Random instance.
+        """
+        return self.spawn().get_random()
+
+    def get_seed_sequence(self, rnd_seed: Union[int, SeedSequence, None] = None) -> SeedSequence:
+        """
+        Get root sequence of one run of GA.
+
+        :param rnd_seed: seed of run or SeedSequence. If None rnd_seed of generator is used.
+        :return: SeedSequence.
+        """
+        if isinstance(rnd_seed, SeedSequence):
+            return rnd_seed
+        return SeedSequence(rnd_seed if rnd_seed is not None else self._rnd_seed)
 
 
 generator = GlobalGenerator()
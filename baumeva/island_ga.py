@@ -0,0 +1,242 @@
+import multiprocessing
+from copy import deepcopy
+from random import Random
+from typing import List, Type, Union
+from .ga import (GaData, BasePopulation, BaseFitness, BaseSelection, BaseCrossover, BaseMutation, NewGeneration,
+                 GaEngine, Island, island_worker)
+from .global_generator import generator
+from .seed_sequence import SeedSequence
+
+
+class IslandGA:
+    """
+    Class for island model of GA: several populations with own operators evolve in separate processes, every
+    migration_interval generations the best individuals of every island replace the worst individuals of other island.
+    islands_data: list of GaData of every island after optimization.
+    best_solution: the best individual of all islands with index of its island.
+    migration_seed: SeedSequence of random generator of migrations.
+    """
+    islands_data: List[GaData] = None
+    best_solution: dict = None
+    migration_seed: SeedSequence = None
+
+    def __init__(self,
+                 fitness: BaseFitness,
+                 selection: BaseSelection,
+                 crossover: BaseCrossover,
+                 mutation: BaseMutation,
+                 new_generation: NewGeneration,
+                 num_islands: int = 4,
+                 migration_interval: int = 10,
+                 num_migrants: int = 2,
+                 topology: str = 'ring',
+                 storage: Type[GaData] = GaData,
+                 is_parallel: bool = True,
+                 is_print: bool = True) -> None:
+        """
+        Initialization IslandGA with next parameters:
+        :param fitness: initialized subclass of BaseFitness, copied for every island;
+        :param selection: initialized subclass of BaseSelection, copied for every island;
+        :param crossover: initialized subclass of BaseCrossover, copied for every island;
+        :param mutation: initialized subclass of BaseMutation, copied for every island;
+        :param new_generation: initialized class NewGeneration, copied for every island;
+        :param num_islands: int, default: 4. Number of islands (processes);
+        :param migration_interval: int, default: 10. Number of generations between migrations;
+        :param num_migrants: int, default: 2. Number of the best individuals sent by island;
+        :param topology: str, default: 'ring'. Topology of migration: 'ring' - island i sends migrants to island i+1,
+                         'random' - random ring is chosen for every migration;
+        :param storage: GaData or subclass of GaData with single objective;
+        :param is_parallel: bool, default: True. If True every island is performed in own process, else islands are
+                            performed one by one in current process with the same results;
+        :param is_print: bool, default: True. If True printed best solution;
+        """
+        self.operators = (fitness, selection, crossover, mutation, new_generation)
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        self.topology = topology
+        self.storage = storage
+        self.is_parallel = is_parallel
+        self.is_print = is_print
+        self.islands: List[Island] = []
+        self.check_params()
+
+    def check_params(self) -> None:
+        """
+        Check parameters of island model.
+
+        :return: None
+        """
+        if self.topology not in ['ring', 'random']:
+            raise Exception(f'topology must be equal "ring" or "random", not {self.topology}')
+        if self.num_islands < 1 or self.migration_interval < 1 or self.num_migrants < 0:
+            raise Exception(f'num_islands and migration_interval must be >= 1, num_migrants must be >= 0')
+
+    def set_population(self,
+                       population: Type[BasePopulation],
+                       num_individ: int,
+                       num_generations: int,
+                       gens: tuple,
+                       input_population: List[list] = None,
+                       children_percent: float = 0.95,
+                       early_stop: int = 10,
+                       rnd_seed: Union[int, SeedSequence] = None) -> None:
+        """
+        Method for definition populations of islands.
+        :param population: subclass of BasePopulation;
+        :param num_individ: int, number of individuals in population of every island;
+        :param num_generations: int, number of generations;
+        :param gens: tuple or list, depends on population type;
+        :param input_population: list[list], default: None. First generation from user for every island;
+        :param children_percent: float, default: 0.95. Percent of children who will be in new generation;
+        :param early_stop: int, default: 10. Optimization stops when all islands have no improve for early_stop
+                           generations, checked at migrations;
+        :param rnd_seed: int | SeedSequence, default: None. Random seed, every island and migrations get own child
+                         sequence of it. If None generator.rnd_seed is used, if it is None too results are not
+                         reproducible;
+        :return: None.
+        """
+        island_seeds = generator.get_seed_sequence(rnd_seed).spawn(self.num_islands + 1)
+        self.migration_seed = island_seeds.pop()
+        self.islands = []
+        for idx, island_seed in enumerate(island_seeds):
+            seeds = island_seed.spawn(2)
+            ga_data = self.storage(num_generations=num_generations, children_percent=children_percent,
+                                   early_stop=early_stop)
+            ppl = population()
+            ppl.set_params(num_individ=num_individ, gens=gens, input_population=input_population)
+            ppl.set_seed(seeds[0])
+            ppl.fill()
+            ga_data.population = ppl
+            fitness, selection, crossover, mutation, new_generation = deepcopy(self.operators)
+            engine = GaEngine(fitness=fitness, selection=selection, crossover=crossover, mutation=mutation,
+                              new_generation=new_generation)
+            engine.set_seed(seeds[1])
+            self.islands.append(Island(idx, engine, ga_data, self.num_migrants))
+
+    def get_targets(self, rnd: Random) -> List[int]:
+        """
+        Get index of island which gets migrants of every island.
+
+        :param rnd: random generator of migrations.
+        :return: list of indices of target islands.
+        """
+        order = list(range(self.num_islands))
+        if self.topology == 'random':
+            rnd.shuffle(order)
+        targets = [0] * self.num_islands
+        for i in range(self.num_islands):
+            targets[order[i]] = order[(i + 1) % self.num_islands]
+        return targets
+
+    def migrate(self, migrants: List[List[dict]], rnd: Random) -> List[List[dict]]:
+        """
+        Route migrants of every island to target island.
+
+        :param migrants: migrants of every island.
+        :param rnd: random generator of migrations.
+        :return: migrants received by every island.
+        """
+        received = [[] for _ in range(self.num_islands)]
+        if self.num_islands > 1:
+            for idx, target in enumerate(self.get_targets(rnd)):
+                received[target] = migrants[idx]
+        return received
+
+    def get_num_generations_list(self) -> List[int]:
+        """
+        Get number of generations between migrations.
+
+        :return: list of numbers of generations.
+        """
+        num_generations = self.islands[0].ga_data.num_generations - 1
+        return [min(self.migration_interval, num_generations - start)
+                for start in range(0, num_generations, self.migration_interval)]
+
+    @staticmethod
+    def get_answer(connection) -> object:
+        """
+        Receive answer of island process.
+
+        :param connection: connection to island process.
+        :return: answer.
+        """
+        status, answer = connection.recv()
+        if status == 'error':
+            raise Exception(f'Island process failed:\n{answer}')
+        return answer
+
+    def run_parallel(self, rnd: Random) -> List[GaData]:
+        """
+        Perform islands in own processes.
+
+        :param rnd: random generator of migrations.
+        :return: list of GaData of islands.
+        """
+        connections, processes = [], []
+        try:
+            for island in self.islands:
+                connection, child_connection = multiprocessing.Pipe()
+                # not daemon: island can have own process pool of fitness (workers)
+                process = multiprocessing.Process(target=island_worker, args=(child_connection, island))
+                process.start()
+                child_connection.close()
+                connections.append(connection)
+                processes.append(process)
+
+            received = [[] for _ in self.islands]
+            for num_generations in self.get_num_generations_list():
+                for connection, migrants in zip(connections, received):
+                    connection.send(('evolve', num_generations, migrants))
+                answers = [self.get_answer(connection) for connection in connections]
+                received = self.migrate([answer[0] for answer in answers], rnd)
+                if all(answer[1] for answer in answers):
+                    break
+
+            for connection in connections:
+                connection.send(('finish', ))
+            return [self.get_answer(connection) for connection in connections]
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+    def run_serial(self, rnd: Random) -> List[GaData]:
+        """
+        Perform islands one by one in current process.
+
+        :param rnd: random generator of migrations.
+        :return: list of GaData of islands.
+        """
+        for island in self.islands:
+            island.start()
+        received = [[] for _ in self.islands]
+        for num_generations in self.get_num_generations_list():
+            answers = [island.evolve(num_generations, migrants) for island, migrants in zip(self.islands, received)]
+            received = self.migrate([answer[0] for answer in answers], rnd)
+            if all(answer[1] for answer in answers):
+                break
+        return [island.finish() for island in self.islands]
+
+    def optimize(self) -> dict:
+        """
+        Main method of IslandGA().
+        :return: the best solution of all islands.
+        """
+        if not self.islands:
+            raise Exception(f'Populations of islands are not set, use set_population()')
+        rnd = self.migration_seed.get_random()
+        self.islands_data = self.run_parallel(rnd) if self.is_parallel else self.run_serial(rnd)
+
+        self.best_solution = None
+        for idx, ga_data in enumerate(self.islands_data):
+            if self.best_solution is None or self.best_solution['score'] < ga_data.best_solution['score']:
+                self.best_solution = deepcopy(ga_data.best_solution)
+                self.best_solution['idx_island'] = idx
+        if self.is_print:
+            print(f'Best island: {self.best_solution["idx_island"]}')
+            self.islands_data[self.best_solution['idx_island']].print_best_solution()
+        return self.best_solution
@@ -0,0 +1,71 @@
+import hashlib
+import secrets
+from random import Random
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SeedSequence:
+    """
+    Class for spawnable seeds (like numpy.random.SeedSequence): every child sequence has own spawn key, so random
+    generators created from different children are independent and every generator is given by entropy and spawn key
+    only, not by order of calls in other threads or processes.
+    """
+
+    def __init__(self, entropy: Optional[int] = None, spawn_key: Tuple[int, ...] = ()) -> None:
+        """
+        Initialize the SeedSequence instance.
+
+        :param entropy: int, root seed. If None random entropy is taken from operating system.
+        :param spawn_key: tuple of indices of children from root sequence.
+        :return: None
+        """
+        self.entropy = entropy if entropy is not None else secrets.randbits(128)
+        self.spawn_key = tuple(spawn_key)
+        self.num_children_spawned = 0
+
+    def __repr__(self) -> str:
+        return f'SeedSequence(entropy={self.entropy}, spawn_key={self.spawn_key})'
+
+    def spawn(self, num_children: int) -> List['SeedSequence']:
+        """
+        Get next child sequences.
+
+        :param num_children: number of children.
+        :return: list of SeedSequence.
+        """
+        children = [SeedSequence(self.entropy, self.spawn_key + (idx, ))
+                    for idx in range(self.num_children_spawned, self.num_children_spawned + num_children)]
+        self.num_children_spawned += num_children
+        return children
+
+    def generate_seed(self) -> int:
+        """
+        Get 128-bit integer seed of sequence.
+
+        :return: int.
+        """
+        digest = hashlib.sha256(repr((self.entropy, self.spawn_key)).encode()).digest()
+        return int.from_bytes(digest[:16], 'little')
+
+    def get_random(self) -> Random:
+        """
+        Get random generator of sequence.
+
+        :return: random.Random instance.
+        """
+        return Random(self.generate_seed())
+
+    def get_numpy_generator(self):
+        """
+        Get numpy random generator of sequence, numpy have to be installed.
+
+        :return: numpy.random.Generator instance.
+        """
+        if np is None:
+            raise Exception(f'numpy is not installed, use "pip install numpy" for numpy random generators')
+        return np.random.default_rng(self.generate_seed())
@@ -1,19 +1,26 @@
 from typing import List, Callable, Union, Any
-from .ga import GaData, MultiGaData, BinaryPopulation, BinaryGrayPopulation, VEGAHyperbolaFitness, BasePenalty, \
-    VEGATournamentSelection, VEGABalancedSelection, VEGARankedSelection, OnePointCrossover, BinStringMutation, \
-    NewGeneration
+from .ga import GaData, MultiGaData, BinaryPopulation, BinaryGrayPopulation, ArrayBinaryPopulation, \
+    ArrayBinaryGrayPopulation, PackedBinaryPopulation, PackedBinaryGrayPopulation, VEGAHyperbolaFitness, BasePenalty, \
+    VEGATournamentSelection, VEGABalancedSelection, VEGARankedSelection, OnePointCrossover, PackedOnePointCrossover, \
+    BinStringMutation, PackedBinStringMutation, NewGeneration
+from .global_generator import generator
+from .base_ga import BaseGA
 
 
-class VEGA:
+class VEGA(BaseGA):
     """
     Class for perform VEGA algorithm for multiobjective optimization.
+    engine: GaEngine performing generation loop, hooks can be added to it before optimize().
+    Run can be performed generation by generation with iterate() and step() (see BaseGA).
     """
+    is_packed_supported = True
+
     def __init__(self, num_generations: int, num_individ: int, gens: tuple, obj_function: Callable,
                  obj_value: Union[int, float] = None, input_data: Any = None, penalty: BasePenalty = None,
                  conditions: list = None, is_gray: bool = False, children_percent: float = 0.95,
                  early_stop: Union[int, None] = 10, input_population: List[list] = None, tournament_size: int = 3,
-                 mutation_lvl: Union[str, float] = 'normal', transfer_parents: str = 'best',
-                 is_print: bool = True) -> None:
+                 mutation_lvl: Union[str, float] = 'normal', transfer_parents: str = 'best', is_print: bool = True,
+                 **engine_options) -> None:
         """
         Initialization parameters:
         :param num_generations: int, number of generations;
@@ -44,8 +51,12 @@ class VEGA:
                              str value: 'weak', 'normal', 'strong';
         :param transfer_parents: str, default: "best". Type of transfer parents: "best", "random";
         :param is_print: bool, default: True. If True printed best solution;
+        :param engine_options: common options of run: workers, executor, cache, is_batch, is_array, is_packed,
+                               is_unique, rnd_seed, history_size, history_step, sink, async_evaluator (see
+                               BaseGA.__init__());
         :return None
         """
+        super().__init__(**engine_options)
         self.num_generations = num_generations
         self.num_individ = num_individ
         self.gens = gens
@@ -63,47 +74,66 @@ class VEGA:
         self.transfer_parents = transfer_parents
         self.is_print = is_print
 
-    def optimize(self) -> GaData:
+    def init_ga_data(self) -> GaData:
         """
-        Main method of VEGA.
+        Start new run: create GaData with filled population and set operators of engine.
         :return: GaData
         """
         # init GaData & Population
-        num_objectives = len(self.obj_function([0]*len(self.gens))) if self.conditions is None\
-            else self.conditions.count('optimize')
         ga_data = MultiGaData(num_generations=self.num_generations, children_percent=self.children_percent,
-                              early_stop=self.early_stop)
-        if self.is_gray:
-            population = BinaryGrayPopulation()
+                              early_stop=self.early_stop, **self.get_history_options())
+        if self.is_packed:
+            population = PackedBinaryGrayPopulation() if self.is_gray else PackedBinaryPopulation()
+        elif self.is_gray:
+            population = ArrayBinaryGrayPopulation() if self.is_array else BinaryGrayPopulation()
         else:
-            population = BinaryPopulation()
+            population = ArrayBinaryPopulation() if self.is_array else BinaryPopulation()
 
         population.set_params(num_individ=self.num_individ, gens=self.gens, input_population=self.input_population)
         # init fitness func, selection, crossover, mutation, new generation
-        fitness_func = VEGAHyperbolaFitness(obj_function=self.obj_function, obj_value=self.obj_value,
-                                            input_data=self.input_data, penalty=self.penalty,
-                                            conditions=self.conditions)
-        selection = VEGATournamentSelection(num_objectives=num_objectives)
-        cross = OnePointCrossover()
-        mutation = BinStringMutation(mutation_lvl=self.mutation_lvl)
-        new_generation = NewGeneration(transfer_parents=self.transfer_parents)
+        self.init_operators()
         # creating first generation
+        seeds = generator.get_seed_sequence(self.rnd_seed).spawn(2)
+        population.set_seed(seeds[0])
         population.fill()
+        if self.is_unique:
+            population.replace_duplicates()
         ga_data.population = population
-        fitness_func.execute(ga_data=ga_data)
-        ga_data.update()
-        # main loop for GA perform
-        for i in range(1, ga_data.num_generations):
-            selection.execute(ga_data)
-            cross.execute(ga_data)
-            mutation.execute(ga_data)
-            new_generation.execute(ga_data)
-            fitness_func.execute(ga_data)
-            ga_data.update()
+        self.engine.set_seed(seeds[1])
+        self.ga_data = ga_data
+        return ga_data
 
-            if ga_data.num_generation_no_improve > ga_data.early_stop:
-                break
+    def init_operators(self) -> None:
+        """
+        Create operators of generation loop (fitness func, selection, crossover, mutation, new generation) and set them
+        to engine, is used for new run and for resumed one.
+        :return: None
+        """
+        num_objectives = len(self.obj_function([0]*len(self.gens))) if self.conditions is None\
+            else self.conditions.count('optimize')
+        fitness_func = VEGAHyperbolaFitness(obj_function=self.obj_function, obj_value=self.obj_value,
+                                            input_data=self.input_data, penalty=self.penalty,
+                                            conditions=self.conditions,
+                                            **self.get_fitness_options())
+        selection = VEGATournamentSelection(num_objectives=num_objectives)
+        if self.is_packed:
+            cross = PackedOnePointCrossover()
+            mutation = PackedBinStringMutation(mutation_lvl=self.mutation_lvl)
+        else:
+            cross = OnePointCrossover()
+            mutation = BinStringMutation(mutation_lvl=self.mutation_lvl)
+        new_generation = NewGeneration(transfer_parents=self.transfer_parents, is_unique=self.is_unique)
+        self.engine.set_operators(fitness=fitness_func, selection=selection, crossover=cross, mutation=mutation,
+                                  new_generation=new_generation)
 
+    def optimize(self, resume_from: str = None) -> GaData:
+        """
+        Main method of VEGA.
+        :param resume_from: str, default: None. Path to checkpoint file (see GaCheckpoint), run is resumed from it;
+        :return: GaData
+        """
+        ga_data = self.init_ga_data() if resume_from is None else self.load_checkpoint(resume_from)
+        self.engine.optimize(ga_data)
         if self.is_print:
             ga_data.print_best_solution()
         return ga_data
@@ -21,6 +21,7 @@ if __name__ == '__main__':
         name='baumeva',
         version=baumeva.__version__,
         packages=find_packages(),
+        extras_require={'numpy': ['numpy']},
         description='Library for the solution of optimization problems with evolution algorithms',
         long_description=long_description,
         long_description_content_type='text/markdown',
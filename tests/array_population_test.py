@@ -0,0 +1,85 @@
+from copy import deepcopy
+import tracemalloc
+from baumeva import BinaryGA, CategoricalGA, CombinatoryGA, VEGA
+from baumeva.ga import DynamicPenalty, BinaryPopulation, ArrayBinaryPopulation, ArrayCatPopulation
+import baumeva
+
+
+def sum_of_squares(value_list):
+    return sum(value*value for value in value_list)
+
+
+def parabola_conditions(x: list) -> tuple:
+    return -x[0]*x[0] + 9, -x[0]-3
+
+
+def num_unique(value_list):
+    return len(set(value_list))**2 - 1
+
+
+def func_word(word: list) -> float:
+    return sum(1 for idx, litter in enumerate(word) if litter != idx)
+
+
+def two_objectives(x: list) -> tuple:
+    return (x[0]-2)**2 + (x[1]-2)**2, x[0]*x[0] + x[1]*x[1]
+
+
+def run(ga_class, **kwargs):
+    baumeva.generator.rnd_seed = 13
+    return ga_class(num_generations=25, early_stop=None, is_print=False, **kwargs).optimize()
+
+
+def get_params():
+    return ((BinaryGA, {'num_individ': 40, 'gens': ((-5, 5, 0.01), (-5, 5, 0.01)), 'obj_function': sum_of_squares,
+                        'obj_value': 0, 'is_gray': True}),
+            (BinaryGA, {'num_individ': 25, 'gens': ((-5, 5, 0.001),), 'obj_function': parabola_conditions,
+                        'penalty': DynamicPenalty(), 'conditions': ['optimize', '<=']}),
+            (CategoricalGA, {'num_individ': 40, 'gens': [list('abcdefgh')] * 8, 'obj_function': num_unique,
+                             'obj_value': 0, 'mutation_lvl': 0.1}),
+            (CombinatoryGA, {'num_individ': 40, 'gens': (0, 7, 8), 'obj_function': func_word, 'obj_value': 0}))
+
+
+# array-backed population gives the same run as list of dicts
+for (ga_class, params), (_, array_params) in zip(get_params(), get_params()):
+    data = run(ga_class, **params)
+    array_data = run(ga_class, is_array=True, **array_params)
+    assert isinstance(array_data.population, baumeva.ga.ArrayPopulation)
+    assert data.historical_best == array_data.historical_best
+    assert data.best_solution == array_data.best_solution
+
+data = run(VEGA, num_individ=30, gens=((0, 10, 0.01), (0, 10, 0.01)), obj_function=two_objectives)
+array_data = run(VEGA, num_individ=30, gens=((0, 10, 0.01), (0, 10, 0.01)), obj_function=two_objectives,
+                 is_array=True)
+assert data.best_solution['pareto_set'] == array_data.best_solution['pareto_set']
+
+# individuals are accessed as dicts
+population = ArrayCatPopulation()
+population.set_params(num_individ=5, gens=((0, 9, 1), (0, 5, 1), (0, 1, 1)))
+population.fill()
+individ = population[-1]
+genotype = individ['genotype']
+genotype[0] = 100
+assert individ['genotype'] != genotype
+individ['genotype'] = genotype
+assert population[4]['genotype'][0] == 100 and individ['score'] is None
+population[2]['score'] = 0.5
+population[4]['score'] = 0.25
+for idx in (0, 1, 3):
+    population[idx]['score'] = idx
+population.sort_by_dict()
+assert [individ['score'] for individ in population] == [0, 0.25, 0.5, 1, 3]
+assert population.is_sorted and deepcopy(population[1]) == population[1].to_dict()
+assert population[1]['genotype'] == genotype
+
+# memory of array-backed population is a fraction of list of dicts
+memory = []
+for population_class in (BinaryPopulation, ArrayBinaryPopulation):
+    tracemalloc.start()
+    population = population_class()
+    population.set_params(num_individ=5000, gens=((-16, 16, 0.001), ) * 4)
+    population.fill()
+    memory.append(tracemalloc.get_traced_memory()[0])
+    tracemalloc.stop()
+    del population
+assert memory[1] * 5 < memory[0]
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from baumeva import BinaryGA, CombinatoryGA
+from baumeva.ga import AsyncEvaluator, LRUCache
+
+
+def sphere(x: list) -> float:
+    return sum(x_i ** 2 for x_i in x)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Stub of simulation server: GET /eval?x=1.0,2.0 returns sum of squares, "fail" parameter gives error 500 for the
+    first request of every genotype.
+    """
+    lock = threading.Lock()
+    num_active = 0
+    max_active = 0
+    seen = set()
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        with self.lock:
+            StubHandler.num_active += 1
+            StubHandler.max_active = max(StubHandler.max_active, StubHandler.num_active)
+            is_fail = 'fail' in query and query['x'][0] not in self.seen
+            if 'fail' in query:
+                self.seen.add(query['x'][0])
+        time.sleep(0.005)
+        with self.lock:
+            StubHandler.num_active -= 1
+        if is_fail:
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = repr(sphere([float(x_i) for x_i in query['x'][0].split(',')])).encode()
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    request_queue_size = 128
+
+
+server = StubServer(('127.0.0.1', 0), StubHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+async def request(path: str) -> float:
+    reader, writer = await asyncio.open_connection('127.0.0.1', server.server_address[1])
+    writer.write(f'GET {path} HTTP/1.0\r\n\r\n'.encode())
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    head, body = response.split(b'\r\n\r\n', 1)
+    if b' 200 ' not in head.split(b'\r\n')[0]:
+        raise Exception(f'Server error: {head.splitlines()[0]}')
+    return float(body)
+
+
+async def remote_sphere(x: list) -> float:
+    return await request('/eval?x=' + ','.join(repr(x_i) for x_i in x))
+
+
+async def flaky_sphere(x: list) -> float:
+    return await request('/eval?fail=1&x=' + ','.join(repr(x_i) for x_i in x))
+
+
+async def remote_sphere_batch(genotypes: list) -> list:
+    return await asyncio.gather(*(remote_sphere(x) for x in genotypes))
+
+
+def run(obj_function, **params):
+    return BinaryGA(num_generations=15, num_individ=30, gens=((-5, 5, 0.01),) * 3, obj_function=obj_function,
+                    obj_value=0, early_stop=None, is_print=False, rnd_seed=5, **params).optimize()
+
+
+# async objective function gives the same run as sync one, number of simultaneous requests is limited (batch
+# objective function is one call)
+expected = run(sphere)
+for max_active, params in ((4, {'async_evaluator': AsyncEvaluator(max_concurrency=4)}), (16, {'cache': LRUCache()}),
+                           (30, {'is_batch': True})):
+    StubHandler.max_active = 0
+    obj_function = remote_sphere_batch if params.get('is_batch') else remote_sphere
+    ga_data = run(obj_function, **params)
+    assert ga_data.historical_best == expected.historical_best
+    assert ga_data.best_solution == expected.best_solution
+    assert 1 < StubHandler.max_active <= max_active
+
+# failed calls are repeated
+evaluator = AsyncEvaluator(max_concurrency=8, retries=1)
+assert run(flaky_sphere, async_evaluator=evaluator).historical_best == expected.historical_best
+assert evaluator.num_retries > 0
+StubHandler.seen.clear()
+try:
+    run(flaky_sphere)
+    assert False
+except Exception as e:
+    assert 'after 1 attempts' in str(e)
+
+# slow calls are cancelled by timeout and repeated
+called = set()
+
+
+async def slow_first_sphere(x: list) -> float:
+    if tuple(x) not in called:
+        called.add(tuple(x))
+        await asyncio.sleep(10)
+    return sphere(x)
+
+
+evaluator = AsyncEvaluator(timeout=0.05, retries=2)
+start = time.perf_counter()
+assert run(slow_first_sphere, async_evaluator=evaluator).historical_best == expected.historical_best
+assert time.perf_counter() - start < 5 and evaluator.num_retries == len(called)
+
+# run inside running event loop (for example, in Jupyter), results of combinatory GA are written back in order
+delays = {}
+
+
+async def tour(x: list) -> int:
+    await asyncio.sleep(delays.setdefault(tuple(x), 0.001 * (len(delays) % 7)))
+    return sum(abs(x[i] - x[i - 1]) for i in range(len(x)))
+
+
+def sync_tour(x: list) -> int:
+    return sum(abs(x[i] - x[i - 1]) for i in range(len(x)))
+
+
+async def main():
+    return CombinatoryGA(num_generations=10, num_individ=20, gens=(0, 9, 10), obj_function=tour, early_stop=None,
+                         is_print=False, rnd_seed=3).optimize()
+
+
+expected = CombinatoryGA(num_generations=10, num_individ=20, gens=(0, 9, 10), obj_function=sync_tour,
+                         early_stop=None, is_print=False, rnd_seed=3).optimize()
+assert asyncio.run(main()).historical_best == expected.historical_best
+
+# wrong parameters
+for obj_function, params in ((sphere, {'async_evaluator': AsyncEvaluator()}), (remote_sphere, {'workers': 2})):
+    try:
+        run(obj_function, **params)
+        assert False
+    except Exception as e:
+        assert 'async' in str(e).lower()
+
+server.shutdown()
+server.server_close()
@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+from baumeva import BinaryGA, CombinatoryGA
+from baumeva.ga import DynamicPenalty, AdaptivePenalty, LRUCache
+import baumeva
+
+num_calls = 0
+
+
+def sum_of_squares(value_list):
+    return sum(value*value for value in value_list)
+
+
+def sum_of_squares_batch(genotypes):
+    global num_calls
+    num_calls += 1
+    return [sum_of_squares(value_list) for value_list in genotypes]
+
+
+def parabola_conditions(x: list) -> tuple:
+    return -x[0]*x[0] + 9, -x[0]-3
+
+
+def parabola_conditions_batch(genotypes):
+    global num_calls
+    num_calls += 1
+    return [parabola_conditions(x) for x in genotypes]
+
+
+def func_word(word: list) -> float:
+    return sum(1 for idx, litter in enumerate(word) if litter != idx)
+
+
+def func_word_batch(words):
+    global num_calls
+    num_calls += 1
+    return [[func_word(word)] for word in words]
+
+
+def run_binary(obj_function, conditions=None, **kwargs):
+    baumeva.generator.rnd_seed = 11
+    return BinaryGA(num_generations=30, num_individ=30, gens=((-5, 5, 0.1), (-5, 5, 0.1)), obj_function=obj_function,
+                    conditions=list(conditions) if conditions else None, early_stop=None, is_print=False,
+                    **kwargs).optimize()
+
+
+def run_combinatory(obj_function, **kwargs):
+    baumeva.generator.rnd_seed = 11
+    return CombinatoryGA(num_generations=30, num_individ=30, gens=(0, 6, 7), obj_function=obj_function, obj_value=0,
+                         early_stop=None, is_print=False, **kwargs).optimize()
+
+
+for run, func, batch_func, params in (
+        (run_binary, sum_of_squares, sum_of_squares_batch, {'obj_value': 0}),
+        (run_binary, parabola_conditions, parabola_conditions_batch,
+         {'penalty': DynamicPenalty(), 'conditions': ('optimize', '<=')}),
+        (run_binary, parabola_conditions, parabola_conditions_batch,
+         {'penalty': AdaptivePenalty(), 'conditions': ('optimize', '<=')}),
+        (run_combinatory, func_word, func_word_batch, {})):
+    serial = run(func, **params)
+
+    num_calls = 0
+    batch = run(batch_func, is_batch=True, **params)
+    assert serial.historical_best == batch.historical_best
+    assert serial.best_solution == batch.best_solution
+    assert num_calls == batch.idx_generation
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        chunked = run(batch_func, is_batch=True, executor=executor, **params)
+    assert serial.historical_best == chunked.historical_best
+
+    cached = run(batch_func, is_batch=True, cache=LRUCache(), **params)
+    assert serial.historical_best == cached.historical_best
+
+try:
+    run_binary(lambda genotypes: [0], obj_value=0, is_batch=True)
+    raise AssertionError('mismatch of rows must raise')
+except Exception as e:
+    assert 'rows of values' in str(e)
@@ -0,0 +1,44 @@
+import os
+import tempfile
+from baumeva import BinaryGA, BatchRunner
+
+
+def get_runner(**kwargs) -> BatchRunner:
+    return BatchRunner(BinaryGA, params={'num_generations': 15, 'num_individ': 20, 'gens': ((0, 100, 1), ) * 3,
+                                         'obj_function': sum, 'obj_value': 0, 'early_stop': 5},
+                       grid={'mutation_lvl': ['weak', 'strong'], 'tournament_size': [2, 4]}, seeds=[1, 2], **kwargs)
+
+
+def without_time(rows: list) -> list:
+    return [{key: value for key, value in row.items() if key != 'time'} for row in rows]
+
+
+# every configuration is run with every seed, results of processes are the same as serial ones
+results = get_runner(workers=2).run()
+assert len(results) == 8
+assert [row['idx_run'] for row in results] == list(range(8))
+assert [(row['mutation_lvl'], row['tournament_size'], row['rnd_seed']) for row in results[:3]] ==\
+       [('weak', 2, 1), ('weak', 2, 2), ('weak', 4, 1)]
+assert without_time(results) == without_time(get_runner(is_parallel=False).run())
+
+# row of results describes run of GA with the same seed
+ga_data = BinaryGA(num_generations=15, num_individ=20, gens=((0, 100, 1), ) * 3, obj_function=sum, obj_value=0,
+                   early_stop=5, mutation_lvl='weak', tournament_size=2, is_print=False, rnd_seed=2).optimize()
+assert results[1]['best_score'] == ga_data.best_solution['score']
+assert results[1]['num_generations'] == ga_data.idx_generation
+assert results[1]['obj_calls'] == ga_data.obj_calls > 0
+assert all(row['time'] > 0 for row in results)
+
+# results are streamed as runs finish, configs are added to grid
+runner = get_runner(workers=2, configs=[{'mutation_lvl': 0.5, 'tournament_size': 3}])
+assert len(runner.get_runs()) == 10
+assert sorted(row['idx_run'] for row in runner.iter_results()) == list(range(10))
+
+runner = get_runner(is_parallel=False)
+runner.run()
+with tempfile.TemporaryDirectory() as tmp_dir:
+    file_path = os.path.join(tmp_dir, 'results.csv')
+    runner.save_results(file_path)
+    with open(file_path) as file:
+        lines = file.read().splitlines()
+assert len(lines) == 9 and lines[0].startswith('idx_run,mutation_lvl,tournament_size,rnd_seed,best_score')
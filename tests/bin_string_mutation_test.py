@@ -0,0 +1,56 @@
+from baumeva import SeedSequence
+from baumeva.ga import (GaData, BinaryPopulation, ArrayBinaryPopulation, PackedBinaryPopulation, BinStringMutation,
+                        PackedBinStringMutation)
+
+
+def get_ga_data(population_class, num_individ: int = 200):
+    population = population_class()
+    population.set_params(num_individ=num_individ, gens=((0, 1023, 1), ) * 20)
+    population.set_seed(SeedSequence(1))
+    population.fill()
+    ga_data = GaData(num_generations=2)
+    ga_data.population = population
+    ga_data.children = population.get_empty_copy()
+    ga_data.children.extend(population)
+    return ga_data
+
+
+def get_genotypes(ga_data):
+    return [individ['genotype'] if isinstance(individ['genotype'], int) else int(''.join(individ['genotype']), 2)
+            for individ in ga_data.children]
+
+
+# probability of flip is the same as probability of determines_mutation()
+for mutation_lvl in (0.0, 0.0004, 0.3, 0.9995, 1.0):
+    mutation = BinStringMutation(mutation_lvl)
+    hits = sum(mutation.determines_mutation() for _ in range(100000)) / 100000
+    assert abs(mutation.get_flip_probability() - hits) < 0.01
+assert BinStringMutation(0.0).get_flip_probability() == 0.001
+assert BinStringMutation(1.0).get_positions(5) == [0, 1, 2, 3, 4]
+
+# frequency of flips of every bit is equal to probability
+mutation = BinStringMutation(0.05)
+mutation.set_seed(SeedSequence(2))
+counts = [0] * 50
+for _ in range(4000):
+    for pos in mutation.get_positions(50):
+        counts[pos] += 1
+assert all(abs(count / 4000 - 0.051) < 0.015 for count in counts)
+positions = mutation.get_positions(100000)
+assert positions == sorted(set(positions)) and abs(len(positions) / 100000 - 0.051) < 0.005
+
+# list, array and packed genotypes get the same flips
+genotypes = []
+for population_class, mutation_class in ((BinaryPopulation, BinStringMutation),
+                                         (ArrayBinaryPopulation, BinStringMutation),
+                                         (PackedBinaryPopulation, PackedBinStringMutation)):
+    ga_data = get_ga_data(population_class)
+    before = get_genotypes(ga_data)
+    mutation = mutation_class('normal')
+    mutation.set_seed(SeedSequence(3))
+    mutation.execute(ga_data)
+    after = get_genotypes(ga_data)
+    num_flips = sum(bin(x ^ y).count('1') for x, y in zip(before, after))
+    assert 100 < num_flips < 320
+    genotypes.append(after)
+assert genotypes[0] == genotypes[1] == genotypes[2]
@@ -0,0 +1,102 @@
+from random import Random
+from baumeva import CombinatoryGA, SeedSequence
+from baumeva.ga import GaData, OrderCatPopulation, HyperbolaFitness, SwapMutation, InversionMutation, \
+    MovementMutation, ShiftMutation, OrderCrossover, PMXCrossover
+from baumeva.ga.moves import apply_move
+
+rnd = Random(0)
+NUM_CITIES = 25
+DISTANCES = [[0] * NUM_CITIES for _ in range(NUM_CITIES)]
+for i in range(NUM_CITIES):
+    for j in range(i + 1, NUM_CITIES):
+        DISTANCES[i][j] = DISTANCES[j][i] = rnd.randint(1, 100)
+
+
+def tour_length(tour: list) -> int:
+    return sum(DISTANCES[tour[i - 1]][tour[i]] for i in range(len(tour)))
+
+
+def full_tour_length(tour: list) -> int:
+    return tour_length(tour)
+
+
+def tour_delta(tour: list, move: tuple) -> int:
+    return tour_length(apply_move(list(tour), move)) - tour_length(tour)
+
+
+tour_length.delta = tour_delta
+
+# moves give the same genotypes as slices
+genotype = list(range(10))
+assert apply_move(list(genotype), ('swap', 2, 7)) == [0, 1, 7, 3, 4, 5, 6, 2, 8, 9]
+assert apply_move(list(genotype), ('move', 2, 7)) == [0, 1, 3, 4, 5, 6, 7, 2, 8, 9]
+assert apply_move(list(genotype), ('inversion', 2, 5)) == [0, 1, 5, 4, 3, 2, 6, 7, 8, 9]
+assert apply_move(list(genotype), ('shift', 2, 4, 5)) == [0, 1, 4, 5, 6, 2, 3, 7, 8, 9]
+try:
+    apply_move(list(genotype), ('rotate', 1, 2))
+    assert False
+except Exception as e:
+    assert 'Unknown move' in str(e)
+
+# mutated copies of parents get objective value of parent plus delta of their moves
+population = OrderCatPopulation()
+population.set_params(num_individ=20, gens=(0, NUM_CITIES - 1, NUM_CITIES))
+population.set_seed(SeedSequence(1))
+population.fill()
+ga_data = GaData(num_generations=2)
+ga_data.population = population
+fitness = HyperbolaFitness(obj_function=tour_length)
+fitness.execute(ga_data)
+for mutation in (SwapMutation(1.0), InversionMutation(1.0), MovementMutation(1.0), ShiftMutation(1.0)):
+    mutation.set_seed(SeedSequence(2))
+    ga_data.children = population.get_empty_copy()
+    for parent in population:
+        child = population.get_empty_individ()
+        child['genotype'] = list(parent['genotype'])
+        child['delta'] = {'obj_score': parent['obj_score'], 'genotype': parent['genotype'], 'moves': []}
+        ga_data.children.append(mutation.get_mutation(child))
+    assert all(len(child['delta']['moves']) == 1 for child in ga_data.children)
+    ga_data.population = ga_data.children
+    obj_calls = ga_data.obj_calls
+    fitness.execute(ga_data)
+    assert ga_data.obj_calls == obj_calls
+    assert all(child['obj_score'] == tour_length(child['genotype']) for child in ga_data.children)
+    assert all('delta' not in child for child in ga_data.children)
+    population = ga_data.children
+
+# genotype changed without record of move is evaluated by objective function
+child = population.get_empty_individ()
+child['genotype'] = list(reversed(population[0]['genotype']))
+child['delta'] = {'obj_score': population[0]['obj_score'], 'genotype': population[0]['genotype'], 'moves': []}
+ga_data.population = population.get_empty_copy()
+ga_data.population.append(child)
+obj_calls = ga_data.obj_calls
+fitness.execute(ga_data)
+assert ga_data.obj_calls == obj_calls + 1
+assert child['obj_score'] == tour_length(child['genotype'])
+
+# delta evaluation gives the same optimization as objective function, with fewer calls of it
+for is_array in (False, True):
+    results = []
+    for obj_function in (tour_length, full_tour_length):
+        ga = CombinatoryGA(num_generations=40, num_individ=40, gens=(0, NUM_CITIES - 1, NUM_CITIES),
+                           obj_function=obj_function, early_stop=None, crossover_percent=0.4, is_print=False,
+                           is_array=is_array, rnd_seed=3)
+        results.append(ga.optimize())
+    delta_data, full_data = results
+    assert delta_data.historical_best == full_data.historical_best
+    assert list(delta_data.best_solution['genotype']) == list(full_data.best_solution['genotype'])
+    assert delta_data.best_solution['obj_score'] == tour_length(list(delta_data.best_solution['genotype']))
+    assert 'delta' not in delta_data.best_solution and 'delta' not in delta_data.population[0]
+    # copies without mutation get score of parent in both runs, mutated copies only with delta
+    assert delta_data.delta_calls > full_data.delta_calls > 0
+    assert delta_data.obj_calls + delta_data.delta_calls == full_data.obj_calls + full_data.delta_calls
+
+# crossover percent is parameter of crossover
+assert OrderCrossover(crossover_percent=0.4).crossover_percent == 0.4
+for crossover_percent in (-0.1, 1.5, '0.5'):
+    try:
+        PMXCrossover(crossover_percent=crossover_percent)
+        assert False
+    except Exception as e:
+        assert 'crossover_percent' in str(e)
@@ -0,0 +1,57 @@
+from baumeva import BinaryGA, CombinatoryGA
+from baumeva.ga import DynamicPenalty, LRUCache
+import baumeva
+
+num_calls = 0
+
+
+def sum_of_squares(value_list):
+    global num_calls
+    num_calls += 1
+    return sum(value*value for value in value_list)
+
+
+def parabola_conditions(x: list) -> tuple:
+    global num_calls
+    num_calls += 1
+    return -x[0]*x[0] + 9, -x[0]-3
+
+
+def func_word(word: list) -> float:
+    global num_calls
+    num_calls += 1
+    return sum(1 for idx, litter in enumerate(word) if litter != idx)
+
+
+def run(ga_class, **kwargs):
+    global num_calls
+    num_calls = 0
+    baumeva.generator.rnd_seed = 3
+    ga_data = ga_class(num_generations=40, early_stop=None, is_print=False, **kwargs).optimize()
+    return ga_data, num_calls
+
+
+def get_params():
+    return ((BinaryGA, {'num_individ': 30, 'gens': ((-2, 2, 0.1), (-2, 2, 0.1)), 'obj_function': sum_of_squares,
+                        'obj_value': 0}),
+            (BinaryGA, {'num_individ': 20, 'gens': ((-5, 5, 0.1),), 'obj_function': parabola_conditions,
+                        'penalty': DynamicPenalty(), 'conditions': ['optimize', '<=']}),
+            (CombinatoryGA, {'num_individ': 30, 'gens': (0, 5, 6), 'obj_function': func_word, 'obj_value': 0}))
+
+
+for (ga_class, params), (_, cached_params) in zip(get_params(), get_params()):
+    data, calls = run(ga_class, **params)
+    cache = LRUCache()
+    cached_data, cached_calls = run(ga_class, cache=cache, **cached_params)
+
+    assert data.historical_best == cached_data.historical_best
+    assert data.best_solution == cached_data.best_solution
+    assert cached_calls == cached_data.cache_misses == len(cache) < calls
+    assert cached_data.cache_hits + cached_data.cache_misses == calls
+    assert cached_data.cache_evictions == 0
+
+small_cache = LRUCache(max_size=10)
+data, calls = run(BinaryGA, num_individ=30, gens=((-2, 2, 0.1), (-2, 2, 0.1)), obj_function=sum_of_squares,
+                  obj_value=0, cache=small_cache)
+assert len(small_cache) == 10
+assert data.cache_evictions == data.cache_misses - 10
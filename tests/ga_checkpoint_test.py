@@ -0,0 +1,111 @@
+import os
+import pickle
+import tempfile
+from baumeva import BinaryGA, CombinatoryGA, VEGA, CollectorGA
+from baumeva.ga import (GaCheckpoint, BinaryPopulation, CatPopulation, HyperbolaFitness, TournamentSelection,
+                        OnePointCrossover, BinStringMutation, NewGeneration)
+
+
+def sphere(x: list) -> float:
+    return sum(x_i ** 2 for x_i in x)
+
+
+def two_objectives(x: list) -> tuple:
+    return x[0] ** 2, (x[0] - 2) ** 2
+
+
+def tour(x: list) -> int:
+    return sum(abs(x[i] - x[i - 1]) for i in range(len(x)))
+
+
+def fill_population(population) -> None:
+    raise Exception('Population of new run is filled')
+
+
+def get_runners() -> list:
+    return [
+        BinaryGA(num_generations=30, num_individ=30, gens=((-5, 5, 0.01),) * 3, obj_function=sphere, obj_value=0,
+                 early_stop=None, is_print=False, rnd_seed=7),
+        BinaryGA(num_generations=30, num_individ=30, gens=((-5, 5, 0.01),) * 3, obj_function=sphere, obj_value=0,
+                 early_stop=None, is_print=False, rnd_seed=7, is_array=True),
+        BinaryGA(num_generations=30, num_individ=30, gens=((-5, 5, 0.01),) * 3, obj_function=sphere, obj_value=0,
+                 early_stop=None, is_print=False, rnd_seed=7, is_packed=True),
+        CombinatoryGA(num_generations=30, num_individ=30, gens=(0, 14, 15), obj_function=tour, early_stop=None,
+                      is_print=False, rnd_seed=7, crossover_percent=0.5),
+        VEGA(num_generations=30, num_individ=30, gens=((-5, 5, 0.01),), obj_function=two_objectives,
+             early_stop=None, is_print=False, rnd_seed=7),
+    ]
+
+
+with tempfile.TemporaryDirectory() as dir_path:
+    file_path = os.path.join(dir_path, 'run.ckpt')
+    for expected_ga, stopped_ga, resumed_ga in zip(get_runners(), get_runners(), get_runners()):
+        expected = expected_ga.optimize()
+        # run is stopped after checkpoint and resumed by other instance with the same results
+        GaCheckpoint(file_path, every_generations=10).attach(stopped_ga.engine)
+        for snapshot in stopped_ga.iterate():
+            if snapshot.idx_generation == 14:
+                break
+        # resumed run creates only operators, without population of new run
+        fill_methods = BinaryPopulation.fill, CatPopulation.fill
+        BinaryPopulation.fill = CatPopulation.fill = fill_population
+        try:
+            resumed = resumed_ga.optimize(resume_from=file_path)
+        finally:
+            BinaryPopulation.fill, CatPopulation.fill = fill_methods
+        assert len(resumed.historical_best) == 30
+        assert resumed.historical_best == expected.historical_best
+        assert resumed.historical_worst == expected.historical_worst
+        assert resumed.obj_calls == expected.obj_calls
+        assert str(resumed.best_solution) == str(expected.best_solution)
+    assert os.listdir(dir_path) == ['run.ckpt']
+
+    # population is stored by compact columns: bits of binary genotypes, bytes of arrays of numbers
+    population = get_runners()[0].init_ga_data().population
+    assert len(pickle.dumps(GaCheckpoint.pack_population(population)['columns'])) * 2 < len(pickle.dumps(population))
+    values = ([[1, 2], None, GaCheckpoint.missing, [3, 4]], [2 ** 70, 5, None], [list('0010'), list('1000')],
+              ['a', 'b'], [0.5, True], [(1.0, 2.0), {'moves': []}])
+    for column in values:
+        assert GaCheckpoint.unpack_column(GaCheckpoint.pack_column(column), len(column)) == column
+    assert [GaCheckpoint.pack_column(column)['format'] for column in values] == ['q', 'n', '01', 'c', 'list', 'list']
+
+    # checkpoint by time is saved after every generation with zero interval
+    binary_ga = get_runners()[0]
+    binary_ga.init_ga_data()
+    GaCheckpoint(file_path, every_seconds=0).attach(binary_ga.engine)
+    for snapshot in binary_ga.iterate():
+        assert GaCheckpoint.load(file_path, binary_ga.engine).historical_best == binary_ga.ga_data.historical_best
+        if snapshot.idx_generation == 3:
+            break
+
+    # checkpoint of other engine is rejected
+    combinatory_ga = get_runners()[3]
+    combinatory_ga.engine.add_stage('log', lambda ga_data: None)
+    try:
+        combinatory_ga.load_checkpoint(file_path)
+        assert False
+    except Exception as e:
+        assert 'Stages of checkpoint' in str(e)
+
+    # collector is resumed without population
+    def get_collector() -> CollectorGA:
+        return CollectorGA(fitness=HyperbolaFitness(obj_function=sphere, obj_value=0),
+                           selection=TournamentSelection(3), crossover=OnePointCrossover(),
+                           mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'))
+
+    expected_ga, stopped_ga, resumed_ga = get_collector(), get_collector(), get_collector()
+    for collector_ga in (expected_ga, stopped_ga):
+        collector_ga.set_population(population=BinaryPopulation, num_individ=20, num_generations=12,
+                                    gens=((-5, 5, 0.01),) * 2, early_stop=100, rnd_seed=2)
+    list(expected_ga.iterate())
+    GaCheckpoint(file_path, every_generations=5).attach(stopped_ga.engine)
+    list(stopped_ga.iterate(max_evaluations=150))
+    resumed_ga.load_checkpoint(file_path)
+    list(resumed_ga.iterate())
+    assert resumed_ga.ga_data.historical_best == expected_ga.ga_data.historical_best
+
+try:
+    GaCheckpoint('run.ckpt')
+    assert False
+except Exception as e:
+    assert 'every_generations' in str(e)
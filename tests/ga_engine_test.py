@@ -0,0 +1,89 @@
+from io import StringIO
+from contextlib import redirect_stdout
+from baumeva import BinaryGA, CollectorGA, SeedSequence
+from baumeva.ga import (GaData, GaEngine, BinaryPopulation, HyperbolaFitness, TournamentSelection, OnePointCrossover,
+                        BinStringMutation, NewGeneration)
+import baumeva
+
+
+def sum_of_squares(value_list):
+    return sum(value*value for value in value_list)
+
+
+def get_collector() -> CollectorGA:
+    collector = CollectorGA(fitness=HyperbolaFitness(obj_function=sum_of_squares, obj_value=0),
+                            selection=TournamentSelection(3),
+                            crossover=OnePointCrossover(),
+                            mutation=BinStringMutation(0.15),
+                            new_generation=NewGeneration('best'))
+    collector.set_population(population=BinaryPopulation, num_individ=30, num_generations=15,
+                             gens=((-5, 5, 0.01), (-5, 5, 0.01)), early_stop=15, rnd_seed=17)
+    return collector
+
+
+def manual_loop() -> GaData:
+    fitness = HyperbolaFitness(obj_function=sum_of_squares, obj_value=0)
+    selection, crossover = TournamentSelection(3), OnePointCrossover()
+    mutation, new_generation = BinStringMutation(0.15), NewGeneration('best')
+    population_seed, engine_seed = SeedSequence(17).spawn(2)
+    for operator, operator_seed in zip((selection, crossover, mutation, new_generation), engine_seed.spawn(4)):
+        operator.set_seed(operator_seed)
+    ga_data = GaData(num_generations=15, early_stop=15)
+    population = BinaryPopulation()
+    population.set_params(num_individ=30, gens=((-5, 5, 0.01), (-5, 5, 0.01)))
+    population.set_seed(population_seed)
+    population.fill()
+    ga_data.population = population
+    fitness.execute(ga_data)
+    ga_data.update()
+    for _ in range(1, ga_data.num_generations):
+        selection.execute(ga_data)
+        crossover.execute(ga_data)
+        mutation.execute(ga_data)
+        new_generation.execute(ga_data)
+        fitness.execute(ga_data)
+        ga_data.update()
+    return ga_data
+
+
+# engine performs the same loop as manual one, hooks are called around every stage
+calls = []
+collector = get_collector()
+collector.engine.add_hook('selection', lambda ga_data, stage: calls.append(('before', stage)), when='before')
+collector.engine.add_hook('fitness', lambda ga_data, stage: calls.append(('after', stage)))
+collector.engine.add_hook('generation', lambda ga_data, stage: calls.append(('after', stage)))
+with redirect_stdout(StringIO()):
+    collector.optimize()
+assert collector.ga_data.historical_best == manual_loop().historical_best
+assert calls[:2] == [('after', 'fitness'), ('after', 'generation')]
+assert calls[2:5] == [('before', 'selection'), ('after', 'fitness'), ('after', 'generation')]
+assert calls.count(('after', 'generation')) == 15
+
+# new stages and replaced stages are performed in pipeline
+stages = []
+engine = GaEngine(fitness=HyperbolaFitness(obj_function=sum_of_squares, obj_value=0),
+                  selection=TournamentSelection(3), crossover=OnePointCrossover(),
+                  mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'))
+engine.add_stage('log', lambda ga_data: stages.append(ga_data.idx_generation), before='update')
+baumeva.generator.rnd_seed = 17
+ga_data = GaData(num_generations=5, early_stop=5)
+population = BinaryPopulation()
+population.set_params(num_individ=30, gens=((-5, 5, 0.01), ))
+population.fill()
+ga_data.population = population
+engine.optimize(ga_data)
+assert stages == [1, 2, 3, 4]
+
+try:
+    engine.add_hook('unknown', print)
+    raise AssertionError('Unknown stage is accepted')
+except Exception as error:
+    assert 'Unknown stage' in str(error)
+
+# prebuilt GA delegates to its engine
+num_generations = []
+binary_ga = BinaryGA(num_generations=10, num_individ=20, gens=((-5, 5, 0.01), ), obj_function=sum_of_squares,
+                     obj_value=0, early_stop=None, is_print=False)
+binary_ga.engine.add_hook('update', lambda ga_data, stage: num_generations.append(ga_data.idx_generation))
+binary_ga.optimize()
+assert num_generations == list(range(1, 11))
@@ -0,0 +1,83 @@
+import os
+import json
+import tempfile
+from baumeva import BinaryGA, VEGA
+from baumeva.ga import GaCheckpoint, CsvSink, JsonlSink, BinarySink
+
+
+def sphere(x: list) -> float:
+    return sum(x_i ** 2 for x_i in x)
+
+
+def two_objectives(x: list) -> tuple:
+    return x[0] ** 2, (x[0] - 2) ** 2
+
+
+def get_binary_ga(**params) -> BinaryGA:
+    return BinaryGA(num_generations=30, num_individ=30, gens=((-5, 5, 0.01),) * 3, obj_function=sphere, obj_value=0,
+                    early_stop=None, is_print=False, rnd_seed=7, **params)
+
+
+expected = get_binary_ga().optimize()
+assert expected.historical_idx_generation == list(range(30))
+# historical attributes are lists: they are copies of history, can be serialized to json
+assert type(expected.historical_best) is list and json.loads(json.dumps(expected.historical_best)) == \
+       expected.historical_best
+expected.historical_best.append(0.0)
+assert len(expected.historical_best) == 30
+assert all(expected.best_solution['genotype'] is not individ['genotype'] for individ in expected.population)
+
+# retention of history: every k-th generation and the last generations
+for history_size, history_step in ((None, 3), (5, 1), (4, 3)):
+    ga_data = get_binary_ga(history_size=history_size, history_step=history_step).optimize()
+    idx_stored = list(range(0, 30, history_step))[-(history_size or 30):]
+    assert list(ga_data.historical_idx_generation) == idx_stored
+    for name in ('historical_best', 'historical_mediocre', 'historical_worst'):
+        assert list(getattr(ga_data, name)) == [getattr(expected, name)[idx] for idx in idx_stored]
+    assert ga_data.best_solution == expected.best_solution
+    # stored columns are trimmed in chunks, they never exceed 2 * history_size values
+    if history_size is not None:
+        assert all(len(column) < 2 * history_size for column in ga_data.history.values())
+
+vega = VEGA(num_generations=20, num_individ=20, gens=((-5, 5, 0.01),), obj_function=two_objectives,
+            early_stop=None, is_print=False, rnd_seed=1, history_size=4)
+ga_data = vega.optimize()
+assert len(ga_data.historical_best) == len(ga_data.historical_worst) == 4
+assert list(ga_data.historical_idx_generation) == [16, 17, 18, 19]
+# pareto sets are stored as copies, history does not keep populations alive
+assert ga_data.historical_best[-1] == ga_data.best_score
+assert all(type(individ) is dict and all(individ is not best for best in ga_data.best_score)
+           for individ in ga_data.historical_best[-1])
+
+with tempfile.TemporaryDirectory() as dir_path:
+    # sinks get rows of all generations
+    csv_path, jsonl_path, binary_path = (os.path.join(dir_path, name) for name in ('h.csv', 'h.jsonl', 'h.bin'))
+    get_binary_ga(history_size=1, sink=CsvSink(csv_path)).optimize()
+    get_binary_ga(history_size=1, sink=JsonlSink(jsonl_path)).optimize()
+    get_binary_ga(history_size=1, sink=BinarySink(binary_path)).optimize()
+    with open(csv_path) as file:
+        lines = file.read().splitlines()
+    assert lines[0] == 'idx_generation,best,mediocre,worst,mean,std,feasible_ratio,num_generation_no_improve,obj_calls'
+    assert [float(line.split(',')[1]) for line in lines[1:]] == list(expected.historical_best)
+    with open(jsonl_path) as file:
+        rows = [json.loads(line) for line in file]
+    assert [row['worst'] for row in rows] == list(expected.historical_worst)
+    assert rows[-1]['obj_calls'] == expected.obj_calls
+    columns = BinarySink.read(binary_path)
+    assert list(columns['idx_generation']) == list(range(30))
+    assert list(columns['mediocre']) == expected.historical_mediocre
+
+    # resumed run truncates rows written after checkpoint
+    sink = BinarySink(binary_path)
+    stopped_ga = get_binary_ga(sink=sink)
+    GaCheckpoint(os.path.join(dir_path, 'run.ckpt'), every_generations=10).attach(stopped_ga.engine)
+    for snapshot in stopped_ga.iterate():
+        if snapshot.idx_generation == 14:
+            break
+    assert len(BinarySink.read(binary_path)['best']) == 15
+    get_binary_ga().optimize(resume_from=os.path.join(dir_path, 'run.ckpt'))
+    assert list(BinarySink.read(binary_path)['best']) == expected.historical_best
+
+    # new run starts file again
+    get_binary_ga(sink=sink).optimize()
+    assert list(BinarySink.read(binary_path)['best']) == expected.historical_best
@@ -0,0 +1,102 @@
+from baumeva import BinaryGA, CombinatoryGA, VEGA, CollectorGA
+from baumeva.ga import (GaSnapshot, BinaryPopulation, HyperbolaFitness, TournamentSelection, OnePointCrossover,
+                        BinStringMutation, NewGeneration)
+
+
+def sphere(x: list) -> float:
+    return sum(x_i ** 2 for x_i in x)
+
+
+def two_objectives(x: list) -> tuple:
+    return x[0] ** 2, (x[0] - 2) ** 2
+
+
+def tour(x: list) -> int:
+    return sum(abs(x[i] - x[i - 1]) for i in range(len(x)))
+
+
+def get_binary_ga(**params) -> BinaryGA:
+    return BinaryGA(num_generations=30, num_individ=30, gens=((-5, 5, 0.01),) * 3, obj_function=sphere, obj_value=0,
+                    early_stop=None, is_print=False, rnd_seed=7, **params)
+
+
+# iteration gives the same run as optimize(), one snapshot for every generation
+expected = get_binary_ga().optimize()
+binary_ga = get_binary_ga()
+snapshots = list(binary_ga.iterate())
+assert all(isinstance(snapshot, GaSnapshot) for snapshot in snapshots)
+assert [snapshot.idx_generation for snapshot in snapshots] == list(range(30))
+assert [snapshot.best_score for snapshot in snapshots] == list(expected.historical_best)
+assert binary_ga.ga_data.historical_best == expected.historical_best
+assert snapshots[-1].best_solution is binary_ga.ga_data.best_solution
+assert snapshots[-1].obj_calls == binary_ga.ga_data.obj_calls
+assert binary_ga.engine.stop_reason == 'num_generations'
+assert list(binary_ga.iterate()) == [] and binary_ga.step() is None
+
+# run is resumed after break of loop, with step() and after evaluation budget
+binary_ga = get_binary_ga()
+for snapshot in binary_ga.iterate():
+    if snapshot.idx_generation == 9:
+        break
+assert binary_ga.engine.stop_reason is None
+assert binary_ga.step().idx_generation == 10
+list(binary_ga.iterate(max_evaluations=binary_ga.ga_data.obj_calls + 50))
+assert binary_ga.engine.stop_reason == 'max_evaluations'
+assert binary_ga.ga_data.idx_generation < 30
+list(binary_ga.iterate())
+assert binary_ga.ga_data.historical_best == expected.historical_best
+assert binary_ga.ga_data.best_solution['genotype'] == expected.best_solution['genotype']
+
+# time budget is checked before every generation
+binary_ga = get_binary_ga()
+assert list(binary_ga.iterate(max_time=0)) == []
+assert binary_ga.engine.stop_reason == 'max_time'
+assert binary_ga.ga_data.idx_generation == 0
+
+# run is cancelled by hook and resumed
+binary_ga = get_binary_ga()
+binary_ga.init_ga_data()
+
+
+def cancel_hook(ga_data, stage) -> None:
+    if ga_data.idx_generation == 5:
+        binary_ga.cancel()
+
+
+binary_ga.engine.add_hook('update', cancel_hook)
+assert len(list(binary_ga.iterate())) == 5
+assert binary_ga.engine.stop_reason == 'cancel'
+binary_ga.engine.remove_hook('update', cancel_hook)
+list(binary_ga.iterate())
+assert binary_ga.ga_data.historical_best == expected.historical_best
+
+# early stopping criteria
+combinatory_ga = CombinatoryGA(num_generations=200, num_individ=20, gens=(0, 9, 10), obj_function=tour,
+                               early_stop=5, is_print=False, rnd_seed=3)
+expected = combinatory_ga.optimize()
+snapshots = list(combinatory_ga.iterate())
+assert combinatory_ga.engine.stop_reason == 'early_stop' and snapshots == []
+combinatory_ga.init_ga_data()
+snapshots = list(combinatory_ga.iterate())
+assert len(snapshots) == len(expected.historical_best) < 200
+assert snapshots[-1].num_generation_no_improve > 5
+
+# multi-objective runner
+vega = VEGA(num_generations=10, num_individ=20, gens=((-5, 5, 0.01),), obj_function=two_objectives,
+            is_print=False, early_stop=None, rnd_seed=1)
+snapshots = list(vega.iterate())
+assert len(snapshots) == 10 and all(individ['rank'] == 1 for individ in snapshots[-1].best_score)
+
+# collector requires population
+collector_ga = CollectorGA(fitness=HyperbolaFitness(obj_function=sphere, obj_value=0),
+                           selection=TournamentSelection(3), crossover=OnePointCrossover(),
+                           mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'))
+try:
+    collector_ga.step()
+    assert False
+except Exception as e:
+    assert 'set_population' in str(e)
+collector_ga.set_population(population=BinaryPopulation, num_individ=20, num_generations=10,
+                            gens=((-5, 5, 0.01),) * 2, early_stop=100, rnd_seed=2)
+assert collector_ga.step().idx_generation == 0
+assert len(list(collector_ga.iterate())) == 9
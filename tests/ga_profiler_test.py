@@ -0,0 +1,58 @@
+import os
+import tempfile
+from io import StringIO
+from contextlib import redirect_stdout
+from baumeva import BinaryGA, CollectorGA
+from baumeva.ga import (GaProfiler, BinaryPopulation, HyperbolaFitness, TournamentSelection, OnePointCrossover,
+                        BinStringMutation, NewGeneration, LRUCache)
+import baumeva
+
+
+def sum_of_squares(value_list):
+    return sum(value*value for value in value_list)
+
+
+# prebuilt GA: one row for every generation, objective calls and cache are counted
+baumeva.generator.rnd_seed = 21
+binary_ga = BinaryGA(num_generations=12, num_individ=20, gens=((-5, 5, 0.5), (-5, 5, 0.5)),
+                     obj_function=sum_of_squares, obj_value=0, early_stop=None, is_print=False, cache=LRUCache())
+GaProfiler().attach(binary_ga.engine)
+ga_data = binary_ga.optimize()
+table = ga_data.get_profile_table()
+assert len(table) == len(ga_data.historical_best) == 12
+assert [row['idx_generation'] for row in table] == list(range(12))
+assert sum(row['obj_calls'] for row in table) == ga_data.obj_calls == ga_data.cache_misses
+assert sum(row['cache_hits'] for row in table) == ga_data.cache_hits
+assert table[0]['obj_calls'] == 20 and table[0]['selection_time'] == 0
+assert all(row['time'] >= row['fitness_time'] + row['selection_time'] for row in table)
+assert 'memory' not in table[0]
+
+# without profiler nothing is stored
+baumeva.generator.rnd_seed = 21
+ga_data = BinaryGA(num_generations=12, num_individ=20, gens=((-5, 5, 0.5), (-5, 5, 0.5)), obj_function=sum_of_squares,
+                   obj_value=0, early_stop=None, is_print=False).optimize()
+assert ga_data.profile is None and ga_data.get_profile_table() == []
+assert ga_data.obj_calls == 20 + 11 * int(0.95 * 20)
+
+# CollectorGA with memory measurement, profile is saved to csv
+collector = CollectorGA(fitness=HyperbolaFitness(obj_function=sum_of_squares, obj_value=0),
+                        selection=TournamentSelection(3), crossover=OnePointCrossover(),
+                        mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'))
+baumeva.generator.rnd_seed = 21
+collector.set_population(population=BinaryPopulation, num_individ=200, num_generations=5,
+                         gens=((-5, 5, 0.01), ) * 10, early_stop=5)
+profiler = GaProfiler(is_memory=True)
+profiler.attach(collector.engine)
+with redirect_stdout(StringIO()):
+    collector.optimize()
+profiler.detach(collector.engine)
+assert collector.engine.hooks == {}
+table = collector.ga_data.get_profile_table()
+assert len(table) == 5
+assert all(row['memory'] >= row['crossover_memory'] > 0 for row in table[1:])
+with tempfile.TemporaryDirectory() as tmp_dir:
+    file_path = os.path.join(tmp_dir, 'profile.csv')
+    collector.ga_data.save_profile(file_path)
+    with open(file_path) as file:
+        lines = file.read().splitlines()
+assert len(lines) == 6 and lines[0].startswith('idx_generation,time,selection_time')
@@ -0,0 +1,57 @@
+from baumeva import IslandGA
+from baumeva.ga import (BinaryPopulation, HyperbolaFitness, TournamentSelection, OnePointCrossover,
+                        BinStringMutation, NewGeneration)
+
+
+def get_island_ga(num_migrants: int = 2, **kwargs) -> IslandGA:
+    island_ga = IslandGA(fitness=HyperbolaFitness(obj_function=sum, obj_value=0),
+                         selection=TournamentSelection(3), crossover=OnePointCrossover(),
+                         mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'),
+                         num_islands=3, migration_interval=4, num_migrants=num_migrants, is_print=False, **kwargs)
+    island_ga.set_population(population=BinaryPopulation, num_individ=20, num_generations=13,
+                             gens=((0, 100, 1), ) * 4, early_stop=20, rnd_seed=9)
+    return island_ga
+
+
+# islands in processes give the same results as islands in one process
+for topology in ('ring', 'random'):
+    island_ga = get_island_ga(topology=topology)
+    best_solution = island_ga.optimize()
+    serial_ga = get_island_ga(topology=topology, is_parallel=False)
+    assert serial_ga.optimize() == best_solution
+    assert [ga_data.historical_best for ga_data in island_ga.islands_data] ==\
+           [ga_data.historical_best for ga_data in serial_ga.islands_data]
+    assert len(island_ga.islands_data) == 3
+    assert all(len(ga_data.historical_best) == 13 for ga_data in island_ga.islands_data)
+    assert best_solution['score'] == max(ga_data.best_solution['score'] for ga_data in island_ga.islands_data)
+
+# islands have own seeds, migrants are copies of the best individuals of other island
+island_ga = get_island_ga(is_parallel=False)
+island_ga.optimize()
+assert island_ga.islands_data[0].historical_best[0] != island_ga.islands_data[1].historical_best[0]
+island = island_ga.islands[0]
+migrants = island.get_migrants()
+assert [migrant['score'] for migrant in migrants] == [individ['score'] for individ in island.ga_data.population[-2:]]
+assert all(migrant is not individ for migrant, individ in zip(migrants, island.ga_data.population[-2:]))
+assert island_ga.get_targets(None) == [1, 2, 0]
+
+# without migrations islands are independent runs
+single_ga = get_island_ga(num_migrants=0, is_parallel=False)
+single_ga.optimize()
+assert single_ga.islands_data[0].historical_best[:5] == island_ga.islands_data[0].historical_best[:5]
+assert single_ga.islands_data[0].historical_best != island_ga.islands_data[0].historical_best
+
+# islands in processes can have own process pool of fitness
+pool_ga = IslandGA(fitness=HyperbolaFitness(obj_function=sum, obj_value=0, workers=2),
+                   selection=TournamentSelection(3), crossover=OnePointCrossover(),
+                   mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'),
+                   num_islands=2, migration_interval=4, num_migrants=2, is_print=False)
+pool_ga.set_population(population=BinaryPopulation, num_individ=20, num_generations=9,
+                       gens=((0, 100, 1), ) * 4, early_stop=20, rnd_seed=9)
+serial_ga = IslandGA(fitness=HyperbolaFitness(obj_function=sum, obj_value=0),
+                     selection=TournamentSelection(3), crossover=OnePointCrossover(),
+                     mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'),
+                     num_islands=2, migration_interval=4, num_migrants=2, is_print=False, is_parallel=False)
+serial_ga.set_population(population=BinaryPopulation, num_individ=20, num_generations=9,
+                         gens=((0, 100, 1), ) * 4, early_stop=20, rnd_seed=9)
+assert pool_ga.optimize() == serial_ga.optimize()
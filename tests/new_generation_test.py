@@ -0,0 +1,86 @@
+import time
+from baumeva import BinaryGA, CombinatoryGA
+from baumeva.ga import GaData, BinaryPopulation, NewGeneration
+import baumeva
+
+
+def sum_of_squares(value_list):
+    return sum(value*value for value in value_list)
+
+
+def func_word(word: list) -> float:
+    return sum(1 for idx, litter in enumerate(word) if litter != idx)
+
+
+def get_ga_data(genotypes: list, children: list) -> GaData:
+    ga_data = GaData(num_generations=2)
+    population = BinaryPopulation()
+    population.set_params(num_individ=len(genotypes), gens=((0, 7, 1), ))
+    for idx, genotype in enumerate(genotypes):
+        population.append({'genotype': genotype, 'phenotype': None, 'score': idx, 'obj_score': None,
+                           'feasible': True, 'idx_individ': idx})
+    population.is_sorted = True
+    ga_data.population = population
+    ga_data.children = population.get_empty_copy()
+    for genotype in children:
+        ga_data.children.append({'genotype': genotype, 'phenotype': None, 'score': None, 'obj_score': None,
+                                 'feasible': None, 'idx_individ': None})
+    return ga_data
+
+
+def genotypes_of(population) -> list:
+    return [''.join(individ['genotype']) for individ in population]
+
+
+# elites are the best individuals with different genotypes, population is scanned from the best
+ga_data = get_ga_data([list('000'), list('001'), list('010'), list('011'), list('011'), list('011')],
+                      [list('111'), list('110'), list('101')])
+NewGeneration('best').execute(ga_data)
+assert genotypes_of(ga_data.population) == ['111', '110', '101', '000', '001', '010', '011']
+
+# in unique mode clones of offspring are rejected and elites do not repeat offspring
+ga_data = get_ga_data([list('000'), list('001'), list('010'), list('011'), list('100'), list('101')],
+                      [list('111'), list('111'), list('101')])
+NewGeneration('best', is_unique=True).execute(ga_data)
+assert genotypes_of(ga_data.population) == ['111', '101', '000', '001', '010', '011', '100']
+
+ga_data = get_ga_data([list('000'), list('001'), list('010'), list('011'), list('100'), list('101')],
+                      [list('111'), list('111'), list('101')])
+NewGeneration('random', is_unique=True).execute(ga_data)
+genotypes = genotypes_of(ga_data.population)
+assert len(genotypes) == 7 and len(set(genotypes)) == 7 and genotypes[-1] == '100'
+
+# elites of population with many clones are found fast
+ga_data = get_ga_data([list(format(i, '015b')) for i in range(15000)] + [list('1' * 15)] * 5000,
+                      [list('0' * 15)] * 10000)
+start = time.perf_counter()
+NewGeneration('best').execute(ga_data)
+assert time.perf_counter() - start < 5
+assert len(ga_data.population) == 20001
+assert len(set(genotypes_of(ga_data.population[10000:]))) == 10001
+
+# GA in unique mode has no duplicate genotypes in generations
+baumeva.generator.rnd_seed = 7
+ga_data = BinaryGA(num_generations=30, num_individ=30, gens=((-2, 2, 0.5), (-2, 2, 0.5)), obj_function=sum_of_squares,
+                   obj_value=0, early_stop=None, is_print=False, is_unique=True).optimize()
+assert not ga_data.population.is_duplicate()
+baumeva.generator.rnd_seed = 7
+ga_data = CombinatoryGA(num_generations=30, num_individ=30, gens=(0, 4, 5), obj_function=func_word, obj_value=0,
+                        early_stop=None, is_print=False, is_unique=True, transfer_parents='random').optimize()
+assert not ga_data.population.is_duplicate()
+
+
+def count_duplicates(ga_data: GaData, stage: str) -> None:
+    keys = set(ga_data.population.get_genotype_key(individ['genotype']) for individ in ga_data.population)
+    num_duplicates.append(len(ga_data.population) - len(keys))
+
+
+# every generation (the first one too) has no duplicate genotypes in unique mode, small search space (64 genotypes)
+for params in ({}, {'is_array': True}, {'is_packed': True}, {'transfer_parents': 'random'}):
+    num_duplicates = []
+    unique_ga = BinaryGA(num_generations=20, num_individ=60, gens=((0, 7, 1), (0, 7, 1)), obj_function=sum_of_squares,
+                         obj_value=0, children_percent=0.3, early_stop=None, is_print=False, is_unique=True,
+                         rnd_seed=1, **params)
+    unique_ga.engine.add_hook('fitness', count_duplicates)
+    unique_ga.optimize()
+    assert len(num_duplicates) == 20 and max(num_duplicates) == 0, (params, num_duplicates)
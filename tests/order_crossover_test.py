@@ -0,0 +1,82 @@
+from random import Random
+import numpy as np
+from baumeva import SeedSequence
+from baumeva.ga import (GaData, OrderCatPopulation, ArrayOrderCatPopulation, OrderCrossover, PMXCrossover,
+                        CycleCrossover)
+
+
+def quadratic_order_crossover(parent_1: list, parent_2: list, idx_start: int, idx_end: int) -> list:
+    right_side, left_side = len(parent_1) - idx_end, idx_start
+    segment = parent_1[idx_start:idx_end]
+    new_gens = [x for x in parent_2 if x not in segment]
+    return new_gens[right_side:right_side + left_side] + segment + new_gens[:right_side]
+
+
+def get_ga_data(population_class, gens: tuple, num_individ: int = 30):
+    population = population_class()
+    population.set_params(num_individ=num_individ, gens=gens)
+    population.set_seed(SeedSequence(1))
+    population.fill()
+    population.reset_idx_individ()
+    ga_data = GaData(num_generations=2)
+    ga_data.population = population
+    ga_data.parents = population.get_empty_copy()
+    ga_data.parents.extend(population)
+    return ga_data
+
+
+rnd = Random(0)
+pairs = [(rnd.sample(range(20), 20), rnd.sample(range(20), 20)) for _ in range(30)]
+pairs += [(rnd.sample(range(40), 12), rnd.sample(range(40), 12)) for _ in range(30)]
+
+# order crossover with set of segment gives the same children as search in list
+crossover = OrderCrossover()
+for parent_1, parent_2 in pairs:
+    crossover.len_individ = len(parent_1)
+    crossover.rnd = Random(len(parent_1))
+    idx_start, idx_end = crossover.get_idx_segment()
+    crossover.rnd = Random(len(parent_1))
+    child_1, child_2 = crossover.crossover(parent_1, parent_2, {}, {})
+    assert child_1['genotype'] == quadratic_order_crossover(parent_1, parent_2, idx_start, idx_end)
+    assert child_2['genotype'] == quadratic_order_crossover(parent_2, parent_1, idx_start, idx_end)
+    # batch crossover of matrix gives the same children
+    batch_children = OrderCrossover.batch_crossover(np.array([parent_1]), np.array([parent_2]),
+                                                    np.array([idx_start]), np.array([idx_end]))
+    assert batch_children.tolist() == [child_1['genotype']]
+
+# children of PMX and cycle crossover have no repeated gens and keep gens of parents
+for crossover in (PMXCrossover(), CycleCrossover()):
+    crossover.set_seed(SeedSequence(2))
+    for parent_1, parent_2 in pairs:
+        crossover.len_individ = len(parent_1)
+        for child in crossover.crossover(parent_1, parent_2, {}, {}):
+            genotype = child['genotype']
+            assert len(genotype) == len(parent_1) and len(set(genotype)) == len(genotype)
+            assert set(genotype) <= set(parent_1) | set(parent_2)
+            if set(parent_1) == set(parent_2):
+                assert set(genotype) == set(parent_1)
+
+# PMX keeps segment of donor and places of other gens if they are not repeated
+parent_1, parent_2 = [1, 2, 3, 4, 5, 6, 7, 8, 9], [9, 3, 7, 8, 2, 6, 5, 1, 4]
+assert PMXCrossover.get_child(parent_1, parent_2, 3, 7) == [9, 3, 2, 4, 5, 6, 7, 1, 8]
+
+# every gen of cycle crossover child keeps position of one of parents
+parent_1, parent_2 = [1, 2, 3, 4, 5, 6, 7, 8], [8, 5, 2, 1, 3, 6, 4, 7]
+assert CycleCrossover.get_cycles(parent_1, parent_2) == [[0, 7, 6, 3], [1, 4, 2], [5]]
+child_1, child_2 = CycleCrossover().crossover(parent_1, parent_2, {}, {})
+assert child_1['genotype'] == [1, 5, 2, 4, 3, 6, 7, 8] and child_2['genotype'] == [8, 2, 3, 1, 5, 6, 4, 7]
+
+# batch order crossover makes all children of generation
+for population_class, gens in ((OrderCatPopulation, (0, 49, 50)), (ArrayOrderCatPopulation, (0, 49, 50)),
+                               (OrderCatPopulation, (10, 99, 20))):
+    ga_data = get_ga_data(population_class, gens)
+    crossover = OrderCrossover(is_batch=True)
+    crossover.set_seed(SeedSequence(3))
+    crossover.execute(ga_data)
+    assert len(ga_data.children) == 15
+    for child in ga_data.children:
+        assert len(child['genotype']) == gens[2] and len(set(child['genotype'])) == gens[2]
+        assert set(child.keys()) == set(ga_data.population[0].keys()) and child['feasible'] is True
+    crossover.num_offsprings = 2
+    crossover.execute(ga_data)
+    assert len(ga_data.children) == 30
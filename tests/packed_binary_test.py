@@ -0,0 +1,96 @@
+from random import Random
+import sys
+from baumeva import BinaryGA, CategoricalGA
+from baumeva.ga import (DynamicPenalty, BinaryPopulation, BinaryGrayPopulation, PackedBinaryPopulation,
+                        PackedBinaryGrayPopulation,
+                        TwoPointCrossover, PackedTwoPointCrossover, PackedUniformCrossover)
+from baumeva import SeedSequence
+
+
+def sum_of_squares(value_list):
+    return sum(value*value for value in value_list)
+
+
+def parabola_conditions(x: list) -> tuple:
+    return -x[0]*x[0] + 9, -x[0]-3
+
+
+def run(**kwargs):
+    return BinaryGA(num_generations=30, num_individ=40, early_stop=None, is_print=False, rnd_seed=17,
+                    **kwargs).optimize()
+
+
+def get_params():
+    return ({'gens': ((-5, 5, 0.01), (-5, 5, 0.01)), 'obj_function': sum_of_squares, 'obj_value': 0},
+            {'gens': ((-5, 5, 0.01), (-5, 5, 0.01)), 'obj_function': sum_of_squares, 'obj_value': 0,
+             'is_gray': True, 'mutation_lvl': 0.05},
+            {'gens': ((-5, 5, 0.001),), 'obj_function': parabola_conditions, 'penalty': DynamicPenalty(),
+             'conditions': ['optimize', '<=']})
+
+
+# packed genotypes give the same run as lists of '0' and '1'
+for params, packed_params in zip(get_params(), get_params()):
+    data = run(**params)
+    packed_data = run(is_packed=True, **packed_params)
+    assert data.historical_best == packed_data.historical_best
+    assert data.best_solution['phenotype'] == packed_data.best_solution['phenotype']
+    assert int(''.join(data.best_solution['genotype']), 2) == packed_data.best_solution['genotype']
+
+# common options of runners are checked by BaseGA: packed genotypes are only binary, they can not be in array
+for ga_class, params in ((BinaryGA, {'is_packed': True, 'is_array': True}), (CategoricalGA, {'is_packed': True})):
+    try:
+        ga_class(num_generations=2, num_individ=4, gens=((0, 1, 1),), obj_function=sum_of_squares, **params)
+        assert False
+    except Exception as e:
+        assert 'packed' in str(e).lower()
+binary_ga = BinaryGA(num_generations=2, num_individ=4, gens=((0, 1, 1),), obj_function=sum_of_squares, is_packed=True,
+                     history_size=5, workers=None)
+assert binary_ga.is_packed and binary_ga.history_size == 5 and binary_ga.engine is not None
+
+# coding and decoding of packed genotypes
+def get_population(population_class):
+    population = population_class()
+    population.set_params(num_individ=10, gens=((-1, 1, 0.01), (0, 10, 1), (5, 6, 0.5)),
+                          input_population=[[-1, 3, 5.5], [1, 10, 6]])
+    population.set_seed(SeedSequence(3))
+    population.fill()
+    return population
+
+
+for population_class, packed_population_class in ((BinaryPopulation, PackedBinaryPopulation),
+                                                  (BinaryGrayPopulation, PackedBinaryGrayPopulation)):
+    population = get_population(population_class)
+    packed_population = get_population(packed_population_class)
+    for individ, packed_individ in zip(population, packed_population):
+        assert individ['phenotype'] == packed_individ['phenotype']
+        assert ''.join(individ['genotype']) == packed_population.get_bin_string(packed_individ['genotype'])
+    assert not packed_population.is_duplicate(packed_population[:2])
+    assert packed_population.is_duplicate(packed_population[:2] * 2)
+
+# bit masks give the same children as slices of lists
+population = BinaryPopulation()
+population.set_params(num_individ=2, gens=((0, 1000, 1), (0, 1000, 1)))
+population.fill()
+parent_1, parent_2 = population[0]['genotype'], population[1]['genotype']
+num_bits = population.idx_bits[-1]
+for _ in range(20):
+    cross, packed_cross = TwoPointCrossover(), PackedTwoPointCrossover()
+    cross.len_individ = packed_cross.len_individ = num_bits
+    cross.rnd, packed_cross.rnd = Random(_), Random(_)
+    children = cross.crossover(parent_1, parent_2, {}, {})
+    packed_children = packed_cross.crossover(int(''.join(parent_1), 2), int(''.join(parent_2), 2), {}, {})
+    for child, packed_child in zip(children, packed_children):
+        assert int(''.join(child['genotype']), 2) == packed_child['genotype']
+
+uniform_cross = PackedUniformCrossover()
+uniform_cross.len_individ = num_bits
+packed_1, packed_2 = int(''.join(parent_1), 2), int(''.join(parent_2), 2)
+child, _ = uniform_cross.crossover(packed_1, packed_2, {}, {})
+assert (child['genotype'] ^ packed_1) & (child['genotype'] ^ packed_2) == 0
+
+# packed genotype of 10000 bits is much smaller than list of strings
+population = PackedBinaryPopulation()
+population.set_params(num_individ=1, gens=((0, 1023, 1), ) * 1000)
+population.fill()
+assert sys.getsizeof(population[0]['genotype']) * 50 < sys.getsizeof(list(population.get_bin_string(
+    population[0]['genotype'])))
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+from baumeva import BinaryGA, CombinatoryGA
+from baumeva.ga import DynamicPenalty
+import baumeva
+import math
+
+
+def func_grivanka(value_list):
+    res_sum = 0
+    res_mpl = 1
+    for i, value in enumerate(value_list):
+        res_sum += (value*value) / 4000
+        res_mpl *= math.cos(value/math.sqrt(i+1))
+    return res_sum - res_mpl + 1
+
+
+def func_word(word: list) -> float:
+    res = 0
+    for idx, litter in enumerate(word):
+        if litter != idx:
+            res += 1
+    return res
+
+
+def run_binary(obj_function, conditions=None, **kwargs):
+    baumeva.generator.rnd_seed = 7
+    return BinaryGA(num_generations=30, num_individ=50, gens=((-16, 16, 0.01), (-16, 16, 0.01)),
+                    obj_function=obj_function, conditions=list(conditions) if conditions else None, is_gray=True,
+                    mutation_lvl=0.35, early_stop=None, is_print=False, **kwargs).optimize()
+
+
+def run_combinatory(**kwargs):
+    baumeva.generator.rnd_seed = 7
+    return CombinatoryGA(num_generations=30, num_individ=50, gens=(0, 9, 10), obj_function=func_word, obj_value=0,
+                         early_stop=None, is_print=False, **kwargs).optimize()
+
+
+# worker processes import objective function by name, functions of this module are not importable while the module
+# is collected, so builtins are used as objective functions for process pool
+for params in ({'obj_function': sum, 'obj_value': 0},
+               {'obj_function': tuple, 'penalty': DynamicPenalty(), 'conditions': ('optimize', '<=')}):
+    serial = run_binary(**params)
+    parallel = run_binary(workers=2, **params)
+    assert serial.historical_best == parallel.historical_best
+    assert serial.best_solution == parallel.best_solution
+
+for run, params in ((run_binary, {'obj_function': func_grivanka, 'obj_value': 0}), (run_combinatory, {})):
+    serial = run(**params)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = run(executor=executor, **params)
+    assert serial.historical_best == threaded.historical_best
+    assert serial.best_solution == threaded.best_solution
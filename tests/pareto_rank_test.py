@@ -0,0 +1,50 @@
+from random import randint, seed
+from baumeva import FFGA
+from baumeva.ga import FFGAFitness
+import baumeva
+
+
+def brute_counts(scores: list) -> list:
+    return [sum(1 for other in scores if other != score and all(o <= s for o, s in zip(other, score)))
+            for score in scores]
+
+
+num_calls = 0
+
+
+def two_objectives(x: list) -> tuple:
+    global num_calls
+    num_calls += 1
+    return (x[0]-2)**2 + (x[1]-2)**2, x[0]*x[0] + x[1]*x[1]
+
+
+def three_objectives(input_data: float, x: list) -> tuple:
+    return (x[0] - input_data)**2, x[1]**2, (x[0] + x[1])**2
+
+
+# numbers of dominating individuals are the same as by definition, for any number of objectives and with ties
+seed(1)
+for num_objectives in (1, 2, 3):
+    for _ in range(50):
+        scores = [tuple(randint(0, 6) for _ in range(num_objectives)) for _ in range(randint(1, 40))]
+        assert FFGAFitness.count_dominating(scores) == brute_counts(scores)
+        if num_objectives == 2:
+            assert FFGAFitness.count_dominating_2d(scores) == brute_counts(scores)
+
+# inferior compares objective scores
+assert FFGAFitness.inferior({'obj_score': [1, 2]}, {'obj_score': [1, 3]})['obj_score'] == [1, 3]
+assert FFGAFitness.inferior({'obj_score': [1, 2]}, {'obj_score': [2, 1]}) is None
+
+# objective function is called only for evaluated individuals, ranks do not call it again
+num_calls = 0
+baumeva.generator.rnd_seed = 3
+ga_data = FFGA(num_generations=10, num_individ=30, gens=((0, 4, 0.01), (0, 4, 0.01)), obj_function=two_objectives,
+               early_stop=None, is_print=False).optimize()
+assert num_calls < 30 * 10
+assert all(individ['rank'] == 1 for individ in ga_data.best_solution['pareto_set'])
+
+# objective function with input data works for multiobjective GA
+baumeva.generator.rnd_seed = 3
+ga_data = FFGA(num_generations=5, num_individ=20, gens=((0, 4, 0.01), (0, 4, 0.01)), obj_function=three_objectives,
+               input_data=1.5, early_stop=None, is_print=False).optimize()
+assert len(ga_data.best_solution['pareto_set']) > 0
@@ -0,0 +1,79 @@
+import os
+import tempfile
+from functools import partial
+from baumeva import BinaryGA
+from baumeva.ga import SQLiteCache
+import baumeva
+
+num_calls = 0
+
+
+def sum_of_squares(value_list):
+    global num_calls
+    num_calls += 1
+    return sum(value*value for value in value_list)
+
+
+def shifted_squares(shift, value_list):
+    global num_calls
+    num_calls += 1
+    return sum((value - shift)**2 for value in value_list)
+
+
+def run(cache, obj_function=sum_of_squares, input_data=None):
+    global num_calls
+    num_calls = 0
+    baumeva.generator.rnd_seed = 5
+    ga_data = BinaryGA(num_generations=30, num_individ=30, gens=((-2, 2, 0.01), (-2, 2, 0.01)),
+                       obj_function=obj_function, obj_value=0, input_data=input_data, early_stop=None,
+                       is_print=False, cache=cache).optimize()
+    return ga_data, num_calls
+
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    path = os.path.join(tmp_dir, 'evaluations.db')
+
+    first_cache = SQLiteCache(path)
+    first_data, first_calls = run(first_cache)
+    first_cache.close()
+    assert first_calls == first_data.cache_misses == len(SQLiteCache(path)) > 0
+
+    # the same experiment in a new process reuses all evaluations
+    second_cache = SQLiteCache(path)
+    second_data, second_calls = run(second_cache)
+    second_cache.close()
+    assert second_calls == second_data.cache_misses == 0
+    assert first_data.historical_best == second_data.historical_best
+
+    # other objective function or other input data is another namespace
+    for input_data, is_evaluated in ((1, True), (2, True), (1, False)):
+        other_cache = SQLiteCache(path)
+        other_data, other_calls = run(other_cache, obj_function=shifted_squares, input_data=input_data)
+        other_cache.close()
+        assert other_calls == other_data.cache_misses
+        assert (other_calls > 0) == is_evaluated
+
+    # changed constant, argument of partial or version of objective function is another namespace
+    def scaled_squares(value_list):
+        global num_calls
+        num_calls += 1
+        return sum(2 * value * value for value in value_list)
+
+    first_cache = SQLiteCache(path)
+    run(first_cache, obj_function=scaled_squares)
+    first_cache.close()
+
+    def scaled_squares(value_list):
+        global num_calls
+        num_calls += 1
+        return sum(3 * value * value for value in value_list)
+
+    for obj_function, version, is_evaluated in ((scaled_squares, None, True), (scaled_squares, None, False),
+                                                (scaled_squares, 'v2', True),
+                                                (partial(shifted_squares, 1), None, True),
+                                                (partial(shifted_squares, 2), None, True),
+                                                (partial(shifted_squares, 1), None, False)):
+        other_cache = SQLiteCache(path, version=version)
+        other_data, other_calls = run(other_cache, obj_function=obj_function)
+        other_cache.close()
+        assert (other_calls > 0) == is_evaluated
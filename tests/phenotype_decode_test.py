@@ -0,0 +1,43 @@
+from baumeva.ga import (BinaryPopulation, BinaryGrayPopulation, ArrayBinaryPopulation, ArrayBinaryGrayPopulation,
+                        PackedBinaryPopulation, PackedBinaryGrayPopulation)
+import baumeva
+
+gens = ((-16, 16, 0.001), (0, 1, 0.5), (-3, 7, 1e-9), (5, 6, 0.1))
+
+
+def decode_by_gens(population, genotype, is_gray):
+    phenotype = []
+    genotype_str = ''.join(genotype)
+    for gen_idx, gen in enumerate(population.gens):
+        index_point = int(genotype_str[population.idx_bits[gen_idx]:population.idx_bits[gen_idx + 1]], 2)
+        if is_gray:
+            index_point = BinaryGrayPopulation.get_index_from_gray(index_point)
+        phenotype.append(gen[0] + index_point * population.real_step[gen_idx])
+    return phenotype
+
+
+def get_population(population_class):
+    baumeva.generator.rnd_seed = 19
+    population = population_class()
+    population.set_params(num_individ=300, gens=gens)
+    population.fill()
+    return population
+
+
+# decoding of all gens at once gives the same phenotypes as decoding of every gen separately
+for population_class, array_class, packed_class, is_gray in (
+        (BinaryPopulation, ArrayBinaryPopulation, PackedBinaryPopulation, False),
+        (BinaryGrayPopulation, ArrayBinaryGrayPopulation, PackedBinaryGrayPopulation, True)):
+    population = get_population(population_class)
+    array_population = get_population(array_class)
+    packed_population = get_population(packed_class)
+    for individ, array_individ, packed_individ in zip(population, array_population, packed_population):
+        assert individ['phenotype'] == decode_by_gens(population, individ['genotype'], is_gray)
+        assert individ['phenotype'] == array_individ['phenotype'] == packed_individ['phenotype']
+
+    # only new individuals are decoded
+    array_population[0]['phenotype'] = [0, 0, 0, 0]
+    array_population[1]['phenotype'] = None
+    array_population.get_phenotype()
+    assert array_population[0]['phenotype'] == [0, 0, 0, 0]
+    assert array_population[1]['phenotype'] == population[1]['phenotype']
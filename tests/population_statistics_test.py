@@ -0,0 +1,48 @@
+import math
+from baumeva.ga import BinaryPopulation, ArrayBinaryPopulation
+
+
+def get_population(population_class, scores: list):
+    population = population_class()
+    population.set_params(num_individ=len(scores), gens=((0, 7, 1), ))
+    for idx, score in enumerate(scores):
+        population.append({'genotype': list(format(idx % 5, '03b')), 'phenotype': None, 'score': score,
+                           'obj_score': None, 'feasible': idx % 3 != 0, 'idx_individ': idx})
+    return population
+
+
+scores = [0.5, 2.0, -1.0, 2.0, 0.25, 7.0, 7.0, 3.0, -1.0, 0.5, 1.5]
+for population_class in (BinaryPopulation, ArrayBinaryPopulation):
+    # statistics are the same as statistics of sorted population, population is not sorted
+    population = get_population(population_class, scores)
+    statistics = population.get_statistics(is_diversity=True)
+    sorted_population = get_population(population_class, scores)
+    sorted_population.sort_by_dict()
+    assert not population.is_sorted
+    assert statistics['idx_best'] == 6
+    assert population[statistics['idx_best']]['idx_individ'] == sorted_population[-1]['idx_individ']
+    assert statistics['best'] == sorted_population[-1]['score'] == 7.0
+    assert statistics['worst'] == sorted_population[0]['score'] == -1.0
+    assert statistics['median'] == sorted_population[int(len(scores) / 2)]['score']
+    assert math.isclose(statistics['mean'], sum(scores) / len(scores))
+    mean = sum(scores) / len(scores)
+    assert math.isclose(statistics['std'], math.sqrt(sum((score - mean) ** 2 for score in scores) / len(scores)))
+    assert statistics['feasible_ratio'] == 7 / 11
+    assert statistics['diversity'] == 5 / 11
+
+    # top indices are in order of reversed sorted population
+    expected = [individ['idx_individ'] for individ in reversed(sorted_population)]
+    for num in (1, 3, 4, len(scores)):
+        assert population.get_top_idx(num) == expected[:num]
+
+    # median is the score in the middle of sorted population for odd and even sizes
+    for num_ind in (1, 2, 9, 10, 51, 64):
+        median_scores = [float((idx * 7919) % 13) for idx in range(num_ind)]
+        population = get_population(population_class, median_scores)
+        statistics = population.get_statistics()
+        population.sort_by_dict()
+        assert statistics['median'] == population[int(num_ind / 2)]['score']
+        assert statistics['worst'] == population[0]['score'] and statistics['best'] == population[-1]['score']
+        mean = sum(median_scores) / num_ind
+        std = math.sqrt(sum((score - mean) ** 2 for score in median_scores) / num_ind)
+        assert math.isclose(statistics['std'], std, abs_tol=1e-12)
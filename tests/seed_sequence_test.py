@@ -0,0 +1,34 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from baumeva import BinaryGA, SeedSequence
+
+
+def run(rnd_seed):
+    return BinaryGA(num_generations=20, num_individ=30, gens=((0, 100, 1), ) * 4, obj_function=sum, obj_value=0,
+                    early_stop=None, is_print=False, rnd_seed=rnd_seed).optimize().historical_best
+
+
+# seed sequence gives the same generators for the same entropy and spawn key
+root, same_root = SeedSequence(42), SeedSequence(42)
+children = root.spawn(3)
+assert [child.spawn_key for child in children] == [(0, ), (1, ), (2, )]
+assert root.spawn(1)[0].spawn_key == (3, )
+assert [child.get_random().random() for child in children] ==\
+       [child.get_random().random() for child in same_root.spawn(3)]
+assert len({child.generate_seed() for child in children + [root] + children[0].spawn(2)}) == 6
+assert SeedSequence().entropy != SeedSequence().entropy
+
+# runs with the same seed are reproducible and do not change module random
+random.seed(7)
+state = random.getstate()
+history = run(3)
+assert random.getstate() == state
+assert run(3) == history
+assert run(4) != history
+assert run(SeedSequence(3)) == history
+
+# runs in threads give the same results as serial runs
+seeds = list(range(8))
+serial_histories = [run(rnd_seed) for rnd_seed in seeds]
+with ThreadPoolExecutor(max_workers=4) as executor:
+    assert list(executor.map(run, seeds)) == serial_histories
@@ -0,0 +1,48 @@
+from copy import deepcopy
+import tracemalloc
+from baumeva.ga import GaData, BinaryPopulation, TournamentSelection, BalancedSelection, OnePointCrossover, \
+    BinStringMutation
+import baumeva
+
+
+def get_ga_data():
+    baumeva.generator.rnd_seed = 3
+    ga_data = GaData(num_generations=2, children_percent=0.95)
+    population = BinaryPopulation()
+    population.set_params(num_individ=2000, gens=((0, 1023, 1), ) * 20)
+    population.fill()
+    for idx, individ in enumerate(population):
+        individ['score'] = idx / len(population)
+        individ['obj_score'] = [idx, len(population) - idx]
+    ga_data.population = population
+    return ga_data
+
+
+# parents are references to individuals of population
+for selection in (TournamentSelection(), BalancedSelection()):
+    ga_data = get_ga_data()
+    ids = set(id(individ) for individ in ga_data.population)
+    selection.execute(ga_data)
+    assert len(ga_data.parents) > 0
+    assert all(id(parent) in ids for parent in ga_data.parents)
+
+# crossover and mutation do not change genotypes of population
+ga_data = get_ga_data()
+genotypes = deepcopy([individ['genotype'] for individ in ga_data.population])
+TournamentSelection().execute(ga_data)
+OnePointCrossover().execute(ga_data)
+BinStringMutation(mutation_lvl='strong').execute(ga_data)
+assert [individ['genotype'] for individ in ga_data.population] == genotypes
+
+# memory of selection is much less than memory of population
+ga_data = get_ga_data()
+tracemalloc.start()
+population = deepcopy(ga_data.population)
+population_memory = tracemalloc.get_traced_memory()[0]
+del population
+tracemalloc.reset_peak()
+start_memory = tracemalloc.get_traced_memory()[0]
+TournamentSelection().execute(ga_data)
+selection_memory = tracemalloc.get_traced_memory()[1] - start_memory
+tracemalloc.stop()
+assert selection_memory * 10 < population_memory
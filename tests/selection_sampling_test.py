@@ -0,0 +1,57 @@
+from collections import Counter
+from math import floor, ceil
+from random import random
+import time
+from baumeva.ga import GaData, BinaryPopulation, BalancedSelection, RankedSelection, StochasticUniversalSelection
+import baumeva
+
+
+def get_ga_data(num_individ: int, scores: list = None):
+    baumeva.generator.rnd_seed = 5
+    ga_data = GaData(num_generations=2, children_percent=0.95)
+    population = BinaryPopulation()
+    population.set_params(num_individ=num_individ, gens=((0, 15, 1), ))
+    population.fill()
+    for idx, individ in enumerate(population):
+        individ['score'] = scores[idx] if scores is not None else random()
+    population.sort_by_dict()
+    ga_data.population = population
+    return ga_data
+
+
+# index is found by bisection of cumulative probabilities
+selection = BalancedSelection()
+selection.add_probabilities(get_ga_data(4, [1, 1, 2, 4]))
+assert selection.selection_scores == [0, 0.125, 0.25, 0.5, 1.0]
+counter = Counter(selection.get_index() for _ in range(20000))
+assert sorted(counter) == [0, 1, 2, 3]
+assert counter[3] > counter[2] > counter[1]
+
+# ranks of equal scores are averaged
+assert RankedSelection.get_ranks([1, 2, 2, 3, 5, 5, 5]) == [1, 2.5, 2.5, 4, 6, 6, 6]
+assert RankedSelection.get_ranks([1, 1]) == [1.5, 1.5]
+assert RankedSelection.get_ranks([]) == []
+ga_data = get_ga_data(6, [0.1, 0.2, 0.2, 0.3, 0.3, 0.3])
+RankedSelection().execute(ga_data)
+assert [individ['rank'] for individ in ga_data.population] == [1, 2.5, 2.5, 5, 5, 5]
+
+# stochastic universal sampling selects every individual close to expected number of times
+scores = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+ga_data = get_ga_data(10, scores)
+selection = StochasticUniversalSelection()
+selection.execute(ga_data)
+assert len(ga_data.parents) == 2 * int(0.95 * 10)
+for i in range(0, len(ga_data.parents), 2):
+    assert ga_data.parents[i]['idx_individ'] != ga_data.parents[i + 1]['idx_individ']
+counter = Counter(parent['idx_individ'] for parent in ga_data.parents)
+for individ in ga_data.population:
+    expected = len(ga_data.parents) * individ['score'] / sum(scores)
+    assert floor(expected) - 1 <= counter[individ['idx_individ']] <= ceil(expected) + 1
+
+# selection of large population is fast
+for selection in (BalancedSelection(), RankedSelection(), StochasticUniversalSelection()):
+    ga_data = get_ga_data(20000)
+    start = time.perf_counter()
+    selection.execute(ga_data)
+    assert time.perf_counter() - start < 5
+    assert len(ga_data.parents) == 2 * int(0.95 * 20000)
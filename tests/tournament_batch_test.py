@@ -0,0 +1,78 @@
+from collections import Counter
+from io import StringIO
+from contextlib import redirect_stdout
+import numpy as np
+from baumeva import CollectorGA, SeedSequence
+from baumeva.ga import (GaData, MultiGaData, BinaryPopulation, ArrayBinaryPopulation, HyperbolaFitness,
+                        VEGAHyperbolaFitness, TournamentSelection, VEGATournamentSelection, OnePointCrossover,
+                        BinStringMutation, NewGeneration)
+
+
+def two_objectives(x: list) -> tuple:
+    return (x[0]-2)**2 + (x[1]-2)**2, x[0]*x[0] + x[1]*x[1]
+
+
+def get_ga_data(population_class, num_individ: int = 50, storage=GaData, fitness=None):
+    population = population_class()
+    population.set_params(num_individ=num_individ, gens=((0, 10, 0.01), (0, 10, 0.01)))
+    population.set_seed(SeedSequence(1))
+    population.fill()
+    ga_data = storage(num_generations=2)
+    ga_data.population = population
+    fitness = fitness if fitness is not None else HyperbolaFitness(obj_function=sum, obj_value=0)
+    fitness.execute(ga_data)
+    return ga_data
+
+
+def select(selection, ga_data, rnd_seed: int = 2):
+    selection.set_seed(SeedSequence(rnd_seed))
+    selection.execute(ga_data)
+    return [parent['idx_individ'] for parent in ga_data.parents]
+
+
+# every winner is the best participant of its tournament, participants are not repeated
+selection = TournamentSelection(tournament_size=4, is_batch=True)
+scores = np.random.default_rng(0).random(30)
+for size in (4, 6):
+    selection.tournament_size = size
+    tournaments = selection.get_tournaments(np.random.default_rng(1), 500, len(scores))
+    assert tournaments.shape == (500, size)
+    assert all(len(set(row)) == size for row in tournaments.tolist())
+    winners = selection.get_winners(np.random.default_rng(1), scores, 500)
+    assert winners.tolist() == [max(row, key=lambda idx: scores[idx]) for row in tournaments.tolist()]
+
+# batch tournament selects the same number of parents, parents in pair are different
+for population_class in (BinaryPopulation, ArrayBinaryPopulation):
+    ga_data = get_ga_data(population_class)
+    parents = select(TournamentSelection(3, is_batch=True), ga_data)
+    assert len(parents) == 2 * int(ga_data.children_percent * 50)
+    assert all(parents[i] != parents[i + 1] for i in range(0, len(parents), 2))
+    assert parents == select(TournamentSelection(3, is_batch=True), get_ga_data(BinaryPopulation))
+    assert all(dict(parent) == dict(ga_data.population[parent['idx_individ']]) for parent in ga_data.parents)
+
+# better individuals win more tournaments
+counter = Counter()
+ga_data = get_ga_data(BinaryPopulation)
+for rnd_seed in range(20):
+    counter.update(select(TournamentSelection(3, is_batch=True), ga_data, rnd_seed))
+ga_data.population.sort_by_dict()
+assert counter[ga_data.population[-1]['idx_individ']] > counter[ga_data.population[0]['idx_individ']]
+
+# VEGA tournaments select parents by every objective
+for population_class in (BinaryPopulation, ArrayBinaryPopulation):
+    ga_data = get_ga_data(population_class, storage=MultiGaData,
+                          fitness=VEGAHyperbolaFitness(obj_function=two_objectives, obj_value=[0, 0]))
+    parents = select(VEGATournamentSelection(2, is_batch=True), ga_data)
+    loop_parents = select(VEGATournamentSelection(2), ga_data)
+    assert len(parents) == len(loop_parents) == 2 * 2 * int(ga_data.children_percent * 50 / 2)
+    assert all(parents[i] != parents[i + 1] for i in range(0, len(parents), 2))
+
+# batch tournament in GA
+collector = CollectorGA(fitness=HyperbolaFitness(obj_function=sum, obj_value=0),
+                        selection=TournamentSelection(3, is_batch=True), crossover=OnePointCrossover(),
+                        mutation=BinStringMutation(0.15), new_generation=NewGeneration('best'))
+collector.set_population(population=ArrayBinaryPopulation, num_individ=40, num_generations=20,
+                         gens=((0, 100, 1), ) * 3, early_stop=20, rnd_seed=3)
+with redirect_stdout(StringIO()):
+    collector.optimize()
+assert collector.ga_data.historical_best[-1] > collector.ga_data.historical_best[0]